@@ -249,6 +249,7 @@ class ManimConfig(MutableMapping):
         "format",
         "flush_cache",
         "frame_height",
+        "frame_jobs",
         "frame_rate",
         "frame_width",
         "frame_x_radius",
@@ -256,10 +257,13 @@ class ManimConfig(MutableMapping):
         "from_animation_number",
         "images_dir",
         "input_file",
+        "jobs",
+        "layer_cache_size",
         "media_width",
         "webgl_renderer_path",
         "log_dir",
         "log_to_file",
+        "max_cache_size",
         "max_files_cached",
         "media_dir",
         "movie_file_extension",
@@ -269,6 +273,7 @@ class ManimConfig(MutableMapping):
         "pixel_height",
         "pixel_width",
         "plugins",
+        "prefetch",
         "preview",
         "progress_bar",
         "save_as_gif",
@@ -517,6 +522,7 @@ class ManimConfig(MutableMapping):
             "save_pngs",
             "save_as_gif",
             "preview",
+            "prefetch",
             "show_in_file_browser",
             "log_to_file",
             "disable_caching",
@@ -537,6 +543,10 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "max_cache_size",
+            "jobs",
+            "frame_jobs",
+            "layer_cache_size",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
@@ -675,6 +685,9 @@ class ManimConfig(MutableMapping):
             "fullscreen",
             "use_projection_fill_shaders",
             "use_projection_stroke_shaders",
+            "jobs",
+            "frame_jobs",
+            "prefetch",
         ]:
             if hasattr(args, key):
                 attr = getattr(args, key)
@@ -1014,6 +1027,44 @@ class ManimConfig(MutableMapping):
         doc="Maximum number of files cached.  Use -1 for infinity (no flag).",
     )
 
+    max_cache_size = property(
+        lambda self: self._d["max_cache_size"],
+        lambda self, val: self._set_pos_number("max_cache_size", val, True),
+        doc="Maximum total size of the files cached, in megabytes.  Use -1 for "
+        "infinity (no flag).",
+    )
+
+    layer_cache_size = property(
+        lambda self: self._d["layer_cache_size"],
+        lambda self, val: self._set_pos_number("layer_cache_size", val, True),
+        doc="Maximum total size of the mobjects kept rasterized by the Cairo "
+        "camera, in megabytes.  Use 0 (the default) to disable it and -1 for "
+        "infinity (no flag).",
+    )
+
+    jobs = property(
+        lambda self: self._d["jobs"],
+        lambda self, val: self._set_pos_number("jobs", val, False),
+        doc="Number of worker processes used to render the scenes of a file.  "
+        "Use 0 to use one process per CPU core (-j).",
+    )
+
+    frame_jobs = property(
+        lambda self: self._d["frame_jobs"],
+        lambda self, val: self._set_pos_number("frame_jobs", val, False),
+        doc="Number of worker processes rasterizing the frames of a single "
+        "animation with the Cairo renderer.  Use 0 to use one process per CPU "
+        "core, 1 disables it (--frame_jobs).",
+    )
+
+    prefetch = property(
+        lambda self: self._d["prefetch"],
+        lambda self, val: self._set_boolean("prefetch", val),
+        doc="Whether to construct the scenes once without rendering them, to "
+        "compile all their tex expressions and texts in parallel beforehand "
+        "(--prefetch).",
+    )
+
     window_monitor = property(
         lambda self: self._d["window_monitor"],
         lambda self, val: self._set_pos_number("window_monitor", val, True),
@@ -25,8 +25,18 @@ __all__ = [
 ]
 
 import inspect
+import itertools as it
 import types
-from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import numpy as np
 
@@ -35,13 +45,140 @@ from ..animation.animation import Animation
 from ..constants import DEFAULT_POINTWISE_FUNCTION_RUN_TIME, DEGREES, OUT
 from ..mobject.mobject import Group, Mobject
 from ..mobject.opengl_mobject import OpenGLGroup, OpenGLMobject
-from ..utils.paths import path_along_arc
+from ..mobject.types.vectorized_mobject import VMobject
+from ..utils.paths import path_along_arc, straight_path
 from ..utils.rate_functions import smooth, squish_rate_func
 
 if TYPE_CHECKING:
     from ..scene.scene import Scene
 
 
+class _PackedInterpolation:
+    """Interpolation of all the members of the families of a :class:`Transform` at once.
+
+    The aligned points and style attributes of the members are packed into
+    contiguous arrays, and the members of the animated mobject are given views
+    into the array of interpolated values.  Every frame then costs a few NumPy
+    operations for the whole family, instead of the calls of
+    :meth:`.Mobject.interpolate` and :meth:`.VMobject.interpolate_color` for
+    each member.
+
+    Parameters
+    ----------
+    mobjects
+        The members with points of the animated mobject.
+    starting_mobjects
+        The corresponding members of the starting mobject.
+    target_mobjects
+        The corresponding members of the (aligned) target mobject.
+
+    Raises
+    ------
+    ValueError
+        If the attributes of corresponding members are not aligned.
+    """
+
+    # The attributes interpolated by Mobject.interpolate and
+    # VMobject.interpolate_color.
+    attrs = (
+        "points",
+        "fill_rgbas",
+        "stroke_rgbas",
+        "background_stroke_rgbas",
+        "stroke_width",
+        "background_stroke_width",
+        "sheen_direction",
+        "sheen_factor",
+    )
+
+    def __init__(
+        self,
+        mobjects: List[Mobject],
+        starting_mobjects: List[Mobject],
+        target_mobjects: List[Mobject],
+    ) -> None:
+        self.mobjects = mobjects
+        # Packed arrays of the attributes that are arrays, with the member
+        # each of their elements belongs to.
+        self.arrays = []
+        # Attributes that are numbers, set again on every frame.
+        self.scalars = []
+        self.views = [[] for _ in mobjects]
+        self.points = []
+        for attr in self.attrs:
+            values, starts, ends = (
+                [np.asarray(getattr(mob, attr), dtype=float) for mob in mobs]
+                for mobs in (mobjects, starting_mobjects, target_mobjects)
+            )
+            shapes = [value.shape for value in values]
+            if any(
+                start.shape != shape or end.shape != shape
+                for start, end, shape in zip(starts, ends, shapes)
+            ):
+                raise ValueError(f"{attr} is not aligned")
+            if not any(shapes):
+                self.scalars.append((attr, np.array(starts), np.array(ends)))
+                continue
+            if not all(shapes):
+                raise ValueError(f"{attr} is not an array for all the members")
+            sizes = [value.size for value in values]
+            rows = np.repeat(np.arange(len(mobjects)), sizes)
+            start, end, out = (
+                np.concatenate([value.ravel() for value in arrays])
+                for arrays in (starts, ends, values)
+            )
+            self.arrays.append((attr, start, end, out, rows))
+            offsets = np.cumsum([0, *sizes])
+            for i, shape in enumerate(shapes):
+                window = slice(offsets[i], offsets[i + 1])
+                view = out[window].reshape(shape)
+                self.views[i].append((attr, view))
+                if attr == "points":
+                    self.points.append(
+                        (start[window].reshape(shape), end[window].reshape(shape), view)
+                    )
+
+    def interpolate(
+        self, alphas: Union[float, np.ndarray], path_func: Callable
+    ) -> None:
+        """Interpolate all the members.
+
+        Parameters
+        ----------
+        alphas
+            The alpha of all the members, or an array with the alpha of each
+            member.
+        path_func
+            The path of the points.  Except for :func:`~.straight_path`, it is
+            applied to the points of each member separately.
+        """
+        uniform = np.ndim(alphas) == 0
+        for attr, start, end, out, rows in self.arrays:
+            if attr == "points" and path_func is not straight_path:
+                member_alphas = it.repeat(alphas) if uniform else alphas
+                for (start_points, end_points, points), alpha in zip(
+                    self.points, member_alphas
+                ):
+                    points[:] = path_func(start_points, end_points, alpha)
+                continue
+            element_alphas = alphas if uniform else alphas[rows]
+            np.multiply(start, 1 - element_alphas, out=out)
+            out += element_alphas * end
+        names = [attr for attr, _, _ in self.scalars]
+        values = [
+            ((1 - alphas) * start + alphas * end).tolist()
+            for _, start, end in self.scalars
+        ]
+        for mob, views, *scalars in zip(self.mobjects, self.views, *values):
+            attributes = mob.__dict__
+            for attr, view in views:
+                # Put back the views that were replaced during the animation.
+                if attributes.get(attr) is not view:
+                    setattr(mob, attr, view)
+            attributes.update(zip(names, scalars))
+            attributes["_content_hash"] = None
+
+
 class Transform(Animation):
     def __init__(
         self,
@@ -142,6 +279,73 @@ class Transform(Animation):
         submobject.interpolate(starting_submobject, target_copy, alpha, self.path_func)
         return self
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        interpolation = self.get_packed_interpolation()
+        if interpolation is None:
+            super().interpolate_mobject(alpha)
+            return
+        num_submobjects = len(interpolation.mobjects)
+        if self.lag_ratio == 0:
+            alphas = self.get_sub_alpha(alpha, 0, num_submobjects)
+        else:
+            alphas = np.array(
+                [
+                    self.get_sub_alpha(alpha, i, num_submobjects)
+                    for i in range(num_submobjects)
+                ]
+            )
+        interpolation.interpolate(alphas, self.path_func)
+
+    def get_packed_interpolation(self) -> Optional[_PackedInterpolation]:
+        """Return the interpolation of all the families at once, if possible.
+
+        It is only used for families of :class:`~.VMobject` interpolated
+        exactly like :meth:`interpolate_submobject` would, with the Cairo
+        renderer.  It is built again when the families change.
+
+        Returns
+        -------
+        Optional[:class:`_PackedInterpolation`]
+            The interpolation, or ``None`` to interpolate the members one by
+            one.
+        """
+        cls = type(self)
+        if (
+            config.renderer == "opengl"
+            or cls.get_all_families_zipped is not Transform.get_all_families_zipped
+            or cls.interpolate_submobject is not Transform.interpolate_submobject
+            or cls.get_sub_alpha is not Animation.get_sub_alpha
+            or not hasattr(self, "target_copy")
+        ):
+            return None
+        families = [
+            mob.family_members_with_points()
+            for mob in (self.mobject, self.starting_mobject, self.target_copy)
+        ]
+        packed = getattr(self, "packed_interpolation", None)
+        if packed is not None and packed[0] == families:
+            return packed[1]
+        interpolation = None
+        if (
+            families[0]
+            and len(set(map(len, families))) == 1
+            and all(
+                type(mob).interpolate is Mobject.interpolate
+                and type(mob).interpolate_color is VMobject.interpolate_color
+                for family in families
+                for mob in family
+            )
+            # The starting and target mobjects are only packed once.
+            and not self.starting_mobject.get_family_updaters()
+            and not self.target_copy.get_family_updaters()
+        ):
+            try:
+                interpolation = _PackedInterpolation(*families)
+            except ValueError:
+                pass
+        self.packed_interpolation = (families, interpolation)
+        return interpolation
+
 
 class ReplacementTransform(Transform):
     """Replaces and morphs a mobject into a target mobject.
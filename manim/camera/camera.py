@@ -1,20 +1,21 @@
 """A camera converts the mobjects contained in a Scene into an array of pixels."""
 
 
-__all__ = ["Camera", "BackgroundColoredVMobjectDisplayer"]
+__all__ = ["Camera", "CameraLayer", "BackgroundColoredVMobjectDisplayer"]
 
 import copy
+import hashlib
 import itertools as it
 import operator as op
 import pathlib
 import time
+from collections import OrderedDict
 from functools import reduce
 from typing import Union
 
 import cairo
 import numpy as np
 from PIL import Image
-from scipy.spatial.distance import pdist
 
 from .. import config, logger
 from ..constants import *
@@ -27,7 +28,6 @@ from ..utils.family import extract_mobject_family_members
 from ..utils.images import get_full_raster_image_path
 from ..utils.iterables import list_difference_update
 from ..utils.simple_functions import fdiv
-from ..utils.space_ops import angle_of_vector
 
 
 class Camera:
@@ -114,6 +114,17 @@ class Camera:
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
 
+        # Rasterized mobjects, least recently used first, see get_layer.
+        self.layers = OrderedDict()
+        self.layers_size = 0
+        # For every root mobject captured, its content key, the key of its layer
+        # and its shape, in the current and in the previous capture.
+        self.layer_keys = {}
+        self.previous_layer_keys = {}
+        # Ids of the mobjects which change at every frame, see
+        # set_animated_mobjects.
+        self.animated_mobject_ids = set()
+
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
         # this dict (or an instance of a class that inherits from a class in
@@ -484,10 +495,304 @@ class Camera:
         # VMobject], [PMobject, PMobject], and [VMobject].  This must be done
         # without altering their order.  it.groupby computes exactly this
         # partition while at the same time preserving order.
-        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        #
+        # Mobjects whose content did not change since the previous capture are
+        # rasterized to layers instead, see get_layer.
+        to_display = self.get_mobjects_to_display(mobjects, **kwargs)
+        self.previous_layer_keys, self.layer_keys = self.layer_keys, {}
+        pending = []
+        for root, members in self.get_layer_roots(mobjects, to_display):
+            layer = None if root is None else self.get_layer(root, members)
+            if layer is None:
+                pending += members
+                continue
+            self.display_mobjects(pending)
+            pending = []
+            self.display_layer(*layer)
+        self.display_mobjects(pending)
+
+    def display_mobjects(self, mobjects):
+        """Displays mobjects in :attr:`pixel_array`, in the given order.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects to display, without their submobjects.
+        """
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
             self.display_funcs[group_type](list(group), self.pixel_array)
 
+    # Methods associated with layers
+
+    def get_layer_camera_key(self):
+        """Returns what the pixels of a mobject depend on, besides the mobject
+        itself, or None if mobjects cannot be rasterized to layers.
+
+        Returns
+        -------
+        Optional[tuple]
+            The frame and pixel shapes.
+        """
+        if config["layer_cache_size"] == 0:
+            return None
+        return (
+            tuple(self.frame_center),
+            self.frame_width,
+            self.frame_height,
+            self.pixel_width,
+            self.pixel_height,
+            self.cairo_line_width_multiple,
+        )
+
+    def set_animated_mobjects(self, mobjects):
+        """Sets the mobjects which change at every frame, like the mobjects
+        animated or with updaters, whose families are never rasterized to
+        layers.  This spares computing their content hashes at every frame.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects, with their submobjects.
+        """
+        self.animated_mobject_ids = {
+            id(submob) for mob in mobjects for submob in mob.get_family()
+        }
+
+    def get_layer_roots(self, mobjects, to_display):
+        """Splits the mobjects to display into the families of the mobjects
+        captured, which can be rasterized to layers.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects captured.
+        to_display : List[:class:`~.Mobject`]
+            The mobjects to display, see :meth:`get_mobjects_to_display`.
+
+        Returns
+        -------
+        List[Tuple[Optional[:class:`~.Mobject`], List[:class:`~.Mobject`]]]
+            The root mobjects with their family members to display, in order,
+            with no root for the families containing animated mobjects, see
+            :meth:`set_animated_mobjects`.  When the mobjects to display are
+            not the families of the roots one after the other, for instance
+            when some are sorted by z-index, a single pair with no root.
+        """
+        if self.get_layer_camera_key() is None or not to_display:
+            return [(None, to_display)]
+        descendants = {
+            id(submob) for mob in mobjects for submob in mob.get_family()[1:]
+        }
+        roots = []
+        root_ids = set()
+        for mob in mobjects:
+            if id(mob) not in descendants and id(mob) not in root_ids:
+                roots.append(mob)
+                root_ids.add(id(mob))
+        families = [root.family_members_with_points() for root in roots]
+        if [id(mob) for family in families for mob in family] != [
+            id(mob) for mob in to_display
+        ]:
+            return [(None, to_display)]
+        layer_roots = []
+        for root, family in zip(roots, families):
+            if any(id(mob) in self.animated_mobject_ids for mob in root.get_family()):
+                root = None
+            layer_roots.append((root, family))
+        return layer_roots
+
+    def get_layer(self, root, members):
+        """Returns the layer a mobject is displayed from, if any.
+
+        A mobject is rasterized to a layer, an offscreen surface, when its
+        content hash did not change since the previous capture, or when it was
+        only translated.  Its layer is then composited as long as its content
+        hash does not change, or when it is only translated by a whole number
+        of pixels, which keeps its pixels the same as rasterizing it again.
+        Composited layers are not exactly the same as drawing the mobject
+        directly though, see :meth:`display_layer`, so layers are only used
+        when ``config.layer_cache_size`` is set, to a number of megabytes.
+        Layers are evicted, least recently used first, when they take more
+        than that.
+
+        Parameters
+        ----------
+        root : :class:`~.Mobject`
+            The mobject.
+        members : List[:class:`~.Mobject`]
+            The family members of the mobject to display.
+
+        Returns
+        -------
+        Optional[Tuple[:class:`CameraLayer`, :class:`int`, :class:`int`]]
+            The layer and the pixel coordinates of its upper left corner, or
+            None if the mobject should be displayed directly.
+        """
+        camera_key = self.get_layer_camera_key()
+        if not all(
+            isinstance(mob, VMobject) and not mob.get_background_image()
+            for mob in members
+        ):
+            return None
+        key = (root.get_content_hash(), camera_key)
+        layer = self.layers.get(key)
+        if layer is not None:
+            self.layers.move_to_end(key)
+            self.layer_keys[id(root)] = (key, key, layer.shape)
+            return layer, layer.x, layer.y
+
+        shape, reference = self.get_layer_shape(members)
+        previous = self.previous_layer_keys.get(id(root), (None, None, None))
+        previous_key, previous_layer_key, previous_shape = previous
+        # Pure translation by a whole number of pixels.
+        layer = self.layers.get(previous_layer_key)
+        if (
+            layer is not None
+            and layer.shape is not None
+            and layer.shape == shape
+            and previous_layer_key[1] == camera_key
+        ):
+            offset = np.round(reference - layer.reference)
+            x, y = layer.x + int(offset[0]), layer.y + int(offset[1])
+            if (
+                np.all(np.abs(reference - layer.reference - offset) < 1 / 1024)
+                and 0 <= x <= self.pixel_width - layer.width
+                and 0 <= y <= self.pixel_height - layer.height
+            ):
+                self.layers.move_to_end(previous_layer_key)
+                self.layer_keys[id(root)] = (key, previous_layer_key, shape)
+                return layer, x, y
+
+        # Only rasterize mobjects which were unchanged, or only translated,
+        # since the previous capture, and are likely to be again.
+        self.layer_keys[id(root)] = (key, None, shape)
+        if key != previous_key and (shape is None or shape != previous_shape):
+            return None
+        layer = self.rasterize_layer(members)
+        if layer is None:
+            return None
+        layer.shape, layer.reference = shape, reference
+        if layer.clipped:
+            layer.shape = None
+        self.layers[key] = layer
+        self.layers_size += layer.pixel_array.nbytes
+        max_size = config["layer_cache_size"] * 1024 ** 2
+        while self.layers_size > max_size:
+            _, evicted = self.layers.popitem(last=False)
+            self.layers_size -= evicted.pixel_array.nbytes
+        if key not in self.layers:
+            return None
+        self.layer_keys[id(root)] = (key, key, shape)
+        return layer, layer.x, layer.y
+
+    def get_layer_shape(self, members):
+        """Returns what the pixels of VMobjects depend on, up to a translation.
+
+        Parameters
+        ----------
+        members : List[:class:`~.VMobject`]
+            The VMobjects.
+
+        Returns
+        -------
+        Tuple[Optional[:class:`bytes`], np.ndarray]
+            A digest of their styles and of their points relative to their
+            first point, or None if they have gradients, and the pixel
+            coordinates of their first point.
+        """
+        scale = np.array(
+            [
+                self.pixel_width / self.frame_width,
+                -self.pixel_height / self.frame_height,
+            ]
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        reference = None
+        for mob in members:
+            style = self.get_vectorized_style(mob)
+            if style is None:
+                return None, None
+            points = self.transform_points_pre_display(mob, mob.points)[:, :2] * scale
+            if reference is None:
+                reference = points[0]
+            digest.update(
+                repr((style, mob.tolerance_for_point_equality, len(points))).encode()
+            )
+            # Up to 1/1024 of a pixel.
+            digest.update(np.round((points - reference) * 1024).astype(np.int64))
+        return digest.digest(), reference
+
+    def rasterize_layer(self, members):
+        """Rasterizes VMobjects to a new layer.
+
+        Parameters
+        ----------
+        members : List[:class:`~.VMobject`]
+            The VMobjects.
+
+        Returns
+        -------
+        Optional[:class:`CameraLayer`]
+            The layer, or None if the VMobjects are out of the frame.
+        """
+        matrix = self.get_cairo_matrix()
+        pixel_points = []
+        margin = 0
+        for mob in members:
+            points = self.transform_points_pre_display(mob, mob.points)
+            if len(points):
+                pixel_points.append(points[:, :2])
+            margin = max(margin, mob.get_stroke_width(True), mob.get_stroke_width())
+        if not pixel_points:
+            return None
+        pixel_points = np.concatenate(pixel_points) * [matrix.xx, matrix.yy] + [
+            matrix.x0,
+            matrix.y0,
+        ]
+        # Miter joins can extend up to 10 half line widths beyond the points,
+        # and antialiasing up to one pixel.
+        margin = 1 + 10 * margin * self.cairo_line_width_multiple / 2 * matrix.xx
+        x0, y0 = np.floor(pixel_points.min(axis=0) - margin).astype(int)
+        x1, y1 = np.ceil(pixel_points.max(axis=0) + margin).astype(int)
+        clipped = x0 < 0 or y0 < 0 or x1 > self.pixel_width or y1 > self.pixel_height
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.pixel_width), min(y1, self.pixel_height)
+        if x1 <= x0 or y1 <= y0:
+            return None
+
+        layer = CameraLayer(x0, y0, x1 - x0, y1 - y0)
+        layer.clipped = clipped
+        ctx = cairo.Context(layer.surface)
+        matrix.translate(-x0 / matrix.xx, -y0 / matrix.yy)
+        ctx.set_matrix(matrix)
+        self.display_vectorized_mobjects(members, ctx)
+        layer.surface.flush()
+        return layer
+
+    def display_layer(self, layer, x, y):
+        """Composites a layer in :attr:`pixel_array`.
+
+        The mobjects of a layer are blended into a transparent surface, which
+        is then blended into the frame, while mobjects drawn directly are
+        blended into the frame once.  As cairo rounds every blend to 8-bit
+        premultiplied channels, composited pixels can differ from the pixels
+        of the mobjects drawn directly by up to 2 (out of 255) in each
+        channel, where the mobjects are translucent or antialiased.
+
+        Parameters
+        ----------
+        layer : :class:`CameraLayer`
+            The layer.
+        x, y : :class:`int`
+            The pixel coordinates of its upper left corner.
+        """
+        ctx = self.get_cairo_context(self.pixel_array)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(layer.surface, x, y)
+        ctx.paint()
+        ctx.restore()
+
     # Methods associated with svg rendering
 
     # NOTE: None of the methods below have been mentioned outside of their definitions. Their DocStrings are not as
@@ -542,27 +847,38 @@ class Camera:
             return cached_ctx
         pw = self.pixel_width
         ph = self.pixel_height
-        fw = self.frame_width
-        fh = self.frame_height
-        fc = self.frame_center
         surface = cairo.ImageSurface.create_for_data(
             pixel_array, cairo.FORMAT_ARGB32, pw, ph
         )
         ctx = cairo.Context(surface)
         ctx.scale(pw, ph)
-        ctx.set_matrix(
-            cairo.Matrix(
-                fdiv(pw, fw),
-                0,
-                0,
-                -fdiv(ph, fh),
-                (pw / 2) - fc[0] * fdiv(pw, fw),
-                (ph / 2) + fc[1] * fdiv(ph, fh),
-            )
-        )
+        ctx.set_matrix(self.get_cairo_matrix())
         self.cache_cairo_context(pixel_array, ctx)
         return ctx
 
+    def get_cairo_matrix(self):
+        """Returns the matrix transforming points of the frame to pixel
+        coordinates.
+
+        Returns
+        -------
+        cairo.Matrix
+            The matrix.
+        """
+        pw = self.pixel_width
+        ph = self.pixel_height
+        fw = self.frame_width
+        fh = self.frame_height
+        fc = self.frame_center
+        return cairo.Matrix(
+            fdiv(pw, fw),
+            0,
+            0,
+            -fdiv(ph, fh),
+            (pw / 2) - fc[0] * fdiv(pw, fw),
+            (ph / 2) + fc[1] * fdiv(ph, fh),
+        )
+
     def display_multiple_vectorized_mobjects(self, vmobjects, pixel_array):
         """Displays multiple VMobjects in the pixel_array
 
@@ -596,8 +912,124 @@ class Camera:
             The Pixel array to add the VMobjects to.
         """
         ctx = self.get_cairo_context(pixel_array)
-        for vmobject in vmobjects:
-            self.display_vectorized(vmobject, ctx)
+        self.display_vectorized_mobjects(vmobjects, ctx)
+
+    def display_vectorized_mobjects(self, vmobjects, ctx):
+        """Displays multiple VMobjects without background colors in the
+        cairo context, batched by :meth:`get_vectorized_batches`.
+
+        Parameters
+        ----------
+        vmobjects : list
+            list of the VMobjects
+        ctx : cairo.Context
+            The cairo context to use.
+        """
+        for batch in self.get_vectorized_batches(vmobjects):
+            if len(batch) == 1:
+                self.display_vectorized(batch[0][0], ctx)
+            else:
+                self.display_vectorized_batch(batch, ctx)
+
+    def get_vectorized_style(self, vmobject):
+        """Returns what the stroke, fill and background stroke of a VMobject
+        are drawn with, or None if they have gradients.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+
+        Returns
+        -------
+        Optional[tuple]
+            The width and color of the background stroke and of the stroke, and
+            the color of the fill.
+        """
+        style = []
+        for background in (True, False):
+            width = vmobject.get_stroke_width(background)
+            if width == 0:
+                style.append(None)
+                continue
+            rgbas = self.get_stroke_rgbas(vmobject, background=background)
+            if len(rgbas) > 1:
+                return None
+            style.append((width, *rgbas[0]))
+        rgbas = self.get_fill_rgbas(vmobject)
+        if len(rgbas) > 1:
+            return None
+        style.append(tuple(rgbas[0]))
+        return tuple(style)
+
+    def get_vectorized_batches(self, vmobjects):
+        """Splits VMobjects into batches which can be drawn at once.
+
+        Consecutive VMobjects are drawn at once when they have the same
+        style, without gradients, and their bounding boxes, stroke and
+        antialiasing included, do not overlap: drawing them at once then
+        gives the same pixels as drawing them one after the other.
+
+        Parameters
+        ----------
+        vmobjects : list
+            list of the VMobjects, in the order they are drawn
+
+        Yields
+        ------
+        List[Tuple[VMobject, np.ndarray]]
+            The VMobjects of a batch, with their points to display.
+        """
+        batch = []
+        batch_style = None
+        batch_start = 0
+        boxes = np.empty((len(vmobjects), 4))
+        # Miter joins can extend up to 10 half line widths beyond the points.
+        miter_extent = 10 * self.cairo_line_width_multiple / 2
+        pixel_size = max(
+            self.frame_width / self.pixel_width, self.frame_height / self.pixel_height
+        )
+        for i, vmobject in enumerate(vmobjects):
+            points = self.transform_points_pre_display(vmobject, vmobject.points)
+            style = self.get_vectorized_style(vmobject)
+            if (
+                style is None
+                or len(points) == 0
+                or len(points) % vmobject.n_points_per_cubic_curve
+            ):
+                # Drawn on its own, as display_vectorized would.
+                if batch:
+                    yield batch
+                yield [(vmobject, points)]
+                batch = []
+                continue
+
+            margin = pixel_size + miter_extent * max(
+                vmobject.get_stroke_width(True), vmobject.get_stroke_width()
+            )
+            box = boxes[i]
+            box[:2] = points[:, :2].min(axis=0) - margin
+            box[2:] = points[:, :2].max(axis=0) + margin
+            others = boxes[batch_start:i]
+            if (
+                batch
+                and style == batch_style
+                and not np.any(
+                    (others[:, 0] < box[2])
+                    & (box[0] < others[:, 2])
+                    & (others[:, 1] < box[3])
+                    & (box[1] < others[:, 3])
+                )
+            ):
+                batch.append((vmobject, points))
+                continue
+            if batch:
+                yield batch
+            batch = [(vmobject, points)]
+            batch_style = style
+            batch_start = i
+        if batch:
+            yield batch
 
     def display_vectorized(self, vmobject, ctx):
         """Displays a VMobject in the cairo context
@@ -654,6 +1086,67 @@ class Camera:
                 ctx.close_path()
         return self
 
+    def display_vectorized_batch(self, batch, ctx):
+        """Displays VMobjects with the same style at once in the cairo context
+
+        Parameters
+        ----------
+        batch : List[Tuple[VMobject, np.ndarray]]
+            The VMobjects, with their points to display, see
+            :meth:`get_vectorized_batches`.
+        ctx : cairo.Context
+            The cairo context to use.
+
+        Returns
+        -------
+        Camera
+            The camera object
+        """
+        nppcc = batch[0][0].n_points_per_cubic_curve
+        curves = np.concatenate(
+            [points[:, :2].reshape((-1, nppcc, 2)) for _, points in batch]
+        )
+        num_curves = [len(points) // nppcc for _, points in batch]
+        # Subpaths start with every VMobject, and with every curve not starting
+        # where the previous one ends, see VMobject.consider_points_equals_2d.
+        atol = np.repeat(
+            [vmobject.tolerance_for_point_equality for vmobject, _ in batch],
+            num_curves,
+        )[:, np.newaxis]
+        starts = np.ones(len(curves), dtype=bool)
+        starts[1:] = np.any(
+            np.abs(curves[1:, 0] - curves[:-1, -1])
+            > atol[1:] + 1e-5 * np.abs(curves[1:, 0]),
+            axis=1,
+        )
+        starts[np.cumsum(num_curves) - num_curves] = True
+        ends = np.roll(starts, -1)
+        subpath_starts = np.maximum.accumulate(
+            np.where(starts, np.arange(len(curves)), 0)
+        )
+        first_points = curves[subpath_starts, 0]
+        closes = ends & np.all(
+            np.abs(first_points - curves[:, -1]) <= atol + 1e-5 * np.abs(curves[:, -1]),
+            axis=1,
+        )
+
+        ctx.new_path()
+        for curve, start, close in zip(
+            curves.tolist(), starts.tolist(), closes.tolist()
+        ):
+            if start:
+                ctx.new_sub_path()
+                ctx.move_to(*curve[0])
+            ctx.curve_to(*curve[1], *curve[2], *curve[3])
+            if close:
+                ctx.close_path()
+
+        vmobject = batch[0][0]
+        self.apply_stroke(ctx, vmobject, background=True)
+        self.apply_fill(ctx, vmobject)
+        self.apply_stroke(ctx, vmobject)
+        return self
+
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
         """Sets the color of the cairo context
 
@@ -893,6 +1386,11 @@ class Camera:
     def display_image_mobject(self, image_mobject: AbstractImageMobject, pixel_array):
         """Displays an ImageMobject by changing the pixel_array suitably.
 
+        Images whose edges stay along the axes of the frame are resized with
+        their resampling algorithm. Other images are mapped onto the
+        parallelogram spanned by their corners with an affine transform, which
+        accounts for rotations, reflections and shears.
+
         Parameters
         ----------
         image_mobject : ImageMobject
@@ -904,44 +1402,73 @@ class Camera:
         ul_coords, ur_coords, dl_coords = corner_coords
         right_vect = ur_coords - ul_coords
         down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
 
-        sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
+        if right_vect[1] == down_vect[0] == 0 and min(right_vect[0], down_vect[1]) >= 0:
+            self.display_resized_image_mobject(
+                image_mobject, pixel_array, ul_coords, right_vect, down_vect
+            )
+            return
 
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=image_mobject.resampling_algorithm
-        )
+        transform = np.array([right_vect, down_vect], dtype=float).T
+        if np.linalg.det(transform) == 0:
+            return
+        corners = np.array([ul_coords, ur_coords, dl_coords, ur_coords + down_vect])
+        x0, y0 = np.maximum(corners.min(axis=0), 0).tolist()
+        x1, y1 = np.minimum(
+            corners.max(axis=0), (self.pixel_width, self.pixel_height)
+        ).tolist()
+        if x0 >= x1 or y0 >= y1:
+            return
 
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=image_mobject.resampling_algorithm, expand=1
-            )
+        # Images drawn much smaller than their resolution are sampled from a
+        # reduced copy, since the affine transform does not filter them.
+        height, width = image_mobject.get_pixel_array().shape[:2]
+        image = image_mobject.get_mipmap(
+            max(np.linalg.norm(right_vect) / width, np.linalg.norm(down_vect) / height)
+        )
+        # Map the pixels of the bounding box back to the image.
+        inverse = np.diag(image.size) @ np.linalg.inv(transform)
+        offset = inverse @ (np.array([x0, y0]) - ul_coords)
+        resampling_algorithm = image_mobject.resampling_algorithm
+        if resampling_algorithm not in (Image.NEAREST, Image.BILINEAR, Image.BICUBIC):
+            # The only filters supported by affine transforms.
+            resampling_algorithm = Image.BICUBIC
+        sub_image = image.transform(
+            (x1 - x0, y1 - y0),
+            Image.AFFINE,
+            (*inverse[0], offset[0], *inverse[1], offset[1]),
+            resample=resampling_algorithm,
+        )
+        self.overlay_PIL_image(pixel_array, sub_image, (x0, y0))
 
-        # TODO, there is no accounting for a shear...
+    def display_resized_image_mobject(
+        self, image_mobject, pixel_array, ul_coords, right_vect, down_vect
+    ):
+        """Displays an ImageMobject whose edges are along the axes of the
+        frame by resizing it.
 
-        # Paste into an image as large as the camera's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.pixel_height, self.pixel_width)), mode="RGBA"
+        Parameters
+        ----------
+        image_mobject : ImageMobject
+            The ImageMobject to display
+        pixel_array : np.ndarray
+            The Pixel array to put the ImageMobject in.
+        ul_coords : np.ndarray
+            The pixel coordinates of the upper left corner of the image.
+        right_vect : np.ndarray
+            The vector from the upper left to the upper right corner.
+        down_vect : np.ndarray
+            The vector from the upper left to the lower left corner.
+        """
+        center_coords = ul_coords + (right_vect + down_vect) / 2
+        sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
+        pixel_width = max(int(right_vect[0]), 1)
+        pixel_height = max(int(down_vect[1]), 1)
+        sub_image = sub_image.resize(
+            (pixel_width, pixel_height), resample=image_mobject.resampling_algorithm
         )
         new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
-        )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        self.overlay_PIL_image(pixel_array, sub_image, new_ul_coords.astype(int))
 
     def overlay_rgba_array(self, pixel_array, new_array):
         """Overlays an RGBA array on top of the given Pixel array.
@@ -955,18 +1482,34 @@ class Camera:
         """
         self.overlay_PIL_image(pixel_array, self.get_image(new_array))
 
-    def overlay_PIL_image(self, pixel_array, image):
+    def overlay_PIL_image(self, pixel_array, image, coords=(0, 0)):
         """Overlays a PIL image on the passed pixel array.
 
+        Only the pixels covered by the image are blended, in place.
+
         Parameters
         ----------
         pixel_array : np.ndarray
             The Pixel array
         image : PIL.Image
             The Image to overlay.
+        coords : Tuple[int, int], optional
+            The pixel coordinates of the upper left corner of the image, by
+            default (0, 0). The parts of the image outside the pixel array
+            are left out.
         """
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(self.get_image(pixel_array), image), dtype="uint8"
+        x, y = coords
+        width, height = image.size
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + width, pixel_array.shape[1])
+        y1 = min(y + height, pixel_array.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        if (x0, y0, x1, y1) != (x, y, x + width, y + height):
+            image = image.crop((x0 - x, y0 - y, x1 - x, y1 - y))
+        region = pixel_array[y0:y1, x0:x1]
+        region[:, :] = np.array(
+            Image.alpha_composite(self.get_image(region), image), dtype="uint8"
         )
 
     def adjust_out_of_range_points(self, points):
@@ -1147,6 +1690,43 @@ class Camera:
 
 # NOTE: The methods of the following class have not been mentioned outside of their definitions.
 # Their DocStrings are not as detailed as preferred.
+class CameraLayer:
+    """Mobjects rasterized by a :class:`Camera`, to be composited in later
+    frames.
+
+    Parameters
+    ----------
+    x, y : :class:`int`
+        The pixel coordinates of the upper left corner of the layer.
+    width, height : :class:`int`
+        The size of the layer, in pixels.
+
+    Attributes
+    ----------
+    shape : Optional[:class:`bytes`]
+        The digest of the mobjects up to a translation, see
+        :meth:`Camera.get_layer_shape`, or None if the layer cannot be
+        translated.
+    reference : np.ndarray
+        The pixel coordinates of the first point of the mobjects.
+    clipped : :class:`bool`
+        Whether the mobjects extend beyond the frame.
+    """
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.pixel_array = np.zeros((height, width, 4), dtype="uint8")
+        self.surface = cairo.ImageSurface.create_for_data(
+            self.pixel_array, cairo.FORMAT_ARGB32, width, height
+        )
+        self.shape = None
+        self.reference = None
+        self.clipped = False
+
+
 class BackgroundColoredVMobjectDisplayer:
     def __init__(self, camera):
         """
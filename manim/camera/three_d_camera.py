@@ -3,20 +3,17 @@
 __all__ = ["ThreeDCamera"]
 
 
+import itertools as it
+
 import numpy as np
 
 from .. import config
 from ..camera.camera import Camera
 from ..constants import *
-from ..mobject.three_d_utils import (
-    get_3d_vmob_end_corner,
-    get_3d_vmob_end_corner_unit_normal,
-    get_3d_vmob_start_corner,
-    get_3d_vmob_start_corner_unit_normal,
-)
+from ..mobject.three_d_utils import get_3d_vmobs_corners_and_unit_normals
 from ..mobject.types.point_cloud_mobject import Point
+from ..mobject.types.vectorized_mobject import VMobject
 from ..mobject.value_tracker import ValueTracker
-from ..utils.color import get_shaded_rgb
 from ..utils.family import extract_mobject_family_members
 from ..utils.space_ops import rotation_about_z, rotation_matrix
 
@@ -63,6 +60,7 @@ class ThreeDCamera(Camera):
         self.gamma_tracker = ValueTracker(self.gamma)
         self.fixed_orientation_mobjects = {}
         self.fixed_in_frame_mobjects = set()
+        self.shading_factors = None
         self.reset_rotation_matrix()
 
     @property
@@ -75,7 +73,12 @@ class ThreeDCamera(Camera):
 
     def capture_mobjects(self, mobjects, **kwargs):
         self.reset_rotation_matrix()
-        Camera.capture_mobjects(self, mobjects, **kwargs)
+        # Filled in by get_mobjects_to_display, for the current frame only.
+        self.shading_factors = {}
+        try:
+            Camera.capture_mobjects(self, mobjects, **kwargs)
+        finally:
+            self.shading_factors = None
 
     def get_value_trackers(self):
         """Returns list of ValueTrackers of phi, theta, distance and gamma
@@ -96,26 +99,42 @@ class ThreeDCamera(Camera):
         if not self.should_apply_shading:
             return rgbas
         if vmobject.shade_in_3d and (vmobject.get_num_points() > 0):
-            light_source_point = self.light_source.points[0]
+            if self.shading_factors and vmobject in self.shading_factors:
+                factors = self.shading_factors[vmobject]
+            else:
+                factors = self.get_shading_factors([vmobject])[0]
             if len(rgbas) < 2:
                 shaded_rgbas = rgbas.repeat(2, axis=0)
             else:
                 shaded_rgbas = np.array(rgbas[:2])
-            shaded_rgbas[0, :3] = get_shaded_rgb(
-                shaded_rgbas[0, :3],
-                get_3d_vmob_start_corner(vmobject),
-                get_3d_vmob_start_corner_unit_normal(vmobject),
-                light_source_point,
-            )
-            shaded_rgbas[1, :3] = get_shaded_rgb(
-                shaded_rgbas[1, :3],
-                get_3d_vmob_end_corner(vmobject),
-                get_3d_vmob_end_corner_unit_normal(vmobject),
-                light_source_point,
-            )
+            shaded_rgbas[:, :3] += factors[:, np.newaxis]
             return shaded_rgbas
         return rgbas
 
+    def get_shading_factors(self, vmobjects):
+        """Computes how much the colors at the start and end corners of
+        VMobjects are shifted by the light source, for all of them at once.
+
+        Parameters
+        ----------
+        vmobjects : List[VMobject]
+            The VMobjects to shade, which must have points.
+
+        Returns
+        -------
+        np.ndarray
+            The shading factors of the start and end corners of each
+            VMobject, with shape ``(len(vmobjects), 2)``. See
+            :func:`~.get_shaded_rgb`.
+        """
+        corners, unit_normals = get_3d_vmobs_corners_and_unit_normals(vmobjects)
+        to_sun = self.light_source.points[0] - corners
+        norms = np.linalg.norm(to_sun, axis=-1)[..., np.newaxis]
+        to_sun /= np.where(norms > 0, norms, 1)
+        factors = 0.5 * np.sum(unit_normals * to_sun, axis=-1) ** 3
+        factors[factors < 0] *= 0.5
+        return factors
+
     def get_stroke_rgbas(
         self, vmobject, background=False
     ):  # NOTE : DocStrings From parent
@@ -126,16 +145,85 @@ class ThreeDCamera(Camera):
 
     def get_mobjects_to_display(self, *args, **kwargs):  # NOTE : DocStrings From parent
         mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
-        rot_matrix = self.get_rotation_matrix()
+        is_shaded = np.array(
+            [bool(getattr(mob, "shade_in_3d", False)) for mob in mobjects]
+        )
+        if not np.any(is_shaded):
+            return mobjects
+        shaded = list(it.compress(mobjects, is_shaded))
+
+        # Assign a number to three dimensional mobjects based on how close
+        # they are to the camera, and draw the furthest ones first.
+        z_keys = np.full(len(mobjects), np.inf)
+        z_keys[is_shaded] = np.dot(
+            self.get_z_index_reference_points(shaded),
+            self.get_rotation_matrix()[2],
+        )
+        mobjects = [mobjects[i] for i in np.argsort(z_keys, kind="stable")]
+
+        if self.shading_factors is not None and self.should_apply_shading:
+            vmobjects = [
+                mob
+                for mob in shaded
+                if isinstance(mob, VMobject) and mob.get_num_points() > 0
+            ]
+            self.shading_factors.update(
+                zip(vmobjects, self.get_shading_factors(vmobjects))
+            )
+        return mobjects
+
+    def get_z_index_reference_points(self, mobjects):
+        """Returns the reference points of mobjects used to sort them by depth,
+        see :meth:`~.Mobject.get_z_index_reference_point`.
+
+        The centers of VMobjects without submobjects are computed at once
+        from the anchors of all of them.
 
-        def z_key(mob):
-            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
-                return np.inf
-            # Assign a number to a three dimensional mobjects
-            # based on how close it is to the camera
-            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        Parameters
+        ----------
+        mobjects : List[Mobject]
+            The mobjects
 
-        return sorted(mobjects, key=z_key)
+        Returns
+        -------
+        np.ndarray
+            The reference point of each mobject.
+        """
+        reference_points = np.empty((len(mobjects), 3))
+        anchors = []
+        indices = []
+        group_centers = {}
+        for i, mob in enumerate(mobjects):
+            points = mob.points
+            if (
+                isinstance(mob, VMobject)
+                and not mob.submobjects
+                and "z_index_group" not in mob.__dict__
+                and len(points) > 0
+                and len(points) % mob.n_points_per_cubic_curve == 0
+            ):
+                curves = points.reshape((-1, mob.n_points_per_cubic_curve, 3))
+                anchors.append(curves[:, [0, -1]].reshape((-1, 3)))
+                indices.append(i)
+                continue
+            group = mob.__dict__.get("z_index_group", mob)
+            if group not in group_centers:
+                group_centers[group] = mob.get_z_index_reference_point()
+            reference_points[i] = group_centers[group]
+        if anchors:
+            n_anchors = np.array([len(a) for a in anchors])
+            offsets = np.cumsum(n_anchors) - n_anchors
+            anchors = np.concatenate(anchors)
+            reference_points[indices] = (
+                np.minimum.reduceat(anchors, offsets)
+                + np.maximum.reduceat(anchors, offsets)
+            ) / 2
+        return reference_points
+
+    def get_layer_camera_key(self):
+        # Mobjects are projected, shaded and sorted by depth, which layers do
+        # not account for.
+        return None
 
     def get_phi(self):
         """Returns the Polar angle (the angle off Z_AXIS) phi.
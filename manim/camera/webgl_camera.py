@@ -26,6 +26,10 @@ class WebGLCamera(Camera):
                 }
             )
 
+    def get_layer_camera_key(self):
+        # Mobjects are serialized, not rasterized.
+        return None
+
     def reset(self):
         self.serialized_frame = []
 
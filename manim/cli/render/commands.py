@@ -16,9 +16,11 @@ import requests
 from ... import __version__, config, console, error_console, logger
 from ...constants import CONTEXT_SETTINGS, EPILOG
 from ...utils.module_ops import scene_classes_from_file
+from ...utils.prefetch import prefetch_scenes
 from .ease_of_access_options import ease_of_access_options
 from .global_options import global_options
 from .output_options import output_options
+from .parallel import can_render_in_parallel, render_scenes_in_parallel
 from .render_options import render_options
 
 
@@ -129,7 +131,20 @@ def render(
             error_console.print_exception()
             sys.exit(1)
     else:
-        for SceneClass in scene_classes_from_file(file):
+        scene_classes = scene_classes_from_file(file)
+        if config.prefetch:
+            prefetch_scenes(scene_classes)
+        if config.jobs != 1 and len(scene_classes) > 1:
+            if can_render_in_parallel():
+                if not render_scenes_in_parallel(scene_classes):
+                    sys.exit(1)
+                scene_classes = []
+            else:
+                logger.warning(
+                    "Rendering scenes in parallel is not supported on this "
+                    "platform, rendering them one after another."
+                )
+        for SceneClass in scene_classes:
             try:
                 scene = SceneClass()
                 scene.render()
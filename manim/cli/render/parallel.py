@@ -0,0 +1,153 @@
+"""Render the scenes of one input file in several worker processes.
+
+Every scene is rendered in its own forked worker, with its own copy of
+``config`` and therefore its own :class:`.SceneFileWriter` output
+directories.  Log records emitted by the workers are forwarded to the
+handlers of the parent process, prefixed with the name of the scene they
+belong to, and a summary of all the jobs is printed once they are done.
+
+"""
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+
+from rich.table import Table
+
+from ... import config, console, error_console, logger, tempconfig
+
+# Scene classes to render, keyed by their name.  The dictionary is filled by
+# the parent process right before the workers are forked, so that they inherit
+# the classes instead of having to pickle classes defined in a module that was
+# imported from an arbitrary file.
+_scene_classes = {}
+
+
+class _SceneNameFilter(logging.Filter):
+    """Prefix the log records of a worker with the name of the scene it renders."""
+
+    def __init__(self, scene_name):
+        super().__init__()
+        self.scene_name = scene_name
+
+    def filter(self, record):
+        record.msg = f"[{self.scene_name}] {record.getMessage()}"
+        record.args = None
+        return True
+
+
+def can_render_in_parallel():
+    """Whether the current platform supports rendering scenes in parallel.
+
+    Workers are forked so that they inherit the already digested ``config``
+    and the scene classes of the input file, which requires the ``fork``
+    start method.
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def get_job_count(num_scenes):
+    """Number of worker processes to use for rendering ``num_scenes`` scenes."""
+    jobs = config["jobs"] or os.cpu_count() or 1
+    return max(1, min(jobs, num_scenes))
+
+
+def _init_worker(log_queue):
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    # Progress bars of several processes would overwrite each other.
+    config["progress_bar"] = "none"
+
+
+def _render_scene(scene_name):
+    scene_filter = _SceneNameFilter(scene_name)
+    logger.addFilter(scene_filter)
+    start = time.perf_counter()
+    try:
+        with tempconfig({}):
+            scene = _scene_classes[scene_name]()
+            scene.render()
+            output_file = config["output_file"]
+        return (
+            scene_name,
+            time.perf_counter() - start,
+            scene.renderer.num_plays,
+            str(output_file) if output_file else "",
+            None,
+        )
+    except Exception:
+        return scene_name, time.perf_counter() - start, 0, "", traceback.format_exc()
+    finally:
+        logger.removeFilter(scene_filter)
+
+
+def render_scenes_in_parallel(scene_classes):
+    """Render ``scene_classes`` in a pool of forked worker processes.
+
+    Parameters
+    ----------
+    scene_classes : List[Type[:class:`.Scene`]]
+        The scenes to render, as returned by
+        :func:`~.module_ops.scene_classes_from_file`.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether all the scenes were rendered successfully.
+    """
+    _scene_classes.clear()
+    _scene_classes.update({cls.__name__: cls for cls in scene_classes})
+    jobs = get_job_count(len(scene_classes))
+    logger.info(
+        "Rendering %(num_scenes)s scenes in %(jobs)s processes",
+        {"num_scenes": len(scene_classes), "jobs": jobs},
+    )
+
+    context = multiprocessing.get_context("fork")
+    log_queue = context.Queue()
+    listener = QueueListener(log_queue, *logger.handlers)
+    listener.start()
+    start = time.perf_counter()
+    results = []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(log_queue,),
+        ) as executor:
+            futures = [executor.submit(_render_scene, name) for name in _scene_classes]
+            for future in as_completed(futures):
+                results.append(future.result())
+    finally:
+        listener.stop()
+        _scene_classes.clear()
+
+    print_summary(results, time.perf_counter() - start)
+    for scene_name, _, _, _, error in results:
+        if error is not None:
+            error_console.print(f"Rendering {scene_name} failed:\n{error}")
+    return all(error is None for *_, error in results)
+
+
+def print_summary(results, wall_time):
+    """Print a table summarizing the jobs of :func:`render_scenes_in_parallel`."""
+    table = Table(title=f"Rendered {len(results)} scenes in {wall_time:.2f}s")
+    table.add_column("Scene")
+    table.add_column("Status")
+    table.add_column("Animations", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Output")
+    for scene_name, elapsed, num_plays, output_file, error in sorted(results):
+        table.add_row(
+            scene_name,
+            "[red]failed[/red]" if error is not None else "[green]done[/green]",
+            str(num_plays),
+            f"{elapsed:.2f}s",
+            output_file,
+        )
+    console.print(table)
@@ -49,6 +49,28 @@ render_options = option_group(
         help="Render all scenes in the input file.",
         default=None,
     ),
+    option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Render the scenes of the input file in this many worker processes. "
+        "Use 0 to use one process per CPU core.",
+    ),
+    option(
+        "--frame_jobs",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Rasterize the frames of each animation in this many worker "
+        "processes (Cairo renderer only). Use 0 to use one process per CPU core.",
+    ),
+    option(
+        "--prefetch",
+        is_flag=True,
+        default=None,
+        help="Construct the scenes once without rendering them, to compile all "
+        "their Tex and Text mobjects in parallel before rendering (Cairo renderer only).",
+    ),
     option(
         "--format",
         type=click.Choice(["png", "gif", "mp4", "webm", "mov"], case_sensitive=False),
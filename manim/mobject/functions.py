@@ -15,6 +15,24 @@ from .opengl_compatibility import ConvertToOpenGL
 class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
     """A parametric curve.
 
+    Parameters
+    ----------
+    function
+        The function mapping a parameter ``t`` to a point.
+    t_range
+        The range of ``t``, with an optional step: ``(t_min, t_max, t_step)``.
+    dt
+        The distance from the discontinuities at which the curve stops.
+    discontinuities
+        The values of ``t`` at which the curve is interrupted.
+    use_smoothing
+        Whether to smooth the curve through the sampled points.
+    use_vectorized
+        Whether ``function`` is called once with the array of all the sampled
+        values of ``t``, instead of once per value.  It must then return the
+        arrays of the coordinates ``x``, ``y`` and ``z``, each of which can
+        also be a number.
+
     Examples
     --------
 
@@ -54,6 +72,7 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         dt=1e-8,
         discontinuities=None,
         use_smoothing=True,
+        use_vectorized=False,
         **kwargs
     ):
         self.function = function
@@ -64,6 +83,7 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         self.dt = dt
         self.discontinuities = [] if discontinuities is None else discontinuities
         self.use_smoothing = use_smoothing
+        self.use_vectorized = use_vectorized
         self.t_min, self.t_max, self.t_step = t_range
 
         super().__init__(**kwargs)
@@ -91,7 +111,10 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
             t_range = np.array([*np.arange(t1, t2, self.t_step), t2])
-            points = np.array([self.function(t) for t in t_range])
+            if self.use_vectorized:
+                points = np.stack(np.broadcast_arrays(*self.function(t_range)), axis=1)
+            else:
+                points = np.array([self.function(t) for t in t_range])
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
@@ -137,7 +160,9 @@ class FunctionGraph(ParametricFunction):
             x_range = np.array([-config["frame_x_radius"], config["frame_x_radius"]])
 
         self.x_range = x_range
-        self.parametric_function = lambda t: np.array([t, function(t), 0])
+        self.parametric_function = lambda t: np.array(
+            [t, function(t), np.zeros_like(t)]
+        )
         self.function = function
         super().__init__(self.parametric_function, self.x_range, color=color, **kwargs)
 
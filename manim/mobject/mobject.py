@@ -5,12 +5,14 @@ __all__ = ["Mobject", "Group", "override_animate"]
 
 
 import copy
+import hashlib
 import itertools as it
 import operator as op
 import random
 import sys
 import types
 import warnings
+import weakref
 from functools import reduce
 from math import ceil
 from pathlib import Path
@@ -42,6 +44,7 @@ from ..utils.color import (
     interpolate_color,
 )
 from ..utils.exceptions import MultiAnimationOverrideException
+from ..utils.hashing import get_content_digest
 from ..utils.iterables import list_update, remove_list_redundancies
 from ..utils.paths import straight_path
 from ..utils.simple_functions import get_parameters
@@ -62,6 +65,239 @@ if TYPE_CHECKING:
     from ..animation.animation import Animation
 
 
+# Attributes caching what can be computed from the others, which are neither
+# copied nor hashed.
+_CACHED_ATTRIBUTES = (
+    "_family",
+    "_family_with_points",
+    "_compiled_updaters",
+    "_family_has_updaters",
+    "_mipmaps",
+)
+
+
+def _get_shared_array(array):
+    # Return a read-only array with the values of an array of a mobject, which
+    # its copies can share instead of copying it, see
+    # Mobject.get_shared_array_attrs.  A view is replaced by a copy, unless
+    # nothing can write to the memory it uses.
+    if not isinstance(array, np.ndarray) or array.dtype.hasobject:
+        return None
+    if array.base is None:
+        array.flags.writeable = False
+        return array
+    view = array
+    while isinstance(view, np.ndarray) and not view.flags.writeable:
+        if view.base is None:
+            return array
+        view = view.base
+    array = array.copy()
+    array.flags.writeable = False
+    return array
+
+
+class _Parents(weakref.WeakSet):
+    """The mobjects having a mobject among their submobjects.
+
+    They are only used to invalidate cached families, and are referenced
+    weakly so that temporary groups are not kept alive by their members.
+    Copies of a mobject start without any.
+    """
+
+    def __reduce__(self):
+        return (_Parents, ())
+
+    def __copy__(self):
+        return _Parents()
+
+    def __deepcopy__(self, memo):
+        return _Parents()
+
+
+class _Submobjects(list):
+    """The :attr:`~.Mobject.submobjects` of a mobject.
+
+    Modifying the list in place keeps the cached families of the mobject and
+    of its ancestors up to date, like reassigning it does.
+    """
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner, submobjects=()):
+        super().__init__(submobjects)
+        self.owner = owner
+
+    def __reduce__(self):
+        return (_restore_submobjects, (self.owner, list(self)))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(mob, memo) for mob in self]
+
+    def _update_parents(self, added=(), removed=()):
+        owner = self.owner
+        if removed:
+            remaining = {id(mob) for mob in self}
+            for mob in removed:
+                parents = getattr(mob, "__dict__", {}).get("_parents")
+                if id(mob) not in remaining and parents:
+                    parents.discard(owner)
+        _add_parent(owner, added)
+        owner._invalidate_family()
+
+    def append(self, mob):
+        super().append(mob)
+        self._update_parents(added=[mob])
+
+    def extend(self, mobs):
+        mobs = list(mobs)
+        super().extend(mobs)
+        self._update_parents(added=mobs)
+
+    def __iadd__(self, mobs):
+        self.extend(mobs)
+        return self
+
+    def insert(self, index, mob):
+        super().insert(index, mob)
+        self._update_parents(added=[mob])
+
+    def remove(self, mob):
+        super().remove(mob)
+        self._update_parents(removed=[mob])
+
+    def pop(self, index=-1):
+        mob = super().pop(index)
+        self._update_parents(removed=[mob])
+        return mob
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self._update_parents(removed=removed)
+
+    def __setitem__(self, key, value):
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        if isinstance(key, slice):
+            value = list(value)
+        super().__setitem__(key, value)
+        self._update_parents(
+            added=value if isinstance(key, slice) else [value], removed=removed
+        )
+
+    def __delitem__(self, key):
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        self._update_parents(removed=removed)
+
+    def __imul__(self, n):
+        removed = list(self) if n <= 0 else ()
+        super().__imul__(n)
+        self._update_parents(removed=removed)
+        return self
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.owner._invalidate_family()
+
+    def reverse(self):
+        super().reverse()
+        self.owner._invalidate_family()
+
+
+def _add_parent(parent, mobjects):
+    for mob in mobjects:
+        attrs = getattr(mob, "__dict__", None)
+        if attrs is None:
+            continue
+        parents = attrs.get("_parents")
+        if parents is None:
+            parents = attrs["_parents"] = _Parents()
+        parents.add(parent)
+
+
+def _restore_submobjects(owner, submobjects):
+    # The parents are not pickled with the submobjects, which register them
+    # again when unpickled.
+    _add_parent(owner, submobjects)
+    return _Submobjects(owner, submobjects)
+
+
+class _Updaters(list):
+    """The :attr:`~.Mobject.updaters` of a mobject.
+
+    Modifying the list in place recompiles the updaters of the mobject, see
+    :meth:`.Mobject.update`, like reassigning it does.
+    """
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner, updaters=()):
+        super().__init__(updaters)
+        self.owner = owner
+
+    def __reduce__(self):
+        return (_Updaters, (self.owner, list(self)))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(updater, memo) for updater in self]
+
+    def append(self, updater):
+        super().append(updater)
+        self.owner._invalidate_updaters()
+
+    def extend(self, updaters):
+        super().extend(updaters)
+        self.owner._invalidate_updaters()
+
+    def __iadd__(self, updaters):
+        self.extend(updaters)
+        return self
+
+    def insert(self, index, updater):
+        super().insert(index, updater)
+        self.owner._invalidate_updaters()
+
+    def remove(self, updater):
+        super().remove(updater)
+        self.owner._invalidate_updaters()
+
+    def pop(self, index=-1):
+        updater = super().pop(index)
+        self.owner._invalidate_updaters()
+        return updater
+
+    def clear(self):
+        super().clear()
+        self.owner._invalidate_updaters()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.owner._invalidate_updaters()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.owner._invalidate_updaters()
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self.owner._invalidate_updaters()
+        return self
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.owner._invalidate_updaters()
+
+    def reverse(self):
+        super().reverse()
+        self.owner._invalidate_updaters()
+
+
 class Mobject:
     """Mathematical Object: base class for objects that can be displayed on screen.
 
@@ -316,11 +552,60 @@ class Mobject:
         cls = self.__class__
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
-        for k, v in self.__dict__.items():
+        # The parents of the copy, if they are copied too, register themselves
+        # when their submobjects are set.
+        result.__dict__["parents"] = []
+        shared_attrs = self.get_shared_array_attrs()
+        for k, v in list(self.__dict__.items()):
+            if k in ("parents", "_parents") or k in _CACHED_ATTRIBUTES:
+                continue
+            shared = _get_shared_array(v) if k in shared_attrs else None
+            if shared is not None:
+                # The values are unchanged, and so is the cached digest.
+                self.__dict__[k] = clone_from_id[id(v)] = shared
+                setattr(result, k, shared)
+                continue
             setattr(result, k, copy.deepcopy(v, clone_from_id))
         result.original_id = str(id(self))
+        # The copy displays exactly the same content.
+        result.__dict__["_content_hash"] = self.__dict__.get("_content_hash")
+        return result
+
+    def __copy__(self):
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        result.__dict__.update(dict.fromkeys(_CACHED_ATTRIBUTES), parents=[])
+        result.__dict__.pop("_parents", None)
+        for attr in self.get_shared_array_attrs():
+            shared = _get_shared_array(self.__dict__.get(attr))
+            if shared is not None:
+                self.__dict__[attr] = result.__dict__[attr] = shared
+        result.submobjects = list(self.submobjects)
+        result.updaters = list(self.updaters)
         return result
 
+    def __setattr__(self, attr, value):
+        # Any reassigned attribute (points, style arrays, ...) may change what
+        # the mobject displays.
+        self.__dict__["_content_hash"] = None
+        if attr == "submobjects":
+            self._set_submobjects(value)
+            return
+        if attr == "updaters":
+            super().__setattr__(attr, _Updaters(self, value))
+            self._invalidate_updaters()
+            return
+        if attr == "points":
+            points = self.__dict__.get("points")
+            if (
+                points is None
+                or value is None
+                or (len(points) == 0) != (len(value) == 0)
+            ):
+                self._invalidate_family(with_points_only=True)
+        super().__setattr__(attr, value)
+
     def __repr__(self):
         if config["renderer"] == "opengl":
             return super().__repr__()
@@ -723,11 +1008,126 @@ class Mobject:
     def get_array_attrs(self):
         return ["points"]
 
+    def get_shared_array_attrs(self) -> List[str]:
+        """Return the names of the arrays shared with the copies of this mobject.
+
+        Instead of being copied, these arrays are made read-only and shared
+        by :meth:`copy`, until the mobject or one of its copies modifies
+        them in place, which first replaces the array by a private copy, see
+        :meth:`get_writable_array`.  The mobjects of a :class:`~.Scene` get
+        private copies back before their updaters run and once an animation
+        is over, see :meth:`unshare_arrays`.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The names of the attributes.
+        """
+        return self.get_array_attrs()
+
+    def get_writable_array(self, attr: str) -> np.ndarray:
+        """Return an array of this :class:`Mobject`, ready to be modified in place.
+
+        The array is first replaced by a copy if it is read-only, for example
+        because it is shared with copies of the mobject.  The cached digest of
+        the mobject is dropped as well, see :meth:`get_content_hash`.
+
+        Parameters
+        ----------
+        attr
+            The name of the array, for example ``"points"``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The array, which can be written to.
+        """
+        array = getattr(self, attr)
+        if not array.flags.writeable:
+            array = array.copy()
+            setattr(self, attr, array)
+        self.invalidate_content_hash()
+        return array
+
+    def unshare_arrays(self) -> "Mobject":
+        """Replace the read-only arrays of this :class:`Mobject` and of its
+        family members, shared with their copies, by private copies.
+
+        The arrays can then be modified in place again, see
+        :meth:`get_shared_array_attrs`.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+        """
+        for mob in self.get_family():
+            for attr in mob.get_shared_array_attrs():
+                array = mob.__dict__.get(attr)
+                if isinstance(array, np.ndarray) and not array.flags.writeable:
+                    # The values are unchanged, and so is the cached digest.
+                    mob.__dict__[attr] = array.copy()
+        return self
+
     def apply_over_attr_arrays(self, func):
         for attr in self.get_array_attrs():
             setattr(self, attr, func(getattr(self, attr)))
         return self
 
+    # Hashing
+
+    def get_content_hash(self) -> str:
+        """Return a digest of what this :class:`Mobject` and its submobjects display.
+
+        Every mobject keeps a cached digest of its own points, style and other
+        attributes, which is dropped whenever one of them is reassigned or
+        modified in place by a method of the mobject. Hashing a family only
+        recomputes the digests of the members that changed since they were
+        last hashed, and combines the cached digests of the others.
+
+        Returns
+        -------
+        :class:`str`
+            The hexadecimal digest.
+
+        Note
+        ----
+        When writing to an attribute array in place outside of the methods
+        of the mobject, get it with :meth:`get_writable_array` (for example
+        ``mob.get_writable_array("points")[0] = ORIGIN``), or call
+        :meth:`invalidate_content_hash` afterwards.
+
+        See also
+        --------
+        :func:`~.hashing.get_hash_from_play_call`
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        self._update_content_digest(digest)
+        return digest.hexdigest()
+
+    def _update_content_digest(self, digest):
+        if self.__dict__.get("_content_hash") is None:
+            self.__dict__["_content_hash"] = get_content_digest(self)
+        digest.update(self._content_hash)
+        digest.update(len(self.submobjects).to_bytes(8, "little"))
+        for submob in self.submobjects:
+            submob._update_content_digest(digest)
+
+    def invalidate_content_hash(self) -> "Mobject":
+        """Drop the cached digest of this :class:`Mobject`.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+
+        See also
+        --------
+        :meth:`get_content_hash`
+        """
+        self.__dict__["_content_hash"] = None
+        return self
+
     # Displaying
 
     def get_image(self, camera=None):
@@ -758,6 +1158,10 @@ class Mobject:
         Note
         ----
         The clone is initially not visible in the Scene, even if the original was.
+
+        The arrays listed by :meth:`get_shared_array_attrs`, such as the
+        points, are not copied but shared, and are read-only until they are
+        modified, see :meth:`get_writable_array`.
         """
         return copy.deepcopy(self)
 
@@ -794,11 +1198,14 @@ class Mobject:
         :meth:`get_updaters`
 
         """
-        if self.updating_suspended:
+        if self.updating_suspended or not self._has_family_updaters():
             return self
-        for updater in self.updaters:
-            parameters = get_parameters(updater)
-            if "dt" in parameters:
+        updaters = self._get_compiled_updaters()
+        if updaters:
+            # Updaters may modify the arrays of the family in place.
+            self.unshare_arrays()
+        for updater, uses_dt in updaters:
+            if uses_dt:
                 updater(self, dt)
             else:
                 updater(self)
@@ -823,7 +1230,9 @@ class Mobject:
         :meth:`has_time_based_updater`
 
         """
-        return [updater for updater in self.updaters if "dt" in get_parameters(updater)]
+        return [
+            updater for updater, uses_dt in self._get_compiled_updaters() if uses_dt
+        ]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -838,10 +1247,7 @@ class Mobject:
         :meth:`get_time_based_updaters`
 
         """
-        for updater in self.updaters:
-            if "dt" in get_parameters(updater):
-                return True
-        return False
+        return any(uses_dt for _, uses_dt in self._get_compiled_updaters())
 
     def get_updaters(self) -> List[Updater]:
         """Return all updaters.
@@ -862,6 +1268,54 @@ class Mobject:
     def get_family_updaters(self):
         return list(it.chain(*[sm.get_updaters() for sm in self.get_family()]))
 
+    def _get_compiled_updaters(self):
+        # The updaters paired with whether they take the dt parameter, which
+        # is looked up once instead of at every call, see _invalidate_updaters.
+        compiled = self.__dict__.get("_compiled_updaters")
+        if compiled is None:
+            compiled = [
+                (updater, "dt" in get_parameters(updater)) for updater in self.updaters
+            ]
+            self.__dict__["_compiled_updaters"] = compiled
+        return compiled
+
+    def _has_family_updaters(self):
+        # Whether this mobject or one of its descendants has updaters, so that
+        # updating skips the subtrees without any.  Like the family, this is
+        # cached until the updaters or the submobjects of a member change.
+        has_updaters = self.__dict__.get("_family_has_updaters")
+        if has_updaters is None:
+            # Every submobject is looked at, to keep the answers of all the
+            # descendants cached.
+            has_updaters = bool(self.updaters) or any(
+                [submob._has_family_updaters() for submob in self.submobjects]
+            )
+            self.__dict__["_family_has_updaters"] = has_updaters
+        return has_updaters
+
+    def _invalidate_updaters(self):
+        # Drop the compiled updaters of this mobject, when its updaters change.
+        self.__dict__["_compiled_updaters"] = None
+        self._invalidate_family_updaters()
+
+    def _invalidate_family_updaters(self):
+        # Drop whether the families of this mobject and of its ancestors have
+        # updaters.  A cached answer implies cached answers for all the
+        # descendants, so the ancestors of a mobject without one have none
+        # either.
+        to_invalidate = [self]
+        invalidated = set()
+        while to_invalidate:
+            mob = to_invalidate.pop()
+            if id(mob) in invalidated:
+                continue
+            invalidated.add(id(mob))
+            attrs = mob.__dict__
+            if attrs.get("_family_has_updaters") is None:
+                continue
+            attrs["_family_has_updaters"] = None
+            to_invalidate.extend(attrs.get("_parents", ()))
+
     def add_updater(
         self,
         update_function: Updater,
@@ -1298,7 +1752,7 @@ class Mobject:
             alphas -= min(alphas)
             alphas /= max(alphas)
             alphas = alphas ** wag_factor
-            mob.points += np.dot(
+            mob.get_writable_array("points")[:] += np.dot(
                 alphas.reshape((len(alphas), 1)),
                 np.array(direction).reshape((1, mob.dim)),
             )
@@ -1356,8 +1810,9 @@ class Mobject:
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
         for mob in self.family_members_with_points():
-            mob.points -= about_point
-            mob.points = func(mob.points)
+            points = mob.get_writable_array("points")
+            points -= about_point
+            mob.points = func(points)
             mob.points += about_point
         return self
 
@@ -2143,12 +2598,58 @@ class Mobject:
             else:
                 return [self]
         else:
-            sub_families = list(map(Mobject.get_family, self.submobjects))
-            all_mobjects = [self] + list(it.chain(*sub_families))
-            return remove_list_redundancies(all_mobjects)
+            return list(self._get_cached_family())
 
     def family_members_with_points(self):
-        return [m for m in self.get_family() if m.get_num_points() > 0]
+        if config.renderer == "opengl":
+            return [m for m in self.get_family() if m.get_num_points() > 0]
+        family = self.__dict__.get("_family_with_points")
+        if family is None:
+            family = [m for m in self._get_cached_family() if m.get_num_points() > 0]
+            self.__dict__["_family_with_points"] = family
+        return list(family)
+
+    def _get_cached_family(self):
+        # The family is computed once, and kept until the submobjects of this
+        # mobject or of one of its descendants change, see _invalidate_family.
+        # It must not be modified.
+        family = self.__dict__.get("_family")
+        if family is None:
+            all_mobjects = [self]
+            for submob in self.submobjects:
+                all_mobjects.extend(submob._get_cached_family())
+            family = remove_list_redundancies(all_mobjects)
+            self.__dict__["_family"] = family
+        return family
+
+    def _set_submobjects(self, submobjects):
+        old_submobjects = self.__dict__.get("submobjects", ())
+        submobjects = _Submobjects(self, submobjects)
+        self.__dict__["submobjects"] = submobjects
+        submobjects._update_parents(added=submobjects, removed=old_submobjects)
+
+    def _invalidate_family(self, with_points_only=False):
+        # Drop the cached families of this mobject and of its ancestors.  A
+        # cached family implies cached families for all the descendants, so
+        # the ancestors of a mobject without one have none either, except for
+        # the members with points, which are also invalidated when the points
+        # of a member are emptied or filled.
+        if not with_points_only:
+            self._invalidate_family_updaters()
+        to_invalidate = [self]
+        invalidated = set()
+        while to_invalidate:
+            mob = to_invalidate.pop()
+            if id(mob) in invalidated:
+                continue
+            invalidated.add(id(mob))
+            attrs = mob.__dict__
+            if not with_points_only:
+                if attrs.get("_family") is None:
+                    continue
+                attrs["_family"] = None
+            attrs["_family_with_points"] = None
+            to_invalidate.extend(attrs.get("_parents", ()))
 
     def arrange(
         self,
@@ -9,6 +9,7 @@ import os
 import re
 import string
 import warnings
+from collections import OrderedDict
 from typing import Dict, List
 from xml.dom.minidom import Element as MinidomElement
 from xml.dom.minidom import parse as minidom_parse
@@ -24,6 +25,20 @@ from ..opengl_compatibility import ConvertToOpenGL
 from .style_utils import cascade_element_style, parse_style
 from .svg_path import SVGPathMobject, string_to_numbers
 
+# Maximum number of parsed SVG files kept in memory, see
+# :meth:`SVGMobject.generate_points`.
+PARSED_SVG_CACHE_SIZE = 256
+
+# Submobjects parsed from SVG files, least recently used first.
+_parsed_svg_cache = OrderedDict()
+_parsed_svg_cache_info = {"hits": 0, "misses": 0}
+
+
+def clear_parsed_svg_cache():
+    """Forget all the SVG files parsed so far."""
+    _parsed_svg_cache.clear()
+    _parsed_svg_cache_info.update(hits=0, misses=0)
+
 
 class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
     """A SVGMobject is a Vector Mobject constructed from an SVG (or XDV) file.
@@ -131,18 +146,56 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         """Called by the Mobject abstract base class. Responsible for generating
         the SVGMobject's points from XML tags, populating self.mobjects, and
         any submobjects within self.mobjects.
+
+        Parsing the same file with the same style again, which happens for
+        every :class:`~.Tex` or :class:`~.Text` displaying the same string,
+        copies the submobjects parsed the first time instead.
         """
-        doc = minidom_parse(self.file_path)
-        for svg in doc.getElementsByTagName("svg"):
-            mobjects = self.get_mobjects_from(svg, self.generate_style())
-            if self.unpack_groups:
-                self.add(*mobjects)
-            else:
-                self.add(*mobjects[0].submobjects)
-        doc.unlink()
+        key = self.get_parsed_svg_cache_key()
+        if key in _parsed_svg_cache:
+            _parsed_svg_cache.move_to_end(key)
+            _parsed_svg_cache_info["hits"] += 1
+            self.add(*[mob.copy() for mob in _parsed_svg_cache[key]])
+        else:
+            _parsed_svg_cache_info["misses"] += 1
+            doc = minidom_parse(self.file_path)
+            for svg in doc.getElementsByTagName("svg"):
+                mobjects = self.get_mobjects_from(svg, self.generate_style())
+                if self.unpack_groups:
+                    self.add(*mobjects)
+                else:
+                    self.add(*mobjects[0].submobjects)
+            doc.unlink()
+            _parsed_svg_cache[key] = [mob.copy() for mob in self.submobjects]
+            if len(_parsed_svg_cache) > PARSED_SVG_CACHE_SIZE:
+                _parsed_svg_cache.popitem(last=False)
+        logger.debug(
+            "Parsed SVG cache: %(hits)s hits, %(misses)s misses (%(file)s)",
+            {**_parsed_svg_cache_info, "file": self.file_path},
+        )
 
     init_points = generate_points
 
+    def get_parsed_svg_cache_key(self):
+        """Returns what the submobjects parsed from the SVG file depend on: the
+        file and its modification time, and the style and parsing options of
+        this mobject.
+        """
+        stat = os.stat(self.file_path)
+        style = tuple(
+            (name, str(value)) for name, value in sorted(self.generate_style().items())
+        )
+        return (
+            type(self),
+            os.path.abspath(self.file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            style,
+            self.unpack_groups,
+            tuple(sorted(self.path_string_config.items())),
+            config.renderer,
+        )
+
     def get_mobjects_from(
         self,
         element: MinidomElement,
@@ -6,12 +6,13 @@ __all__ = ["SVGPathMobject", "string_to_numbers"]
 
 import re
 from math import *
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
 from ... import config
 from ...constants import *
+from ...utils.bezier import interpolate
 from ...utils.deprecation import deprecated
 from ..opengl_compatibility import ConvertToOpenGL
 from ..types.vectorized_mobject import VMobject
@@ -183,6 +184,270 @@ def elliptical_arc_to_cubic_bezier(x1, y1, rx, ry, phi, fA, fS, x2, y2):
     return bezier_points
 
 
+def elliptical_arcs_to_cubic_beziers(
+    arcs: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of :func:`elliptical_arc_to_cubic_bezier`.
+
+    Parameters
+    ----------
+    arcs : :class:`numpy.ndarray`
+        Array of shape ``(n, 9)``, each row holding the parameters
+        ``x1, y1, rx, ry, phi, fA, fS, x2, y2`` of an arc with nonzero radii.
+
+    Returns
+    -------
+    Tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The control points of the cubic bezier curves approximating the arcs,
+        one after the other, as an array of shape ``(m, 4, 2)``, and the number
+        of curves approximating each arc.
+    """
+    x1, y1, rx, ry, phi, fA, fS, x2, y2 = arcs.T
+    phi = np.radians(phi % 360)
+    fA = fA != 0
+    fS = fS != 0
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+
+    # Conversion from endpoint to center parameterization, see
+    # get_elliptical_arc_center_parameters.
+    x = (x1 - x2) / 2
+    y = (y1 - y2) / 2
+    x1p = x * cos_phi + y * sin_phi
+    y1p = -x * sin_phi + y * cos_phi
+
+    # Like elliptical_arc_to_cubic_bezier, only the center is computed with
+    # the corrected radii.
+    crx = np.abs(rx)
+    cry = np.abs(ry)
+    Lambda = (x1p * x1p) / (crx * crx) + (y1p * y1p) / (cry * cry)
+    radii_scale = np.sqrt(np.maximum(Lambda, 1))
+    crx = radii_scale * crx
+    cry = radii_scale * cry
+
+    rx2 = crx * crx
+    ry2 = cry * cry
+    x1p2 = x1p * x1p
+    y1p2 = y1p * y1p
+    k = np.sqrt(
+        np.maximum((rx2 * ry2 - rx2 * y1p2 - ry2 * x1p2) / (rx2 * y1p2 + ry2 * x1p2), 0)
+    )
+    sign = np.where(fA == fS, -1, 1)
+    cxp = sign * k * (crx * y1p) / cry
+    cyp = sign * k * (-cry * x1p) / crx
+
+    cx = cxp * cos_phi - cyp * sin_phi + (x1 + x2) / 2
+    cy = cxp * sin_phi + cyp * cos_phi + (y1 + y2) / 2
+
+    def vector_angles(ux, uy, vx, vy):
+        sign = np.where(ux * vy - uy * vx < 0, -1, 1)
+        norms = np.sqrt(ux * ux + uy * uy) * np.sqrt(vx * vx + vy * vy)
+        return sign * np.arccos(np.clip((ux * vx + uy * vy) / norms, -1, 1))
+
+    x = (x1p - cxp) / crx
+    y = (y1p - cyp) / cry
+    theta1 = vector_angles(1, 0, x, y)
+    dtheta = np.degrees(vector_angles(x, y, (-x1p - cxp) / crx, (-y1p - cyp) / cry))
+    dtheta %= 360
+    dtheta[~fS & (dtheta > 0)] -= 360
+    dtheta[fS & (dtheta < 0)] += 360
+    dtheta = np.radians(dtheta)
+
+    # Chop the arcs into segments of at most 90 degrees when they sweep a
+    # multiple of 90 degrees, and of at most 36 degrees otherwise.
+    sweep_limits = np.where(np.degrees(dtheta) % 90 == 0, 90, 36)
+    num_segments = np.maximum(
+        np.ceil(np.abs(np.degrees(dtheta)) / sweep_limits).astype(int), 1
+    )
+    segment = dtheta / num_segments
+    alpha = np.sin(segment) * (np.sqrt(4 + 3 * np.tan(segment / 2) ** 2) - 1) / 3
+
+    # Expand the parameters of the arcs to their segments.
+    arc_indices = np.repeat(np.arange(len(arcs)), num_segments)
+    first_segments = np.cumsum(num_segments) - num_segments
+    segment_indices = np.arange(len(arc_indices)) - first_segments[arc_indices]
+    rx, ry, cx, cy, cos_phi, sin_phi, segment, alpha = (
+        values[arc_indices]
+        for values in (rx, ry, cx, cy, cos_phi, sin_phi, segment, alpha)
+    )
+    start_angles = theta1[arc_indices] + segment_indices * segment
+    end_angles = start_angles + segment
+
+    cos_start = np.cos(start_angles)
+    sin_start = np.sin(start_angles)
+    cos_end = np.cos(end_angles)
+    sin_end = np.sin(end_angles)
+
+    curves = np.empty((len(arc_indices), 4, 2))
+    ends = curves[:, 3]
+    ends[:, 0] = cx + rx * cos_phi * cos_end - ry * sin_phi * sin_end
+    ends[:, 1] = cy + rx * sin_phi * cos_end + ry * cos_phi * sin_end
+    last_segments = first_segments + num_segments - 1
+    ends[last_segments, 0] = x2
+    ends[last_segments, 1] = y2
+    starts = curves[:, 0]
+    starts[1:] = ends[:-1]
+    starts[first_segments, 0] = x1
+    starts[first_segments, 1] = y1
+
+    # Handles from the derivatives of the parametric equations of the arcs, see
+    # (the box on page 18) http://www.spaceroots.org/documents/ellipse/elliptical-arc.pdf
+    curves[:, 1, 0] = starts[:, 0] + alpha * (
+        -rx * cos_phi * sin_start - ry * sin_phi * cos_start
+    )
+    curves[:, 1, 1] = starts[:, 1] + alpha * (
+        -rx * sin_phi * sin_start + ry * cos_phi * cos_start
+    )
+    curves[:, 2, 0] = ends[:, 0] - alpha * (
+        -rx * cos_phi * sin_end - ry * sin_phi * cos_end
+    )
+    curves[:, 2, 1] = ends[:, 1] - alpha * (
+        -rx * sin_phi * sin_end + ry * cos_phi * cos_end
+    )
+    return curves, num_segments
+
+
+_path_command_regex = re.compile(r"([MLHVCSQTAZ])([^MLHVCSQTAZ]*)", re.IGNORECASE)
+_number_regex = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Kinds of the curves collected by path_string_to_cubic_bezier_curves.
+_CUBIC, _QUADRATIC, _LINE = 0, 1, 2
+
+
+def path_string_to_cubic_bezier_curves(path_string: str) -> np.ndarray:
+    """Converts an SVG path string to cubic bezier curves.
+
+    All the commands are parsed at once: only the positions of the control
+    points are resolved command by command, the handles of lines and
+    quadratic curves, and the arcs, are then computed for the whole path.
+
+    Parameters
+    ----------
+    path_string : :class:`str`
+        The ``d`` attribute of an SVG path element.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The control points of the curves, in SVG coordinates, as an array of
+        shape ``(n, 4, 2)``.  Like the points of a :class:`~.VMobject`, a new
+        subpath begins with every curve not starting where the previous one
+        ends.
+    """
+    coords = []
+    kinds = []
+    arcs = []
+    arc_positions = []
+    x = y = start_x = start_y = 0.0
+    # Last handles, to be reflected by smooth curves
+    handle_x = handle_y = 0.0
+    prev_command = None
+
+    for command, coord_string in _path_command_regex.findall(path_string):
+        numbers = [float(n) for n in _number_regex.findall(coord_string)]
+        is_relative = command.islower()
+        command = command.upper()
+
+        if command == "Z":
+            coords += (x, y, x, y, start_x, start_y, start_x, start_y)
+            kinds.append(_LINE)
+            x, y = start_x, start_y
+
+        elif command in "MLT":
+            for i in range(0, len(numbers) - 1, 2):
+                new_x, new_y = numbers[i], numbers[i + 1]
+                if is_relative:
+                    new_x += x
+                    new_y += y
+                if command == "M" and i == 0:
+                    start_x, start_y = new_x, new_y
+                elif command == "T":
+                    if prev_command in ("Q", "T"):
+                        handle_x, handle_y = 2 * x - handle_x, 2 * y - handle_y
+                    else:
+                        handle_x, handle_y = x, y
+                    coords += (x, y, handle_x, handle_y, 0, 0, new_x, new_y)
+                    kinds.append(_QUADRATIC)
+                    prev_command = command
+                else:
+                    coords += (x, y, x, y, new_x, new_y, new_x, new_y)
+                    kinds.append(_LINE)
+                x, y = new_x, new_y
+
+        elif command in "HV":
+            for number in numbers:
+                new_x, new_y = x, y
+                if command == "H":
+                    new_x = number + x if is_relative else number
+                else:
+                    new_y = number + y if is_relative else number
+                coords += (x, y, x, y, new_x, new_y, new_x, new_y)
+                kinds.append(_LINE)
+                x, y = new_x, new_y
+
+        elif command in "CSQ":
+            group_size = 6 if command == "C" else 4
+            for i in range(0, len(numbers) - group_size + 1, group_size):
+                group = numbers[i : i + group_size]
+                if is_relative:
+                    group = [n + (y if j % 2 else x) for j, n in enumerate(group)]
+                if command == "S":
+                    if prev_command in ("C", "S"):
+                        group = [2 * x - handle_x, 2 * y - handle_y] + group
+                    else:
+                        group = [x, y] + group
+                elif command == "Q":
+                    group = group[:2] + [0, 0] + group[2:]
+                coords += (x, y, *group)
+                kinds.append(_QUADRATIC if command == "Q" else _CUBIC)
+                handle_x, handle_y = group[2:4] if command != "Q" else group[:2]
+                x, y = group[4:6]
+                prev_command = command
+
+        elif command == "A":
+            for i in range(0, len(numbers) - 6, 7):
+                rx, ry, phi, fA, fS, new_x, new_y = numbers[i : i + 7]
+                if is_relative:
+                    new_x += x
+                    new_y += y
+                # An arc with identical endpoints is omitted, and one with a
+                # zero radius is a straight line, see
+                # http://www.w3.org/TR/SVG11/implnote.html#ArcImplementationNotes
+                if x == new_x and y == new_y:
+                    continue
+                if not rx or not ry:
+                    coords += (x, y, x, y, new_x, new_y, new_x, new_y)
+                    kinds.append(_LINE)
+                else:
+                    arcs.append((x, y, rx, ry, phi, fA, fS, new_x, new_y))
+                    arc_positions.append(len(kinds))
+                x, y = new_x, new_y
+
+        prev_command = command
+
+    curves = np.array(coords, dtype=float).reshape((-1, 4, 2))
+    kinds = np.array(kinds)
+
+    lines = curves[kinds == _LINE]
+    lines[:, 1] = interpolate(lines[:, 0], lines[:, 3], 1 / 3)
+    lines[:, 2] = interpolate(lines[:, 0], lines[:, 3], 2 / 3)
+    curves[kinds == _LINE] = lines
+
+    # Degree elevation, see
+    # https://en.wikipedia.org/wiki/B%C3%A9zier_curve#Degree_elevation
+    quadratics = curves[kinds == _QUADRATIC]
+    quadratics[:, 2] = 2 / 3 * quadratics[:, 1] + 1 / 3 * quadratics[:, 3]
+    quadratics[:, 1] = 2 / 3 * quadratics[:, 1] + 1 / 3 * quadratics[:, 0]
+    curves[kinds == _QUADRATIC] = quadratics
+
+    if arcs:
+        arc_curves, num_segments = elliptical_arcs_to_cubic_beziers(np.array(arcs))
+        curves = np.insert(
+            curves, np.repeat(arc_positions, num_segments), arc_curves, axis=0
+        )
+    return curves
+
+
 def string_to_numbers(num_string: str) -> List[float]:
     """Parse the SVG string representing a sequence of numbers into an array of floats.
 
@@ -253,6 +518,17 @@ class SVGPathMobject(VMobject, metaclass=ConvertToOpenGL):
 
     def generate_points(self):
         """Generates points from a given an SVG ``d`` attribute."""
+        if config["renderer"] != "opengl":
+            curves = path_string_to_cubic_bezier_curves(self.path_string)
+            points = np.zeros((4 * len(curves), self.dim))
+            points[:, :2] = curves.reshape((-1, 2))
+            # people treat y-coordinate differently
+            points[:, 1] *= -1
+            self.set_points(points)
+            return
+
+        # The points of OpenGL mobjects are quadratic bezier curves, built
+        # command by command.
         pattern = "[%s]" % ("".join(self.get_path_commands()))
         pairs = list(
             zip(
@@ -67,6 +67,7 @@ from ...constants import *
 from ...mobject.geometry import Dot
 from ...mobject.svg.svg_mobject import SVGMobject
 from ...mobject.types.vectorized_mobject import VGroup
+from ...utils import prefetch
 from ...utils.color import WHITE, Colors
 
 TEXT_MOB_SCALE_FACTOR = 0.05
@@ -656,6 +657,8 @@ class Text(SVGMobject):
         file_name = os.path.join(dir_name, hash_name) + ".svg"
         if os.path.exists(file_name):
             return file_name
+        if prefetch.is_recording():
+            return prefetch.record_text(file_name, copy.copy(self).text2svg)
         settings = self.text2settings()
         width = 600
         height = 400
@@ -1113,6 +1116,8 @@ class MarkupText(SVGMobject):
         file_name = os.path.join(dir_name, hash_name) + ".svg"
         if os.path.exists(file_name):
             return file_name
+        if prefetch.is_recording():
+            return prefetch.record_text(file_name, copy.copy(self).text2svg)
 
         logger.debug(f"Setting Text {self.text}")
         return MarkupUtils.text2svg(
@@ -9,6 +9,7 @@ __all__ = [
     "get_3d_vmob_unit_normal",
     "get_3d_vmob_start_corner_unit_normal",
     "get_3d_vmob_end_corner_unit_normal",
+    "get_3d_vmobs_corners_and_unit_normals",
 ]
 
 
@@ -67,3 +68,57 @@ def get_3d_vmob_start_corner_unit_normal(vmob):
 
 def get_3d_vmob_end_corner_unit_normal(vmob):
     return get_3d_vmob_unit_normal(vmob, get_3d_vmob_end_corner_index(vmob))
+
+
+def get_3d_vmobs_corners_and_unit_normals(vmobs):
+    """Computes the start and end corners of several VMobjects at once, with
+    their unit normals.
+
+    This gives the same results as :func:`get_3d_vmob_start_corner`,
+    :func:`get_3d_vmob_end_corner` and the corresponding unit normal
+    functions, but with array operations over the points of all VMobjects.
+
+    Parameters
+    ----------
+    vmobs : List[VMobject]
+        The VMobjects, which must all have points.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The start and end corners of each VMobject, with shape ``(n, 2, 3)``,
+        and their unit normals, with the same shape.
+    """
+    if len(vmobs) == 0:
+        return np.zeros((0, 2, 3)), np.zeros((0, 2, 3))
+    all_points = [vmob.points for vmob in vmobs]
+    n_points = np.array([len(points) for points in all_points])[:, np.newaxis]
+    nppcc = np.array([vmob.n_points_per_cubic_curve for vmob in vmobs])[:, np.newaxis]
+    offsets = np.cumsum(n_points) - n_points[:, 0]
+    all_points = np.concatenate(all_points)
+
+    # The number of anchors, as given by VMobject.get_anchors.
+    n_start_anchors = -(-n_points // nppcc)
+    n_end_anchors = np.maximum(-(-(n_points - nppcc + 1) // nppcc), 0)
+    n_anchors = np.where(
+        n_points == 1, 1, 2 * np.minimum(n_start_anchors, n_end_anchors)
+    )
+    has_normal = n_anchors > 2
+
+    indices = np.hstack([np.zeros_like(n_points), ((n_points - 1) // 6) * 3])
+    prev_indices = np.where(indices > 2, indices - 3, n_points - 4)
+    next_indices = np.where(indices < n_points - 3, indices + 3, 3)
+    corners = all_points[offsets[:, np.newaxis] + indices]
+
+    def vectors_to(neighbour_indices):
+        neighbour_indices = np.where(has_normal, neighbour_indices, indices)
+        return all_points[offsets[:, np.newaxis] + neighbour_indices] - corners
+
+    normals = np.cross(vectors_to(next_indices), vectors_to(prev_indices))
+    norms = np.linalg.norm(normals, axis=-1)[..., np.newaxis]
+    unit_normals = np.where(
+        has_normal[..., np.newaxis] & (norms > 0),
+        normals / np.where(norms > 0, norms, 1),
+        UP,
+    )
+    return corners, unit_normals
@@ -15,6 +15,7 @@ __all__ = [
 ]
 
 
+import copy
 from typing import *
 
 import numpy as np
@@ -22,11 +23,13 @@ from colour import Color
 
 from manim.mobject.opengl_compatibility import ConvertToOpenGL
 
+from .. import config
 from ..constants import *
 from ..mobject.geometry import Circle, Square
 from ..mobject.mobject import *
 from ..mobject.opengl_mobject import OpenGLMobject
 from ..mobject.types.vectorized_mobject import VGroup, VMobject
+from ..utils.bezier import interpolate
 from ..utils.color import *
 from ..utils.deprecation import deprecated_params
 from ..utils.iterables import tuplify
@@ -53,6 +56,12 @@ class ParametricSurface(VGroup):
         The number of samples taken of the surface. A tuple
         can be used to define different resolutions for ``u`` and
         ``v`` respectively.
+    use_vectorized :
+        Whether ``func`` is called once with the arrays of all the sampled
+        values of ``u`` and ``v``, instead of once per sample.  It must then
+        return the arrays of the coordinates ``x``, ``y`` and ``z``, each of
+        which can also be a number.  By default, only the ``func`` methods of
+        the classes setting :attr:`func_is_vectorized` are.
 
     Examples
     --------
@@ -74,6 +83,10 @@ class ParametricSurface(VGroup):
                 self.add(axes, surface)
     """
 
+    # Whether the func method defined by the class is vectorized, see
+    # use_vectorized.  Subclasses overriding func have to set it again.
+    func_is_vectorized = False
+
     @deprecated_params(
         params="u_min,u_max,v_min,v_max",
         since="v0.9.0",
@@ -94,6 +107,7 @@ class ParametricSurface(VGroup):
         stroke_width: float = 0.5,
         should_make_jagged: bool = False,
         pre_function_handle_to_anchor_scale_factor: float = 0.00001,
+        use_vectorized: Optional[bool] = None,
         **kwargs
     ) -> None:
         self.u_min = kwargs.pop("u_min", None) or u_range[0]
@@ -113,8 +127,19 @@ class ParametricSurface(VGroup):
             pre_function_handle_to_anchor_scale_factor
         )
         self.func = func
+        if use_vectorized is None:
+            use_vectorized = (
+                getattr(func, "__self__", None) is self
+                and self._defines_vectorized_func()
+            )
+        self.use_vectorized = use_vectorized
         self.setup_in_uv_space()
-        self.apply_function(lambda p: func(p[0], p[1]))
+        if self.make_smooth_after_applying_functions:
+            # As VMobject.apply_function does.
+            if config.renderer == "opengl":
+                self.make_approximately_smooth()
+            else:
+                self.make_smooth()
         if self.should_make_jagged:
             self.make_jagged()
 
@@ -134,39 +159,130 @@ class ParametricSurface(VGroup):
 
         return u_values, v_values
 
+    def get_points_of_faces(self, u_values, v_values, n_points_per_curve):
+        """Return the points of all the faces of the surface at once.
+
+        Every face is the image by :attr:`func` of a rectangle of the
+        ``(u, v)`` plane, whose sides are straight Bézier curves. With cubic
+        curves, the handles are mapped as :meth:`.VMobject.apply_function`
+        does, so that they follow the tangents of the surface.
+
+        Parameters
+        ----------
+        u_values
+            The sampled values of ``u``.
+        v_values
+            The sampled values of ``v``.
+        n_points_per_curve
+            The number of points of each side of a face.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The points of the faces, ``v`` varying faster than ``u``, with the
+            shape ``(number of faces, number of points per face, 3)``.
+        """
+        u1, v1 = np.meshgrid(u_values[:-1], v_values[:-1], indexing="ij")
+        u2, v2 = np.meshgrid(u_values[1:], v_values[1:], indexing="ij")
+        corners = np.stack(
+            [
+                np.stack(corner, axis=-1).reshape((-1, 2))
+                for corner in [(u1, v1), (u2, v1), (u2, v2), (u1, v2), (u1, v1)]
+            ],
+            axis=1,
+        )
+        # The sides of the faces, as given by VMobject.set_points_as_corners.
+        alphas = np.linspace(0, 1, n_points_per_curve)
+        uv_points = interpolate(
+            corners[:, :-1, np.newaxis],
+            corners[:, 1:, np.newaxis],
+            alphas[:, np.newaxis],
+        )
+        scale_handles = n_points_per_curve == 4
+        if scale_handles:
+            # Pull the handles toward their anchors before applying the
+            # function, and push them back after, see
+            # VMobject.scale_handle_to_anchor_distances.
+            factor = self.pre_function_handle_to_anchor_scale_factor
+            anchors = uv_points[:, :, [0, 3]]
+            uv_points[:, :, [1, 2]] = anchors + factor * (
+                uv_points[:, :, [1, 2]] - anchors
+            )
+        points = self.evaluate_func(uv_points.reshape((-1, 2))).reshape(
+            (*uv_points.shape[:3], 3)
+        )
+        if scale_handles:
+            anchors = points[:, :, [0, 3]]
+            points[:, :, [1, 2]] = anchors + (1.0 / factor) * (
+                points[:, :, [1, 2]] - anchors
+            )
+        return points.reshape((len(points), -1, 3))
+
+    def evaluate_func(self, uv_points):
+        """Map points of the ``(u, v)`` plane to the surface.
+
+        Parameters
+        ----------
+        uv_points
+            The points, with the shape ``(number of points, 2)``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The images of the points by :attr:`func`.
+        """
+        if self.use_vectorized:
+            coords = self.func(uv_points[:, 0], uv_points[:, 1])
+            return np.stack(np.broadcast_arrays(*coords), axis=-1).astype(float)
+        # Adjacent faces share their sides, the function is only called once
+        # per distinct point.
+        unique_points, indices = np.unique(uv_points, axis=0, return_inverse=True)
+        values = np.array([self.func(u, v) for u, v in unique_points], dtype=float)
+        return values[indices.reshape(-1)]
+
+    @classmethod
+    def _defines_vectorized_func(cls):
+        for base in cls.__mro__:
+            if "func" in vars(base):
+                return vars(base).get("func_is_vectorized", False)
+        return False
+
     def setup_in_uv_space(self):
         u_values, v_values = self.get_u_values_and_v_values()
-        faces = VGroup()
-        for i in range(len(u_values) - 1):
-            for j in range(len(v_values) - 1):
-                u1, u2 = u_values[i : i + 2]
-                v1, v2 = v_values[j : j + 2]
-                face = ThreeDVMobject()
-                face.set_points_as_corners(
-                    [
-                        [u1, v1, 0],
-                        [u2, v1, 0],
-                        [u2, v2, 0],
-                        [u1, v2, 0],
-                        [u1, v1, 0],
-                    ]
-                )
-                faces.add(face)
-                face.u_index = i
-                face.v_index = j
-                face.u1 = u1
-                face.u2 = u2
-                face.v1 = v1
-                face.v2 = v2
-        faces.set_fill(color=self.fill_color, opacity=self.fill_opacity)
-        faces.set_stroke(
+        # The faces are copies of styled faces, one for each color of the
+        # checkerboard, which only differ by their points.
+        face = ThreeDVMobject()
+        if config.renderer == "opengl":
+            n_points_per_curve = face.n_points_per_curve
+        else:
+            n_points_per_curve = face.n_points_per_cubic_curve
+        points = self.get_points_of_faces(u_values, v_values, n_points_per_curve)
+        face.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        face.set_stroke(
             color=self.stroke_color,
             width=self.stroke_width,
             opacity=self.stroke_opacity,
         )
-        self.add(*faces)
+        colored_faces = [face]
         if self.checkerboard_colors:
-            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+            colored_faces = [
+                face.copy().set_fill(color) for color in self.checkerboard_colors
+            ]
+        faces = []
+        v_res = len(v_values) - 1
+        for index, face_points in enumerate(points):
+            i, j = divmod(index, v_res)
+            face = colored_faces[(i + j) % len(colored_faces)]
+            # Shallow copies share the arrays of the styled face until they
+            # are modified, see Mobject.get_shared_array_attrs.
+            face = face.copy() if config.renderer == "opengl" else copy.copy(face)
+            face.set_points(face_points)
+            face.u_index = i
+            face.v_index = j
+            face.u1, face.u2 = u_values[i : i + 2]
+            face.v1, face.v2 = v_values[j : j + 2]
+            faces.append(face)
+        self.add(*faces)
 
     def set_fill_by_checkerboard(self, *colors, opacity=None):
         n_colors = len(colors)
@@ -283,6 +399,8 @@ class Sphere(ParametricSurface):
                 self.add(sphere3)
     """
 
+    func_is_vectorized = True
+
     def __init__(
         self,
         center=ORIGIN,
@@ -438,6 +556,8 @@ class Cone(ParametricSurface):
         Show checkerboard grid texture on the cone.
     """
 
+    func_is_vectorized = True
+
     def __init__(
         self,
         base_radius=1,
@@ -562,6 +682,8 @@ class Cylinder(ParametricSurface):
         Whether to show the end caps or not.
     """
 
+    func_is_vectorized = True
+
     def __init__(
         self,
         radius=1,
@@ -814,6 +936,8 @@ class Torus(ParametricSurface):
         Radius of the tube.
     """
 
+    func_is_vectorized = True
+
     def __init__(
         self,
         major_radius=3,
@@ -835,5 +959,7 @@ class Torus(ParametricSurface):
         )
 
     def func(self, u, v):
-        P = np.array([np.cos(u), np.sin(u), 0])
-        return (self.R - self.r * np.cos(v)) * P - self.r * np.sin(v) * OUT
+        distance = self.R - self.r * np.cos(v)
+        return np.array(
+            [distance * np.cos(u), distance * np.sin(u), -self.r * np.sin(v)]
+        )
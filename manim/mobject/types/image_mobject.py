@@ -3,6 +3,7 @@
 __all__ = ["AbstractImageMobject", "ImageMobject", "ImageMobjectFromCamera"]
 
 import pathlib
+import zlib
 
 import colour
 import numpy as np
@@ -49,6 +50,43 @@ class AbstractImageMobject(Mobject):
         # Likely to be implemented in subclasses, but no obligation
         pass
 
+    def get_mipmap(self, scale):
+        """Returns the image, halved in size as many times as it can be while
+        staying at least as large as when scaled by ``scale``.
+
+        The halved images are computed once and cached until the pixel array
+        changes. Resampling them instead of the full image avoids aliasing
+        when an image is drawn much smaller than its resolution.
+
+        Parameters
+        ----------
+        scale : :class:`float`
+            The factor by which the image is scaled when drawn.
+
+        Returns
+        -------
+        :class:`PIL.Image.Image`
+            The image, possibly reduced in size.
+        """
+        pixel_array = np.ascontiguousarray(self.get_pixel_array())
+        image = Image.fromarray(pixel_array, mode="RGBA")
+        if scale <= 0 or scale >= 0.5:
+            return image
+        key = (pixel_array.shape, zlib.crc32(pixel_array))
+        cached = self.__dict__.get("_mipmaps")
+        if cached is None or cached[0] != key:
+            cached = self.__dict__["_mipmaps"] = (key, [image])
+        mipmaps = cached[1]
+        level = int(np.log2(1 / scale))
+        while len(mipmaps) <= level and min(mipmaps[-1].size) > 1:
+            width, height = mipmaps[-1].size
+            mipmaps.append(
+                mipmaps[-1].resize(
+                    (max(width // 2, 1), max(height // 2, 1)), resample=Image.BOX
+                )
+            )
+        return mipmaps[min(level, len(mipmaps) - 1)]
+
     def set_resampling_algorithm(self, resampling_algorithm):
         """
         Sets the interpolation method for upscaling the image. By default the image is interpolated using bicubic algorithm. This method lets you change it.
@@ -81,7 +81,7 @@ class PMobject(Mobject):
         rgba = color_to_rgba(color)
         mobs = self.family_members_with_points() if family else [self]
         for mob in mobs:
-            mob.rgbas[:, :] = rgba
+            mob.get_writable_array("rgbas")[:, :] = rgba
         self.color = color
         return self
 
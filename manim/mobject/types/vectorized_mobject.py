@@ -11,6 +11,7 @@ __all__ = [
 ]
 
 
+import functools
 import itertools as it
 import sys
 import typing
@@ -30,6 +31,7 @@ from ...utils.bezier import (
     get_smooth_handle_points,
     integer_interpolate,
     interpolate,
+    partial_bezier_curves,
     partial_bezier_points,
 )
 from ...utils.color import BLACK, WHITE, color_to_rgba
@@ -49,6 +51,85 @@ from .opengl_vectorized_mobject import OpenGLVMobject
 #   That's kind of weird.
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_curve_subdivisions(
+    num_curves: int, target_num: int
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return how to split ``num_curves`` curves into ``target_num`` curves.
+
+    The curves are split as evenly as possible, see
+    :meth:`VMobject.insert_n_curves_to_point_list`.
+
+    Returns
+    -------
+    typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+        For each new curve, the index of the curve it is a portion of, and the
+        bounds of this portion.
+    """
+    # This is an array with values ranging from 0
+    # up to num_curves,  with repeats such that
+    # it's total length is target_num.  For example,
+    # with num_curves = 10, target_num = 15, this would
+    # be [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9]
+    indices = (np.arange(target_num) * num_curves) // target_num
+    # If the nth term of this array is k, it means
+    # that the nth curve of our path should be split
+    # into k pieces.  In the above example, this would
+    # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
+    split_factors = np.bincount(indices, minlength=num_curves)
+    pieces = np.arange(target_num) - (np.cumsum(split_factors) - split_factors)[indices]
+    split_factors = split_factors[indices]
+    subdivisions = (indices, pieces / split_factors, (pieces + 1) / split_factors)
+    for array in subdivisions:
+        array.flags.writeable = False
+    return subdivisions
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_alignment_plan(
+    lengths1: typing.Tuple[int, ...], lengths2: typing.Tuple[int, ...], nppcc: int
+) -> typing.Tuple[typing.Tuple[np.ndarray, np.ndarray, np.ndarray], ...]:
+    """Return how to align two paths, see :meth:`VMobject.align_points`.
+
+    Parameters
+    ----------
+    lengths1
+        The numbers of points of the subpaths of the first path.
+    lengths2
+        The numbers of points of the subpaths of the second path.
+    nppcc
+        The number of points per cubic curve.
+
+    Returns
+    -------
+    typing.Tuple[typing.Tuple[np.ndarray, np.ndarray, np.ndarray], ...]
+        For each path, the index of the curve each of the curves of the
+        aligned path is a portion of, and the bounds of this portion.  The
+        curves of the subpaths are numbered in order, followed by a null curve
+        at the end of the last subpath.
+    """
+    plans = []
+    for lengths, other_lengths in ((lengths1, lengths2), (lengths2, lengths1)):
+        starts = np.cumsum([0, *lengths]) // nppcc
+        null_length = nppcc
+        subdivisions = []
+        for n in range(max(len(lengths), len(other_lengths))):
+            if n < len(lengths):
+                start, length = starts[n], lengths[n]
+            else:
+                start, length = starts[-1], null_length
+            other_length = other_lengths[n] if n < len(other_lengths) else null_length
+            num_curves = length // nppcc
+            diff = max(0, (other_length - length) // nppcc)
+            indices, a, b = _get_curve_subdivisions(num_curves, num_curves + diff)
+            subdivisions.append((start + indices, a, b))
+        plan = tuple(np.concatenate(arrays) for arrays in zip(*subdivisions))
+        for array in plan:
+            array.flags.writeable = False
+        plans.append(plan)
+    return tuple(plans)
+
+
 class VMobject(Mobject):
     """A vectorized mobject."""
 
@@ -109,6 +190,13 @@ class VMobject(Mobject):
     def get_group_class(self):
         return VGroup
 
+    def get_shared_array_attrs(self):
+        return super().get_shared_array_attrs() + [
+            "fill_rgbas",
+            "stroke_rgbas",
+            "background_stroke_rgbas",
+        ]
+
     # Colors
     def init_colors(self, propagate_colors=True):
         self.set_fill(
@@ -177,6 +265,7 @@ class VMobject(Mobject):
             setattr(self, array_name, curr_rgbas)
         elif len(rgbas) < len(curr_rgbas):
             rgbas = stretch_array_to_length(rgbas, len(curr_rgbas))
+        curr_rgbas = self.get_writable_array(array_name)
         # Only update rgb if color was not None, and only
         # update alpha channel if opacity was passed in
         if color is not None:
@@ -978,6 +1067,21 @@ class VMobject(Mobject):
             lambda n: not self.consider_points_equals_2d(points[n - 1], points[n]),
         )
 
+    def _get_subpath_lengths(self) -> typing.Tuple[int, ...]:
+        """Return the numbers of points of the subpaths, see :meth:`get_subpaths`."""
+        points = self.points
+        nppcc = self.n_points_per_cubic_curve
+        indices = np.arange(nppcc, len(points), nppcc)
+        breaks = ~np.isclose(
+            points[indices - 1], points[indices], atol=self.tolerance_for_point_equality
+        ).all(axis=1)
+        split_indices = [0, *indices[breaks].tolist(), len(points)]
+        return tuple(
+            i2 - i1
+            for i1, i2 in zip(split_indices, split_indices[1:])
+            if (i2 - i1) >= nppcc
+        )
+
     def get_subpaths(self) -> typing.Tuple:
         """Returns subpaths formed by the curves of the VMobject.
 
@@ -1239,33 +1343,20 @@ class VMobject(Mobject):
             if mob.has_new_path_started():
                 mob.add_line_to(mob.get_last_point())
 
-        # Figure out what the subpaths are, and align
-        subpaths1 = self.get_subpaths()
-        subpaths2 = vmobject.get_subpaths()
-        n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
-
+        # Figure out what the subpaths are, and align them curve by curve,
+        # with a plan shared by all the paths made of the same subpaths
         nppcc = self.n_points_per_cubic_curve
-
-        def get_nth_subpath(path_list, n):
-            if n >= len(path_list):
-                # Create a null path at the very end
-                return [path_list[-1][-1]] * nppcc
-            return path_list[n]
-
-        for n in range(n_subpaths):
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
-            diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
+        lengths = [mob._get_subpath_lengths() for mob in (self, vmobject)]
+        plans = _get_alignment_plan(*lengths, nppcc)
+        for mob, mob_lengths, (indices, a, b) in zip((self, vmobject), lengths, plans):
+            points = mob.points
+            curves = points[: len(points) - len(points) % nppcc]
+            curves = curves.reshape(-1, nppcc, mob.dim)
+            # Create a null curve at the very end
+            last_point = points[sum(mob_lengths) - 1]
+            curves = np.append(curves, [[last_point] * nppcc], axis=0)
+            new_points = partial_bezier_curves(curves[indices], a, b)
+            mob.set_points(new_points.reshape(-1, mob.dim))
         return self
 
     def insert_n_curves(self, n: int) -> "VMobject":
@@ -1313,30 +1404,14 @@ class VMobject(Mobject):
             return np.repeat(points, nppcc * n, 0)
         bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
         curr_num = len(bezier_quads)
-        target_num = curr_num + n
-        # This is an array with values ranging from 0
-        # up to curr_num,  with repeats such that
-        # it's total length is target_num.  For example,
-        # with curr_num = 10, target_num = 15, this would
-        # be [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9]
-        repeat_indices = (np.arange(target_num) * curr_num) // target_num
-
-        # If the nth term of this list is k, it means
-        # that the nth curve of our path should be split
-        # into k pieces.  In the above example, this would
-        # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points, partial_bezier_points(quad, a1, a2), axis=0
-                )
-        return new_points
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
+        indices, a, b = _get_curve_subdivisions(curr_num, curr_num + n)
+        # What was once a single cubic curve defined
+        # by a quad will now be broken into several
+        # smaller cubic curves, computed all at once
+        new_points = partial_bezier_curves(bezier_quads[indices], a, b)
+        return new_points.reshape(-1, self.dim)
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
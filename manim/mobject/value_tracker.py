@@ -74,6 +74,11 @@ class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
         self.set_points(np.zeros((1, 3)))
         self.set_value(value)
 
+    def get_shared_array_attrs(self):
+        # The value is written to the points in place, which are too small
+        # to be worth sharing with copies anyway.
+        return []
+
     def get_value(self) -> float:
         """Get the current value of this ValueTracker."""
         return self.get_points()[0, 0]
@@ -81,6 +86,9 @@ class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
     def set_value(self, value: float):
         """Sets a new scalar value to the ValueTracker"""
         self.get_points()[0, 0] = value
+        if isinstance(self, Mobject):
+            # The value is written in place, see Mobject.get_content_hash.
+            self.invalidate_content_hash()
         return self
 
     def increment_value(self, d_value: float):
@@ -172,4 +180,6 @@ class ComplexValueTracker(ValueTracker):
         """Sets a new complex value to the ComplexValueTracker"""
         z = complex(z)
         self.get_points()[0, :2] = (z.real, z.imag)
+        if isinstance(self, Mobject):
+            self.invalidate_content_hash()
         return self
@@ -1,3 +1,5 @@
+import multiprocessing
+import os
 import time
 import typing
 
@@ -10,6 +12,7 @@ from ..camera.camera import Camera
 from ..mobject.mobject import Mobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.exceptions import EndSceneEarlyException
+from ..utils.file_ops import is_png_format, write_to_movie
 from ..utils.iterables import list_update
 
 
@@ -91,6 +94,11 @@ class CairoRenderer:
         self.update_skipping_status()
 
         scene.compile_animation_data(*args, **kwargs)
+        # Mobjects changing at every frame are not worth rasterizing to layers.
+        self.camera.set_animated_mobjects(
+            [anim.mobject for anim in scene.animations]
+            + [mob for mob in scene.get_mobject_family_members() if mob.updaters]
+        )
 
         if self.skip_animations:
             logger.debug(f"Skipping animation {self.num_plays}")
@@ -120,19 +128,110 @@ class CairoRenderer:
         # Save a static image, to avoid rendering non moving objects.
         self.static_image = self.save_static_frame_data(scene, scene.static_mobjects)
 
-        self.file_writer.begin_animation(not self.skip_animations)
-        scene.begin_animations()
-        if scene.is_current_animation_frozen_frame():
-            self.update_frame(scene)
-            # self.duration stands for the total run time of all the animations.
-            # In this case, as there is only a wait, it will be the length of the wait.
-            self.freeze_current_frame(scene.duration)
+        if self.can_render_in_frame_chunks(scene):
+            scene.begin_animations()
+            self.render_in_frame_chunks(scene)
         else:
-            scene.play_internal()
-        self.file_writer.end_animation(not self.skip_animations)
+            self.file_writer.begin_animation(not self.skip_animations)
+            scene.begin_animations()
+            if scene.is_current_animation_frozen_frame():
+                self.update_frame(scene)
+                # self.duration stands for the total run time of all the animations.
+                # In this case, as there is only a wait, it will be the length of the wait.
+                self.freeze_current_frame(scene.duration)
+            else:
+                scene.play_internal()
+            self.file_writer.end_animation(not self.skip_animations)
 
+        self.camera.set_animated_mobjects([])
         self.num_plays += 1
 
+    def can_render_in_frame_chunks(self, scene):
+        """Whether the current animation can be split into frame chunks that
+        are rasterized by several processes (see ``config.frame_jobs``).
+
+        This requires the frames to be written to a movie, and the animation
+        to have a known duration, i.e. no ``stop_condition``.
+        """
+        return (
+            config["frame_jobs"] != 1
+            and not self.skip_animations
+            and write_to_movie()
+            and not is_png_format()
+            and "fork" in multiprocessing.get_all_start_methods()
+            and not scene.is_current_animation_frozen_frame()
+            and scene.stop_condition is None
+            and scene.get_run_time(scene.animations) * self.camera.frame_rate > 1
+        )
+
+    def render_in_frame_chunks(self, scene):
+        """Render the current animation by splitting its frames into chunks.
+
+        Each chunk is rasterized by a forked process that replays the
+        animation up to the start of its chunk without rendering, and then
+        pipes the frames of the chunk to its own movie file.  Meanwhile this
+        process brings the scene to the end of the animation, and finally
+        concatenates the chunks into the partial movie file of the animation.
+
+        Parameters
+        ----------
+        scene : :class:`.Scene`
+            The scene being played, whose animations have begun.
+        """
+        times = np.arange(
+            0, scene.get_run_time(scene.animations), 1 / self.camera.frame_rate
+        )
+        num_chunks = min(config["frame_jobs"] or os.cpu_count() or 1, len(times))
+        chunks = np.array_split(np.arange(len(times)), num_chunks)
+        chunk_files = self.file_writer.get_frame_chunk_file_paths(num_chunks)
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(
+                target=self.render_frame_chunk,
+                args=(scene, times[: chunk[-1] + 1], chunk[0], chunk_file),
+            )
+            for chunk, chunk_file in zip(chunks, chunk_files)
+        ]
+        for worker in workers:
+            worker.start()
+        scene.play_internal(skip_rendering=True)
+        self.time += len(times) / self.camera.frame_rate
+        for worker in workers:
+            worker.join()
+        failed = [i for i, worker in enumerate(workers) if worker.exitcode != 0]
+        if failed:
+            raise RuntimeError(
+                f"Rendering frame chunks {failed} of animation {self.num_plays} failed."
+            )
+        self.file_writer.combine_frame_chunks(chunk_files)
+
+    def render_frame_chunk(self, scene, times, first_frame, file_path):
+        """Render the frames ``times[first_frame:]`` of the current animation to
+        ``file_path``.  Meant to be run in a forked process.
+
+        Parameters
+        ----------
+        scene : :class:`.Scene`
+            The scene being played, whose animations have begun.
+        times : np.ndarray
+            The times of all the frames of the animation up to the end of the
+            chunk.
+        first_frame : :class:`int`
+            Index of the first frame of the chunk.
+        file_path : :class:`str`
+            The movie file to write the chunk to.
+        """
+        self.file_writer.open_movie_pipe(file_path=file_path)
+        for i, t in enumerate(times):
+            scene.update_to_time(t)
+            if i >= first_frame:
+                if scene.update_moving_and_static_mobjects():
+                    self.static_image = None
+                    self.save_static_frame_data(scene, scene.static_mobjects)
+                self.render(scene, t, scene.moving_mobjects)
+        self.file_writer.close_movie_pipe()
+
     def update_frame(  # TODO Description in Docstring
         self,
         scene,
@@ -175,7 +274,9 @@ class CairoRenderer:
 
     def render(self, scene, time, moving_mobjects):
         self.update_frame(scene, moving_mobjects)
-        self.add_frame(self.get_frame())
+        # The file writer copies the frame before returning, there is no need
+        # to copy the pixel array beforehand.
+        self.add_frame(self.camera.pixel_array)
 
     def get_frame(self):
         """
@@ -217,7 +318,7 @@ class CairoRenderer:
         """
         dt = 1 / self.camera.frame_rate
         self.add_frame(
-            self.get_frame(),
+            self.camera.pixel_array,
             num_frames=int(duration / dt),
         )
 
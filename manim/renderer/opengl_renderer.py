@@ -1,5 +1,6 @@
 import itertools as it
 import time
+from collections import deque
 
 import moderngl
 import numpy as np
@@ -16,6 +17,7 @@ from ..mobject.opengl_mobject import OpenGLMobject, OpenGLPoint
 from ..mobject.types.opengl_vectorized_mobject import OpenGLVMobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils import opengl
+from ..utils.iterables import batch_by_property
 from ..utils.simple_functions import clip
 from ..utils.space_ops import (
     angle_of_vector,
@@ -25,7 +27,7 @@ from ..utils.space_ops import (
     rotation_matrix_transpose_from_quaternion,
 )
 from .opengl_renderer_window import Window
-from .shader import Mesh, Shader
+from .shader import Mesh, Shader, VertexArrayCache
 from .vectorized_mobject_rendering import (
     render_opengl_vectorized_mobject_fill,
     render_opengl_vectorized_mobject_stroke,
@@ -219,6 +221,10 @@ JOINT_TYPE_MAP = {
 
 
 class OpenGLRenderer:
+    # Number of pixel buffers the frames written to the movie are read back
+    # into, so that reading a frame back does not wait for it to be rendered.
+    num_pixel_buffers = 2
+
     def __init__(self, file_writer_class=SceneFileWriter, skip_animations=False):
         # Measured in pixel widths, used for vector graphics
         self.anti_alias_width = 1.5
@@ -235,6 +241,11 @@ class OpenGLRenderer:
         # Initialize texture map.
         self.path_to_texture_id = {}
 
+        # Pixel buffers the frames are read back into, see read_frame.
+        self.free_pixel_buffers = []
+        self.pending_pixel_buffers = deque()
+        self.frame_data = None
+
     def init_scene(self, scene):
         self.partial_movie_files = []
         self.file_writer = self._file_writer_class(
@@ -259,6 +270,7 @@ class OpenGLRenderer:
                 moderngl.ONE,
                 moderngl.ONE,
             )
+            self.vertex_arrays = VertexArrayCache(self.context)
 
     def get_pixel_shape(self):
         if hasattr(self, "frame_buffer_object"):
@@ -287,55 +299,114 @@ class OpenGLRenderer:
         }
 
     def render_mobject(self, mobject):
-        if isinstance(mobject, OpenGLVMobject):
-            if config["use_projection_fill_shaders"]:
-                render_opengl_vectorized_mobject_fill(self, mobject)
-
-            if config["use_projection_stroke_shaders"]:
-                render_opengl_vectorized_mobject_stroke(self, mobject)
-
-        shader_wrapper_list = mobject.get_shader_wrapper_list()
-
-        # Convert ShaderWrappers to Meshes.
-        for shader_wrapper in shader_wrapper_list:
-            shader = Shader(self.context, shader_wrapper.shader_folder)
-
-            # Set textures.
-            for name, path in shader_wrapper.texture_paths.items():
-                tid = self.get_texture_id(path)
-                shader.shader_program[name].value = tid
-
-            # Set uniforms.
-            for name, value in it.chain(
-                shader_wrapper.uniforms.items(), self.perspective_uniforms.items()
-            ):
-                try:
-                    shader.set_uniform(name, value)
-                except KeyError:
-                    pass
-            try:
-                shader.set_uniform("u_view_matrix", self.scene.camera.get_view_matrix())
-                shader.set_uniform(
-                    "u_projection_matrix", self.scene.camera.projection_matrix
+        self.render_mobjects([mobject])
+
+    def render_mobjects(self, mobjects):
+        """Render mobjects in order.
+
+        The shader wrappers of consecutive mobjects that are drawn with the
+        same program and the same uniforms, textures and depth test are
+        combined, like those of the members of a family are, and rendered
+        with a single draw call.
+
+        Parameters
+        ----------
+        mobjects
+            The mobjects to render.
+        """
+        use_projection_shaders = (
+            config["use_projection_fill_shaders"]
+            or config["use_projection_stroke_shaders"]
+        )
+        pending_wrappers = []
+        for mobject in mobjects:
+            if isinstance(mobject, OpenGLVMobject) and use_projection_shaders:
+                # Keep the order of what is drawn.
+                self.render_shader_wrappers(pending_wrappers)
+                pending_wrappers = []
+                if config["use_projection_fill_shaders"]:
+                    render_opengl_vectorized_mobject_fill(self, mobject)
+
+                if config["use_projection_stroke_shaders"]:
+                    render_opengl_vectorized_mobject_stroke(self, mobject)
+
+            pending_wrappers.extend(
+                ((id(mobject), index), shader_wrapper)
+                for index, shader_wrapper in enumerate(
+                    mobject.get_shader_wrapper_list()
                 )
+            )
+        self.render_shader_wrappers(pending_wrappers)
+
+    def render_shader_wrappers(self, keyed_shader_wrappers):
+        """Render shader wrappers, combining the consecutive ones that can be
+        drawn together.
+
+        Parameters
+        ----------
+        keyed_shader_wrappers
+            Pairs of a key identifying a shader wrapper across frames, and the
+            shader wrapper.
+        """
+        batches = batch_by_property(
+            keyed_shader_wrappers,
+            lambda pair: (
+                pair[1].get_id(),
+                pair[1].vert_data.dtype,
+                pair[1].vert_indices is None,
+            ),
+        )
+        for batch, _ in batches:
+            keys, shader_wrappers = zip(*batch)
+            shader_wrapper = shader_wrappers[0]
+            shader_wrapper.combine_with(*shader_wrappers[1:])
+            self.render_shader_wrapper(keys, shader_wrapper)
+
+    def render_shader_wrapper(self, key, shader_wrapper):
+        shader = Shader(self.context, shader_wrapper.shader_folder)
+
+        # Set textures.
+        for name, path in shader_wrapper.texture_paths.items():
+            tid = self.get_texture_id(path)
+            shader.shader_program[name].value = tid
+
+        # Set uniforms.
+        for name, value in it.chain(
+            shader_wrapper.uniforms.items(), self.perspective_uniforms.items()
+        ):
+            try:
+                shader.set_uniform(name, value)
             except KeyError:
                 pass
-
-            # Set depth test.
-            if shader_wrapper.depth_test:
-                self.context.enable(moderngl.DEPTH_TEST)
-            else:
-                self.context.disable(moderngl.DEPTH_TEST)
-
-            # Render.
-            mesh = Mesh(
-                shader,
-                shader_wrapper.vert_data,
-                indices=shader_wrapper.vert_indices,
-                use_depth_test=shader_wrapper.depth_test,
+        try:
+            shader.set_uniform("u_view_matrix", self.scene.camera.get_view_matrix())
+            shader.set_uniform(
+                "u_projection_matrix", self.scene.camera.projection_matrix
             )
-            mesh.set_uniforms(self)
-            mesh.render()
+        except KeyError:
+            pass
+
+        # Set depth test.
+        if shader_wrapper.depth_test:
+            self.context.enable(moderngl.DEPTH_TEST)
+        else:
+            self.context.disable(moderngl.DEPTH_TEST)
+
+        # Render.
+        mesh = Mesh(
+            shader,
+            shader_wrapper.vert_data,
+            indices=shader_wrapper.vert_indices,
+            use_depth_test=shader_wrapper.depth_test,
+        )
+        mesh.set_uniforms(self)
+        self.vertex_arrays.render(
+            key,
+            shader,
+            mesh.attributes,
+            indices=mesh.indices,
+            primitive=mesh.primitive,
+        )
 
     def get_texture_id(self, path):
         if path not in self.path_to_texture_id:
@@ -400,13 +471,15 @@ class OpenGLRenderer:
         self.frame_buffer_object.clear(*window_background_color)
         self.refresh_perspective_uniforms(scene.camera)
 
-        for mobject in scene.mobjects:
-            self.render_mobject(mobject)
+        self.render_mobjects(scene.mobjects)
 
         for obj in scene.meshes:
             for mesh in obj.get_meshes():
                 mesh.set_uniforms(self)
-                mesh.render()
+                mesh.render(self.vertex_arrays)
+
+        # Free the GPU resources of what was not rendered in this frame.
+        self.vertex_arrays.release_unused()
 
         self.animation_elapsed_time = time.time() - self.animation_start_time
 
@@ -447,6 +520,63 @@ class OpenGLRenderer:
         )
         return ret
 
+    def read_frame(self):
+        """Start reading the current frame back, without waiting for it.
+
+        The pixels are copied into a pixel buffer by the GPU, in the
+        background.  They are only fetched once all the pixel buffers are in
+        use, so that the frame is done rendering by then.
+
+        Returns
+        -------
+        Optional[:class:`memoryview`]
+            The raw data of the oldest frame still being read back, bottom row
+            first, if all the pixel buffers were in use.  It is only valid until
+            the next frame is fetched.
+
+        See also
+        --------
+        :meth:`get_pending_frames`
+        """
+        viewport = self.frame_buffer_object.viewport
+        num_channels = 4
+        frame_size = viewport[2] * viewport[3] * num_channels
+        if self.frame_data is None or len(self.frame_data) != frame_size:
+            for buffer in it.chain(self.free_pixel_buffers, self.pending_pixel_buffers):
+                buffer.release()
+            self.free_pixel_buffers = [
+                self.context.buffer(reserve=frame_size)
+                for _ in range(self.num_pixel_buffers)
+            ]
+            self.pending_pixel_buffers = deque()
+            self.frame_data = bytearray(frame_size)
+
+        frame = None
+        if not self.free_pixel_buffers:
+            frame = self.fetch_frame(self.pending_pixel_buffers.popleft())
+        buffer = self.free_pixel_buffers.pop()
+        self.frame_buffer_object.read_into(
+            buffer, viewport=viewport, components=num_channels, dtype="f1"
+        )
+        self.pending_pixel_buffers.append(buffer)
+        return frame
+
+    def get_pending_frames(self):
+        """Fetch the frames still being read back, see :meth:`read_frame`.
+
+        Yields
+        ------
+        :class:`memoryview`
+            The raw data of the frames, oldest first.
+        """
+        while self.pending_pixel_buffers:
+            yield self.fetch_frame(self.pending_pixel_buffers.popleft())
+
+    def fetch_frame(self, buffer):
+        buffer.read_into(self.frame_data)
+        self.free_pixel_buffers.append(buffer)
+        return memoryview(self.frame_data)
+
     def get_frame(self):
         # get current pixel values as numpy data in order to test output
         raw = self.get_raw_frame_buffer_object_data(dtype="f1")
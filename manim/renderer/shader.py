@@ -19,6 +19,7 @@ __all__ = [
     "Mesh",
     "Shader",
     "FullScreenQuad",
+    "VertexArrayCache",
 ]
 
 
@@ -65,6 +66,152 @@ def filter_attributes(unfiltered_attributes, attributes):
     return filtered_attributes
 
 
+class CachedVertexArray:
+    """A vertex array with its vertex and index buffers, see :class:`VertexArrayCache`."""
+
+    def __init__(self, context, program, attributes, vertex_data, index_data):
+        self.program = program
+        self.dtype = attributes.dtype
+        self.vertex_data = vertex_data
+        self.index_data = index_data
+        self.vertex_buffer_object = context.buffer(vertex_data)
+        self.index_buffer_object = context.buffer(index_data) if index_data else None
+        self.vertex_array_object = context.simple_vertex_array(
+            program,
+            self.vertex_buffer_object,
+            *attributes.dtype.names,
+            index_buffer=self.index_buffer_object,
+        )
+
+    def matches(self, program, attributes, index_data):
+        return (
+            self.program is program
+            and self.dtype == attributes.dtype
+            and bool(self.index_data) == bool(index_data)
+        )
+
+    def write(self, vertex_data, index_data):
+        """Write the data that changed since the previous frame to the buffers."""
+        if vertex_data != self.vertex_data:
+            self.write_buffer(self.vertex_buffer_object, vertex_data)
+            self.vertex_data = vertex_data
+        if index_data != self.index_data:
+            self.write_buffer(self.index_buffer_object, index_data)
+            self.index_data = index_data
+
+    @staticmethod
+    def write_buffer(buffer, data):
+        # Let the driver allocate new storage instead of waiting for the draw
+        # calls still using the buffer.
+        buffer.orphan(len(data))
+        buffer.write(data)
+
+    def render(self, primitive):
+        if self.index_buffer_object is None:
+            vertices = len(self.vertex_data) // self.dtype.itemsize
+        else:
+            vertices = len(self.index_data) // 4
+        self.vertex_array_object.render(primitive, vertices=vertices)
+
+    def release(self):
+        self.vertex_array_object.release()
+        self.vertex_buffer_object.release()
+        if self.index_buffer_object is not None:
+            self.index_buffer_object.release()
+
+
+class VertexArrayCache:
+    """Vertex arrays kept on the GPU from one frame to the next.
+
+    Rendering data under the same key again reuses the vertex array and the
+    buffers that were created for it, which are only written to when the data
+    actually changed.  The vertex arrays that were not rendered since the
+    previous call to :meth:`release_unused` are released then, for instance
+    those of the mobjects removed from the scene.
+
+    Parameters
+    ----------
+    context
+        The context the vertex arrays are created in.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.vertex_arrays = {}
+        self.used_keys = set()
+        # The names of the attributes of every shader program.
+        self.program_attributes = {}
+
+    def __len__(self):
+        return len(self.vertex_arrays)
+
+    def get_program_attributes(self, program):
+        from moderngl.program_members.attribute import Attribute
+
+        if program.glo not in self.program_attributes:
+            self.program_attributes[program.glo] = {
+                name
+                for name, member in program._members.items()
+                if isinstance(member, Attribute)
+            }
+        return self.program_attributes[program.glo]
+
+    def render(
+        self, key, shader, attributes, indices=None, primitive=moderngl.TRIANGLES
+    ):
+        """Render vertex data with a shader.
+
+        Parameters
+        ----------
+        key
+            Identifies the vertex array across frames, for instance the mobject
+            the data comes from.
+        shader
+            The :class:`Shader` to render the data with.
+        attributes
+            The structured array of the vertex data.
+        indices
+            The indices of the vertices to render, all of them by default.
+        primitive
+            The primitive to render.
+        """
+        program = shader.shader_program
+        program_attributes = self.get_program_attributes(program)
+        if not all(name in program_attributes for name in attributes.dtype.names):
+            attributes = filter_attributes(attributes, program_attributes)
+        vertex_data = attributes.tobytes()
+        index_data = b"" if indices is None else indices.astype("i4").tobytes()
+        if not vertex_data:
+            return
+        self.used_keys.add(key)
+        vertex_array = self.vertex_arrays.get(key)
+        if vertex_array is not None and vertex_array.matches(
+            program, attributes, index_data
+        ):
+            vertex_array.write(vertex_data, index_data)
+        else:
+            if vertex_array is not None:
+                vertex_array.release()
+            vertex_array = CachedVertexArray(
+                self.context, program, attributes, vertex_data, index_data
+            )
+            self.vertex_arrays[key] = vertex_array
+        vertex_array.render(primitive)
+
+    def release_unused(self):
+        """Release the vertex arrays not rendered since the previous call."""
+        for key in self.vertex_arrays.keys() - self.used_keys:
+            self.vertex_arrays.pop(key).release()
+        self.used_keys = set()
+
+    def release(self):
+        """Release all the vertex arrays."""
+        for vertex_array in self.vertex_arrays.values():
+            vertex_array.release()
+        self.vertex_arrays = {}
+        self.used_keys = set()
+
+
 class Object3D:
     def __init__(self, *children):
         self.model_matrix = np.eye(4)
@@ -300,7 +447,16 @@ class Mesh(Object3D):
             renderer.camera.projection_matrix,
         )
 
-    def render(self):
+    def render(self, vertex_arrays=None):
+        """Render the mesh.
+
+        Parameters
+        ----------
+        vertex_arrays
+            The :class:`VertexArrayCache` keeping the vertex array of the mesh
+            for the next frames.  By default, the vertex array is released
+            right after rendering.
+        """
         if self.skip_render:
             return
 
@@ -309,34 +465,13 @@ class Mesh(Object3D):
         else:
             self.shader.context.disable(moderngl.DEPTH_TEST)
 
-        from moderngl.program_members.attribute import Attribute
-
-        shader_attributes = []
-        for k, v in self.shader.shader_program._members.items():
-            if isinstance(v, Attribute):
-                shader_attributes.append(k)
-        shader_attributes = filter_attributes(self.attributes, shader_attributes)
-
-        vertex_buffer_object = self.shader.context.buffer(shader_attributes.tobytes())
-        if self.indices is None:
-            index_buffer_object = None
+        if vertex_arrays is None:
+            cache = VertexArrayCache(self.shader.context)
         else:
-            vert_index_data = self.indices.astype("i4").tobytes()
-            if vert_index_data:
-                index_buffer_object = self.shader.context.buffer(vert_index_data)
-            else:
-                index_buffer_object = None
-        vertex_array_object = self.shader.context.simple_vertex_array(
-            self.shader.shader_program,
-            vertex_buffer_object,
-            *shader_attributes.dtype.names,
-            index_buffer=index_buffer_object,
-        )
-        vertex_array_object.render(self.primitive)
-        vertex_buffer_object.release()
-        vertex_array_object.release()
-        if index_buffer_object is not None:
-            index_buffer_object.release()
+            cache = vertex_arrays
+        cache.render(self, self.shader, self.attributes, self.indices, self.primitive)
+        if vertex_arrays is None:
+            cache.release()
 
 
 class Shader:
@@ -433,5 +568,5 @@ class FullScreenQuad(Mesh):
         )
         super().__init__(shader, attributes)
 
-    def render(self):
-        super().render()
+    def render(self, vertex_arrays=None):
+        super().render(vertex_arrays)
@@ -33,12 +33,16 @@ def build_matrix_lists(mob):
 def render_opengl_vectorized_mobject_fill(renderer, mobject):
     matrix_to_mobject_list = build_matrix_lists(mobject)
 
-    for matrix_tuple, mobject_list in matrix_to_mobject_list.items():
+    for index, (matrix_tuple, mobject_list) in enumerate(
+        matrix_to_mobject_list.items()
+    ):
         model_matrix = np.array(matrix_tuple).reshape((4, 4))
-        render_mobject_fills_with_matrix(renderer, model_matrix, mobject_list)
+        render_mobject_fills_with_matrix(
+            renderer, model_matrix, mobject_list, key=(id(mobject), "fill", index)
+        )
 
 
-def render_mobject_fills_with_matrix(renderer, model_matrix, mobjects):
+def render_mobject_fills_with_matrix(renderer, model_matrix, mobjects, key=None):
     # Precompute the total number of vertices for which to reserve space.
     # Note that triangulate_mobject() will cache its results.
     total_size = 0
@@ -79,15 +83,22 @@ def render_mobject_fills_with_matrix(renderer, model_matrix, mobjects):
         renderer.scene.camera.projection_matrix,
     )
 
-    vbo = renderer.context.buffer(attributes.tobytes())
-    vao = renderer.context.simple_vertex_array(
-        fill_shader.shader_program,
-        vbo,
-        *attributes.dtype.names,
-    )
-    vao.render()
-    vao.release()
-    vbo.release()
+    render_vertex_data(renderer, key, fill_shader, attributes)
+
+
+def render_vertex_data(renderer, key, shader, attributes):
+    """Render vertex data, keeping its vertex array for the next frames unless
+    ``key`` is ``None``."""
+    if key is None:
+        vbo = renderer.context.buffer(attributes.tobytes())
+        vao = renderer.context.simple_vertex_array(
+            shader.shader_program, vbo, *attributes.dtype.names
+        )
+        vao.render()
+        vao.release()
+        vbo.release()
+    else:
+        renderer.vertex_arrays.render(key, shader, attributes)
 
 
 def triangulate_mobject(mob):
@@ -186,12 +197,16 @@ def triangulate_mobject(mob):
 
 def render_opengl_vectorized_mobject_stroke(renderer, mobject):
     matrix_to_mobject_list = build_matrix_lists(mobject)
-    for matrix_tuple, mobject_list in matrix_to_mobject_list.items():
+    for index, (matrix_tuple, mobject_list) in enumerate(
+        matrix_to_mobject_list.items()
+    ):
         model_matrix = np.array(matrix_tuple).reshape((4, 4))
-        render_mobject_strokes_with_matrix(renderer, model_matrix, mobject_list)
+        render_mobject_strokes_with_matrix(
+            renderer, model_matrix, mobject_list, key=(id(mobject), "stroke", index)
+        )
 
 
-def render_mobject_strokes_with_matrix(renderer, model_matrix, mobjects):
+def render_mobject_strokes_with_matrix(renderer, model_matrix, mobjects, key=None):
     # Precompute the total number of vertices for which to reserve space.
     total_size = 0
     for submob in mobjects:
@@ -268,11 +283,5 @@ def render_mobject_strokes_with_matrix(renderer, model_matrix, mobjects):
     shader.set_uniform("u_projection_matrix", renderer.scene.camera.projection_matrix)
     shader.set_uniform("manim_unit_normal", tuple(-mobjects[0].data["unit_normal"][0]))
 
-    vbo = renderer.context.buffer(stroke_data.tobytes())
-    vao = renderer.context.simple_vertex_array(
-        shader.shader_program, vbo, *stroke_data.dtype.names
-    )
     renderer.frame_buffer_object.use()
-    vao.render()
-    vao.release()
-    vbo.release()
+    render_vertex_data(renderer, key, shader, stroke_data)
@@ -40,7 +40,7 @@ from ..utils.exceptions import EndSceneEarlyException, RerunSceneException
 from ..utils.family import extract_mobject_family_members
 from ..utils.family_ops import restructure_list_to_exclude_certain_family_members
 from ..utils.file_ops import open_media_file
-from ..utils.iterables import list_difference_update, list_update
+from ..utils.iterables import OrderedIdentitySet, list_update
 
 
 class RerunSceneHandler(FileSystemEventHandler):
@@ -103,6 +103,11 @@ class Scene:
         self.stop_condition = None
         self.moving_mobjects = []
         self.static_mobjects = []
+        self.static_mobject_hashes = {}
+        self.static_mobject_boxes = None
+        self.static_mobject_order = None
+        self.drawing_order = []
+        self.drawing_order_positions = {}
         self.time_progression = None
         self.duration = None
         self.last_t = None
@@ -354,13 +359,11 @@ class Scene:
         """
         # Return only those which are not in the family
         # of another mobject from the scene
-        families = [m.get_family() for m in self.mobjects]
-
-        def is_top_level(mobject):
-            num_families = sum([(mobject in family) for family in families])
-            return num_families == 1
-
-        return list(filter(is_top_level, self.mobjects))
+        num_families = {}
+        for mob in self.mobjects:
+            for member in OrderedIdentitySet(mob.get_family()):
+                num_families[id(member)] = num_families.get(id(member), 0) + 1
+        return [mob for mob in self.mobjects if num_families[id(mob)] == 1]
 
     def get_mobject_family_members(self):
         """
@@ -424,14 +427,14 @@ class Scene:
             return self
 
     def add_mobjects_from_animations(self, animations):
-        curr_mobjects = self.get_mobject_family_members()
+        curr_mobjects = OrderedIdentitySet(self.get_mobject_family_members())
         for animation in animations:
             # Anything animated that's not already in the
             # scene gets added to the scene
             mob = animation.mobject
             if mob is not None and mob not in curr_mobjects:
                 self.add(mob)
-                curr_mobjects += mob.get_family()
+                curr_mobjects.update(mob.get_family())
 
     def remove(self, *mobjects):
         """
@@ -456,7 +459,7 @@ class Scene:
                 self.mobjects, mobjects_to_remove
             )
             self.meshes = list(
-                filter(lambda mesh: mesh not in set(meshes_to_remove), self.meshes)
+                filter(lambda mesh: mesh not in meshes_to_remove, self.meshes)
             )
             return self
         else:
@@ -535,13 +538,19 @@ class Scene:
             for mob in list_to_examine:
                 if mob in set_to_remove:
                     continue
-                intersect = set_to_remove.intersection(mob.get_family())
+                # Only groups can contain mobjects to remove, there is no need
+                # to compute the families of the other mobjects.
+                intersect = (
+                    set_to_remove.intersection(mob.get_family())
+                    if mob.submobjects
+                    else None
+                )
                 if intersect:
                     add_safe_mobjects_from_list(mob.submobjects, intersect)
                 else:
                     new_mobjects.append(mob)
 
-        add_safe_mobjects_from_list(mobjects, set(to_remove))
+        add_safe_mobjects_from_list(mobjects, OrderedIdentitySet(to_remove))
         return new_mobjects
 
     # TODO, remove this, and calls to this
@@ -684,25 +693,45 @@ class Scene:
         ------
         list
             The list of mobjects that could be moving in
-            the Animation(s)
+            the Animation(s): the animated mobjects, the
+            mobjects with updaters and the foreground mobjects.
+            Whether the other mobjects also have to be
+            redrawn is decided by
+            :meth:`get_moving_and_static_mobjects`.
         """
-        # Go through mobjects from start to end, and
-        # as soon as there's one that needs updating of
-        # some kind per frame, return the list from that
-        # point forward.
-        animation_mobjects = [anim.mobject for anim in animations]
-        mobjects = self.get_mobject_family_members()
-        for i, mob in enumerate(mobjects):
-            update_possibilities = [
-                mob in animation_mobjects,
-                len(mob.get_family_updaters()) > 0,
-                mob in self.foreground_mobjects,
-            ]
-            if any(update_possibilities):
-                return mobjects[i:]
-        return []
+        animation_mobjects = {id(anim.mobject) for anim in animations}
+        foreground_mobjects = {id(mob) for mob in self.foreground_mobjects}
+        return [
+            mob
+            for mob in self.get_mobject_family_members()
+            if id(mob) in animation_mobjects
+            or len(mob.get_family_updaters()) > 0
+            or id(mob) in foreground_mobjects
+        ]
 
     def get_moving_and_static_mobjects(self, animations):
+        """Splits the mobjects of the scene into the ones that are redrawn at
+        every frame and the ones that are only drawn once, to the static frame.
+
+        The animated mobjects and the foreground mobjects are always moving,
+        as foreground mobjects like the display of a :class:`.ZoomedScene` can
+        change without their content hash changing.  Mobjects with updaters are
+        static until their content changes (see
+        :meth:`update_moving_and_static_mobjects`), unless
+        :meth:`get_moving_mobjects` considers other mobjects to be moving as
+        well, for instance when the camera moves.  Static mobjects drawn above
+        moving mobjects they overlap have to be redrawn too.
+
+        Parameters
+        ----------
+        animations : List[:class:`~.Animation`]
+            The animations about to be played.
+
+        Returns
+        -------
+        Tuple[List[:class:`~.Mobject`], List[:class:`~.Mobject`]]
+            The moving and the static mobjects, in the order they are drawn.
+        """
         all_mobjects = list_update(self.mobjects, self.foreground_mobjects)
         all_mobject_families = extract_mobject_family_members(
             all_mobjects,
@@ -714,10 +743,250 @@ class Scene:
             moving_mobjects,
             use_z_index=self.renderer.camera.use_z_index,
         )
-        static_mobjects = list_difference_update(
-            all_mobject_families, all_moving_mobject_families
+        animated_mobjects = {
+            id(mob)
+            for mob in extract_mobject_family_members(
+                [anim.mobject for anim in animations]
+            )
+        }
+        always_moving_mobjects = animated_mobjects | {
+            id(mob) for mob in extract_mobject_family_members(self.foreground_mobjects)
+        }
+        possibly_moving_mobjects = always_moving_mobjects | {
+            id(mob)
+            for mob in extract_mobject_family_members(Scene.get_moving_mobjects(self))
+        }
+        if all(
+            id(mob) in possibly_moving_mobjects for mob in all_moving_mobject_families
+        ):
+            all_moving_mobject_families = [
+                mob
+                for mob in all_moving_mobject_families
+                if id(mob) in always_moving_mobjects
+            ]
+        moving_ids = {id(mob) for mob in all_moving_mobject_families}
+        static_mobjects = [
+            mob for mob in all_mobject_families if id(mob) not in moving_ids
+        ]
+        order = {id(mob): i for i, mob in enumerate(all_mobject_families)}
+        overlapped = self.get_overlapped_mobjects(
+            static_mobjects,
+            [order[id(mob)] for mob in static_mobjects],
+            all_moving_mobject_families,
+            [order.get(id(mob), np.inf) for mob in all_moving_mobject_families],
+        )
+        return (
+            self.get_mobjects_in_drawing_order(
+                all_mobject_families,
+                all_moving_mobject_families,
+                [mob for mob, moved in zip(static_mobjects, overlapped) if moved],
+            ),
+            [mob for mob, moved in zip(static_mobjects, overlapped) if not moved],
+        )
+
+    def get_mobject_bounding_boxes(self, mobjects):
+        """Returns the regions of the frame the mobjects may draw on.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects.
+
+        Returns
+        -------
+        np.ndarray
+            The rows ``[x_min, y_min, x_max, y_max]`` of the mobjects, including
+            the width of their strokes, empty for mobjects which are not drawn.
+        """
+        camera = self.renderer.camera
+        pixel = camera.frame_width / camera.pixel_width
+        boxes = np.empty((len(mobjects), 4))
+        boxes[:, :2] = np.inf
+        boxes[:, 2:] = -np.inf
+        for i, mob in enumerate(mobjects):
+            if camera.type_or_raise(mob) is Mobject or not mob.has_points():
+                continue
+            width = getattr(mob, "stroke_width", 0)
+            if hasattr(mob, "get_stroke_width"):
+                width = max(mob.get_stroke_width(), mob.get_stroke_width(True))
+            # Generous enough for stroke widths both in pixels and in hundredths
+            # of units, with miter joins and antialiasing.
+            margin = (pixel + 0.05) * (1 + width)
+            points = mob.points[:, :2]
+            boxes[i, :2] = points.min(axis=0) - margin
+            boxes[i, 2:] = points.max(axis=0) + margin
+        return boxes
+
+    def get_overlapped_mobjects(
+        self, mobjects, order, moving_mobjects, moving_order, boxes=None
+    ):
+        """Returns which mobjects are drawn above moving mobjects they overlap,
+        directly or through other such mobjects.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The static mobjects.
+        order : List[:class:`float`]
+            The positions of the static mobjects in the drawing order.
+        moving_mobjects : List[:class:`~.Mobject`]
+            The moving mobjects.
+        moving_order : List[:class:`float`]
+            The positions of the moving mobjects in the drawing order.
+        boxes : Optional[np.ndarray]
+            The bounding boxes of the static mobjects, see
+            :meth:`get_mobject_bounding_boxes`, computed if None.
+
+        Returns
+        -------
+        np.ndarray
+            Whether each static mobject is overlapped.
+        """
+        overlapped = np.zeros(len(mobjects), dtype=bool)
+        if not mobjects or not moving_mobjects:
+            return overlapped
+        if boxes is None:
+            boxes = self.get_mobject_bounding_boxes(mobjects)
+        order = np.asarray(order, dtype=float)
+        new_boxes = self.get_mobject_bounding_boxes(moving_mobjects)
+        new_order = np.asarray(moving_order, dtype=float)
+        while len(new_boxes):
+            new = ~overlapped & (
+                (order[:, None] > new_order[None, :])
+                & (boxes[:, None, 0] <= new_boxes[None, :, 2])
+                & (boxes[:, None, 2] >= new_boxes[None, :, 0])
+                & (boxes[:, None, 1] <= new_boxes[None, :, 3])
+                & (boxes[:, None, 3] >= new_boxes[None, :, 1])
+            ).any(axis=1)
+            overlapped |= new
+            new_boxes, new_order = boxes[new], order[new]
+        return overlapped
+
+    def get_mobjects_in_drawing_order(self, drawing_order, moving_mobjects, mobjects):
+        """Adds mobjects to the moving mobjects, in the order they are drawn.
+
+        Parameters
+        ----------
+        drawing_order : List[:class:`~.Mobject`]
+            All the mobjects with points, in the order they are drawn.
+        moving_mobjects : List[:class:`~.Mobject`]
+            The moving mobjects.
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects to add, from ``drawing_order``.
+
+        Returns
+        -------
+        List[:class:`~.Mobject`]
+            The moving mobjects.
+        """
+        if not mobjects:
+            return moving_mobjects
+        ordered = {id(mob) for mob in drawing_order}
+        moving = {id(mob) for mob in moving_mobjects} | {id(mob) for mob in mobjects}
+        # Moving mobjects which are not drawn as such, like groups, stay only if
+        # some of their family members are not in the drawing order either, like
+        # the ones added to the scene during the animations.
+        return [mob for mob in drawing_order if id(mob) in moving] + [
+            mob
+            for mob in moving_mobjects
+            if id(mob) not in ordered
+            and not all(
+                id(member) in ordered for member in mob.family_members_with_points()
+            )
+        ]
+
+    def watch_static_mobjects(self):
+        """Records the state of the static mobjects, drawn to the static frame,
+        see :meth:`update_moving_and_static_mobjects`."""
+        self.drawing_order = extract_mobject_family_members(
+            list_update(self.mobjects, self.foreground_mobjects),
+            use_z_index=self.renderer.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        self.drawing_order_positions = {
+            id(mob): i for i, mob in enumerate(self.drawing_order)
+        }
+        self.static_mobject_order = np.array(
+            [self.drawing_order_positions[id(mob)] for mob in self.static_mobjects],
+            dtype=float,
+        )
+        self.static_mobject_boxes = self.get_mobject_bounding_boxes(
+            self.static_mobjects
         )
-        return all_moving_mobject_families, static_mobjects
+        # Only updaters can change mobjects which are not animated: the updaters
+        # of the scene can change any mobject, the updaters of a mobject only its
+        # family.
+        if self.updaters:
+            watched = range(len(self.static_mobjects))
+        else:
+            updated = {
+                id(submob)
+                for mob in self.get_mobject_family_members()
+                if mob.updaters
+                for submob in mob.get_family()
+            }
+            watched = [
+                i for i, mob in enumerate(self.static_mobjects) if id(mob) in updated
+            ]
+        self.static_mobject_hashes = {
+            i: self.static_mobjects[i].get_content_hash() for i in watched
+        }
+
+    def update_moving_and_static_mobjects(self):
+        """Turns the static mobjects which changed since the static frame was
+        drawn, or which are drawn above moving mobjects they now overlap, into
+        moving mobjects.
+
+        Only the static mobjects which updaters can change are hashed, and the
+        bounding boxes of the static mobjects are the ones recorded by
+        :meth:`watch_static_mobjects`.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether some static mobjects started moving, in which case the
+            static frame has to be drawn again.
+        """
+        if not self.static_mobjects:
+            return False
+        changed = np.zeros(len(self.static_mobjects), dtype=bool)
+        for i, digest in self.static_mobject_hashes.items():
+            changed[i] = self.static_mobjects[i].get_content_hash() != digest
+        moving = self.moving_mobjects + [
+            self.static_mobjects[i] for i in np.flatnonzero(changed)
+        ]
+        kept = np.flatnonzero(~changed)
+        static = self.static_mobjects
+        if changed.any():
+            static = [static[i] for i in kept]
+        overlapped = self.get_overlapped_mobjects(
+            static,
+            self.static_mobject_order[kept],
+            moving,
+            [self.drawing_order_positions.get(id(mob), np.inf) for mob in moving],
+            boxes=self.static_mobject_boxes[kept],
+        )
+        if not changed.any() and not overlapped.any():
+            return False
+        self.moving_mobjects = self.get_mobjects_in_drawing_order(
+            self.drawing_order,
+            self.moving_mobjects,
+            moving[len(self.moving_mobjects) :]
+            + [self.static_mobjects[i] for i in kept[overlapped]],
+        )
+        # The remaining static mobjects did not change, their boxes and hashes
+        # still hold.
+        kept = kept[~overlapped]
+        positions = {i: j for j, i in enumerate(kept)}
+        self.static_mobjects = [self.static_mobjects[i] for i in kept]
+        self.static_mobject_order = self.static_mobject_order[kept]
+        self.static_mobject_boxes = self.static_mobject_boxes[kept]
+        self.static_mobject_hashes = {
+            positions[i]: digest
+            for i, digest in self.static_mobject_hashes.items()
+            if i in positions
+        }
+        return True
 
     def compile_animations(self, *args, **kwargs):
         """
@@ -941,6 +1210,7 @@ class Scene:
                     self.moving_mobjects,
                     self.static_mobjects,
                 ) = self.get_moving_and_static_mobjects(self.animations)
+                self.watch_static_mobjects()
         self.duration = self.get_run_time(self.animations)
         return self
 
@@ -978,6 +1248,9 @@ class Scene:
         for t in self.time_progression:
             self.update_to_time(t)
             if not skip_rendering and not self.skip_animation_preview:
+                if self.update_moving_and_static_mobjects():
+                    self.renderer.static_image = None
+                    self.renderer.save_static_frame_data(self, self.static_mobjects)
                 self.renderer.render(self, t, self.moving_mobjects)
             if self.stop_condition is not None and self.stop_condition():
                 self.time_progression.close()
@@ -988,6 +1261,12 @@ class Scene:
             animation.clean_up_from_scene(self)
         if not self.renderer.skip_animations:
             self.update_mobjects(0)
+        # The animations copied their mobjects, which share their arrays with
+        # the copies until either modifies them.
+        for mob in list_update(
+            self.mobjects, [animation.mobject for animation in self.animations]
+        ):
+            mob.unshare_arrays()
         self.renderer.static_image = None
         # Closing the progress bar at the end of the play.
         self.time_progression.close()
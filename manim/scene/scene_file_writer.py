@@ -6,7 +6,10 @@ import datetime
 import os
 import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
+from queue import Empty, Queue
 from time import sleep
 
 import numpy as np
@@ -17,6 +20,7 @@ from manim import __version__
 
 from .. import config, logger
 from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
+from ..utils.caching import PartialMovieCache
 from ..utils.file_ops import (
     add_extension_if_not_present,
     add_version_before_extension,
@@ -24,12 +28,142 @@ from ..utils.file_ops import (
     is_gif_format,
     is_png_format,
     is_webm_format,
-    modify_atime,
     write_to_movie,
 )
 from ..utils.sounds import get_full_sound_file_path
 
 
+class FrameWriterThread(threading.Thread):
+    """Write frames to the input of FFMPEG processes on a background thread.
+
+    :meth:`write` copies the frame into one of at most ``queue_size`` reusable
+    buffers and returns immediately, so that the next frame can be rasterized
+    while FFMPEG encodes the previous ones.  When all the buffers are in use,
+    :meth:`write` blocks until one of them has been consumed.
+
+    Parameters
+    ----------
+    stream
+        The binary stream frames are written to by default, usually the stdin
+        of FFMPEG.
+    queue_size : :class:`int`
+        The maximum number of frames waiting to be written.
+    """
+
+    def __init__(self, stream=None, queue_size=4):
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.queue_size = queue_size
+        self.free_buffers = Queue()
+        self.pending_frames = Queue()
+        self.num_buffers = 0
+        self.error = None
+        # Statistics reported in the debug log.
+        self.frames_written = 0
+        self.max_queue_depth = 0
+        self.num_stalls = 0
+        self.stall_time = 0
+
+    def acquire_buffer(self, frame):
+        """Get a free buffer with the shape and type of ``frame``, blocking
+        while all of them are queued."""
+        self.raise_if_failed()
+        try:
+            return self.free_buffers.get_nowait()
+        except Empty:
+            if self.num_buffers < self.queue_size:
+                self.num_buffers += 1
+                return np.empty_like(frame, order="C")
+            start = time.perf_counter()
+            buffer = self.free_buffers.get()
+            self.num_stalls += 1
+            self.stall_time += time.perf_counter() - start
+            return buffer
+
+    def release_buffer(self, buffer):
+        """Give back a buffer obtained with :meth:`acquire_buffer` without
+        writing it."""
+        self.free_buffers.put(buffer)
+
+    def submit(self, buffer, num_frames=1, stream=None):
+        """Queue a buffer obtained with :meth:`acquire_buffer` to be written
+        ``num_frames`` times to ``stream``, after which it is freed."""
+        self.pending_frames.put((buffer, num_frames, stream or self.stream))
+        self.max_queue_depth = max(self.max_queue_depth, self.pending_frames.qsize())
+
+    def write(self, frame, num_frames=1, stream=None):
+        """Queue ``frame`` to be written ``num_frames`` times to ``stream``.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Pixel array of the frame.  It is copied, so it can be modified as
+            soon as this method returns.
+        """
+        buffer = self.acquire_buffer(frame)
+        np.copyto(buffer, frame)
+        self.submit(buffer, num_frames, stream)
+
+    def drain(self):
+        """Block until all the queued frames have been written."""
+        self.pending_frames.join()
+        self.raise_if_failed()
+
+    def run(self):
+        while True:
+            item = self.pending_frames.get()
+            if item is None:
+                self.pending_frames.task_done()
+                return
+            buffer, num_frames, stream = item
+            try:
+                if self.error is None:
+                    for _ in range(num_frames):
+                        stream.write(buffer.data)
+                    self.frames_written += num_frames
+            except Exception as error:
+                self.error = error
+            finally:
+                self.free_buffers.put(buffer)
+                self.pending_frames.task_done()
+
+    def close(self):
+        """Wait until all the queued frames are written and stop the thread."""
+        self.pending_frames.put(None)
+        self.join()
+        logger.debug(
+            "Frame writer: %(frames)d frames written, max queue depth "
+            "%(depth)d/%(size)d, rendering blocked %(stalls)d times for %(time).3fs",
+            {
+                "frames": self.frames_written,
+                "depth": self.max_queue_depth,
+                "size": self.queue_size,
+                "stalls": self.num_stalls,
+                "time": self.stall_time,
+            },
+        )
+        self.raise_if_failed()
+
+    def raise_if_failed(self):
+        if self.error is not None:
+            raise self.error
+
+
+def frames_are_equal(frame, other, num_bands=16):
+    """Whether two pixel arrays hold the same image.
+
+    The arrays are compared band by band, so that frames that differ are
+    usually told apart without reading them entirely.
+    """
+    if frame.shape != other.shape:
+        return False
+    step = max(1, len(frame) // num_bands)
+    return all(
+        np.array_equal(frame[i : i + step], other[i : i + step])
+        for i in range(0, len(frame), step)
+    )
+
+
 class SceneFileWriter(object):
     """
     SceneFileWriter is the object that actually writes the animations
@@ -45,9 +179,18 @@ class SceneFileWriter(object):
             The file-type extension of the outputted video.
         "partial_movie_files"
             List of all the partial-movie files.
+        "frame_queue_size" (int=4)
+            Maximum number of frames waiting to be encoded by FFMPEG while
+            the next ones are rendered.
+        "min_still_segment_frames" (int=30)
+            Minimum number of identical consecutive frames encoded as a
+            still segment instead of being piped one by one.
 
     """
 
+    frame_queue_size = 4
+    min_still_segment_frames = 30
+
     def __init__(self, renderer, scene_name, **kwargs):
         self.renderer = renderer
         self.stream_lock = False
@@ -73,6 +216,8 @@ class SceneFileWriter(object):
             module_name = config.get_dir("input_file").stem
         else:
             module_name = ""
+        self.scene_name = scene_name
+        self.module_name = module_name
 
         if config["output_file"] and not config["write_all"]:
             default_name = config.get_dir("output_file")
@@ -111,6 +256,7 @@ class SceneFileWriter(object):
                     module_name=module_name,
                 )
             )
+            self.partial_movie_cache = PartialMovieCache(self.partial_movie_directory)
 
     def add_partial_movie_file(self, hash_animation):
         """Adds a new partial movie file path to scene.partial_movie_files from an hash. This method will compute the path from the hash.
@@ -268,6 +414,7 @@ class SceneFileWriter(object):
         """
         if write_to_movie() and allow_write:
             self.close_movie_pipe()
+            self.add_partial_movie_file_to_cache(self.partial_movie_file_path)
 
     def write_frame(self, frame_or_renderer):
         """
@@ -280,14 +427,15 @@ class SceneFileWriter(object):
             Pixel array of the frame.
         """
         if config.renderer == "opengl":
-            renderer = frame_or_renderer
-            self.writing_process.stdin.write(
-                renderer.get_raw_frame_buffer_object_data()
-            )
+            # The frame is read back while the next one renders, and written
+            # by a later call, or when the movie pipe is closed.
+            frame = frame_or_renderer.read_frame()
+            if frame is not None:
+                self.writing_process.stdin.write(frame)
         else:
             frame = frame_or_renderer
             if write_to_movie():
-                self.writing_process.stdin.write(frame.tobytes())
+                self.write_movie_frame(frame)
             if is_png_format() and not config["dry_run"]:
                 target_dir, extension = os.path.splitext(self.image_file_path)
                 Image.fromarray(frame).save(
@@ -342,7 +490,7 @@ class SceneFileWriter(object):
         frame in the default image directory.
         """
         if write_to_movie():
-            if hasattr(self, "writing_process"):
+            if getattr(self, "writing_process", None) is not None:
                 self.writing_process.terminate()
             self.combine_movie_files(partial_movie_files=partial_movie_files)
             if config["flush_cache"]:
@@ -358,11 +506,44 @@ class SceneFileWriter(object):
         Used internally by Manim to initialise
         FFMPEG and begin writing to FFMPEG's input
         buffer.
+
+        With the Cairo renderer, the FFMPEG processes are started lazily:
+        runs of at least ``min_still_segment_frames`` identical frames are
+        encoded as separate still segments from a single frame, and the
+        segments are concatenated into the partial movie file by
+        :meth:`close_movie_pipe`.
         """
         if file_path is None:
             file_path = self.partial_movie_files[self.renderer.num_plays]
         self.partial_movie_file_path = file_path
 
+        if config.renderer == "opengl":
+            self.writing_process = self.open_ffmpeg_process(file_path)
+            return
+        self.writing_process = None
+        self.movie_segments = []
+        self.still_segment_processes = []
+        self.held_frame = None
+        self.num_held_frames = 0
+        self.frame_writer = FrameWriterThread(queue_size=self.frame_queue_size)
+        self.frame_writer.start()
+
+    def open_ffmpeg_process(self, file_path, num_still_frames=None):
+        """Start an FFMPEG process encoding the raw frames piped to its stdin.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The movie file to write.
+        num_still_frames : :class:`int`, optional
+            If given, a single frame is expected, which is repeated this many
+            times in the movie.
+
+        Returns
+        -------
+        :class:`subprocess.Popen`
+            The FFMPEG process.
+        """
         fps = config["frame_rate"]
         if fps == int(fps):  # fps is integer
             fps = int(fps)
@@ -393,6 +574,9 @@ class SceneFileWriter(object):
         ]
         if config.renderer == "opengl":
             command += ["-vf", "vflip"]
+        elif num_still_frames is not None:
+            # Clone the only frame piped until the segment has the right length.
+            command += ["-vf", f"tpad=stop_mode=clone:stop={num_still_frames - 1}"]
         if is_webm_format():
             command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
         # .mov format
@@ -401,14 +585,104 @@ class SceneFileWriter(object):
         else:
             command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
         command += [file_path]
-        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write_movie_frame(self, frame):
+        """Write a frame of the current animation, run-length encoding
+        repeated frames.
+
+        A frame identical to the previous one is only counted.  Once a
+        different frame comes in, the previous one is sent to FFMPEG as many
+        times as it was repeated, or as a still segment if it was held long
+        enough.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            Pixel array of the frame.
+        """
+        if self.held_frame is not None and frames_are_equal(self.held_frame, frame):
+            self.num_held_frames += 1
+            return
+        self.flush_held_frame()
+        self.held_frame = self.frame_writer.acquire_buffer(frame)
+        np.copyto(self.held_frame, frame)
+        self.num_held_frames = 1
+
+    def flush_held_frame(self):
+        """Send the held frame to FFMPEG, see :meth:`write_movie_frame`."""
+        if self.held_frame is None:
+            return
+        if self.num_held_frames >= self.min_still_segment_frames:
+            self.close_movie_segment()
+            process = self.open_ffmpeg_process(
+                self.get_next_segment_path(), num_still_frames=self.num_held_frames
+            )
+            process.stdin.write(self.held_frame.data)
+            process.stdin.close()
+            self.frame_writer.release_buffer(self.held_frame)
+            # The segment is encoded in the background, see close_movie_pipe.
+            self.still_segment_processes.append(process)
+        else:
+            if self.writing_process is None:
+                self.writing_process = self.open_ffmpeg_process(
+                    self.get_next_segment_path()
+                )
+            self.frame_writer.submit(
+                self.held_frame, self.num_held_frames, self.writing_process.stdin
+            )
+        self.held_frame = None
+        self.num_held_frames = 0
+
+    def get_next_segment_path(self):
+        """Register and return the path of the next segment of the current
+        partial movie file."""
+        root, extension = os.path.splitext(self.partial_movie_file_path)
+        segment = f"{root}_segment{len(self.movie_segments):03}{extension}"
+        self.movie_segments.append(segment)
+        return segment
+
+    def close_movie_segment(self):
+        """Finish encoding the segment of non-still frames, if any."""
+        if self.writing_process is None:
+            return
+        self.frame_writer.drain()
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.writing_process = None
 
     def close_movie_pipe(self):
         """
         Used internally by Manim to gracefully stop writing to FFMPEG's input buffer
         """
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        if config.renderer == "opengl":
+            for frame in self.renderer.get_pending_frames():
+                self.writing_process.stdin.write(frame)
+            self.writing_process.stdin.close()
+            self.writing_process.wait()
+        else:
+            self.flush_held_frame()
+            self.close_movie_segment()
+            self.frame_writer.close()
+            for process in self.still_segment_processes:
+                process.wait()
+            if not self.movie_segments:
+                # Nothing was written, still let FFMPEG produce the file.
+                self.writing_process = self.open_ffmpeg_process(
+                    self.get_next_segment_path()
+                )
+                self.close_movie_segment()
+            if len(self.movie_segments) == 1:
+                os.replace(self.movie_segments[0], self.partial_movie_file_path)
+            else:
+                logger.debug(
+                    f"Animation {self.renderer.num_plays} : Combining "
+                    f"{len(self.movie_segments)} segments, "
+                    f"{len(self.still_segment_processes)} of them still"
+                )
+                self.concatenate_movie_files(
+                    self.movie_segments, self.partial_movie_file_path
+                )
 
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
@@ -430,11 +704,28 @@ class SceneFileWriter(object):
         """
         if not hasattr(self, "partial_movie_directory") or not write_to_movie():
             return False
-        path = os.path.join(
-            self.partial_movie_directory,
-            f"{hash_invocation}{config['movie_file_extension']}",
+        return self.partial_movie_cache.contains(
+            f"{hash_invocation}{config['movie_file_extension']}"
+        )
+
+    def add_partial_movie_file_to_cache(self, file_path):
+        """Index a partial movie file once it has been completely written, so
+        that it can be reused by :meth:`is_already_cached`.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The partial movie file, in :attr:`partial_movie_directory`.
+        """
+        if not hasattr(self, "partial_movie_cache"):
+            return
+        self.partial_movie_cache.add(
+            os.path.basename(file_path),
+            scene_name=self.scene_name,
+            module_name=self.module_name,
+            settings=f"{config['pixel_width']}x{config['pixel_height']} "
+            f"{config['frame_rate']}fps {config.renderer}",
         )
-        return os.path.exists(path)
 
     def combine_movie_files(self, partial_movie_files=None):
         """
@@ -456,19 +747,16 @@ class SceneFileWriter(object):
 
         # Write a file partial_file_list.txt containing all partial movie
         # files. This is used by FFMPEG.
+        # The directory may be shared with other scenes, see PartialMovieCache.
         file_list = os.path.join(
-            self.partial_movie_directory, "partial_movie_file_list.txt"
+            self.partial_movie_directory,
+            f"{self.scene_name}_partial_movie_file_list.txt",
         )
         logger.debug(
             f"Partial movie files to combine ({len(partial_movie_files)} files): %(p)s",
             {"p": partial_movie_files[:5]},
         )
-        with open(file_list, "w") as fp:
-            fp.write("# This file is used internally by FFMPEG.\n")
-            for pf_path in partial_movie_files:
-                if os.name == "nt":
-                    pf_path = pf_path.replace("\\", "/")
-                fp.write(f"file 'file:{pf_path}'\n")
+        self.write_concat_file_list(file_list, partial_movie_files)
         movie_file_path = self.movie_file_path
         commands = [
             FFMPEG_BIN,
@@ -550,44 +838,133 @@ class SceneFileWriter(object):
             self.gif_file_path if is_gif_format() else movie_file_path
         )
         if write_to_movie():
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+            # Mark the files as used so that if we have to clean the cache we remove the ones used the longest ago.
+            self.partial_movie_cache.touch(
+                [os.path.basename(file_path) for file_path in partial_movie_files]
+            )
 
-    def clean_cache(self):
-        """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
+    def write_concat_file_list(self, file_list, movie_files):
+        """Write the list of files read by FFMPEG's concat demuxer.
+
+        Parameters
+        ----------
+        file_list : :class:`str`
+            Path of the list to write.
+        movie_files : List[:class:`str`]
+            Paths of the movie files to concatenate, in order.
+        """
+        with open(file_list, "w") as fp:
+            fp.write("# This file is used internally by FFMPEG.\n")
+            for pf_path in movie_files:
+                if os.name == "nt":
+                    pf_path = pf_path.replace("\\", "/")
+                fp.write(f"file 'file:{pf_path}'\n")
+
+    def get_frame_chunk_file_paths(self, num_chunks, file_path=None):
+        """Get the paths of the files the frame chunks of the current animation
+        are written to when it is rendered by several processes.
+
+        Parameters
+        ----------
+        num_chunks : :class:`int`
+            The number of chunks the animation is split into.
+        file_path : :class:`str`, optional
+            The partial movie file of the animation.  Defaults to the one of
+            the current animation.
+
+        Returns
+        -------
+        List[:class:`str`]
+            One path per chunk, in playing order.
+        """
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        root, extension = os.path.splitext(file_path)
+        return [f"{root}_chunk{i:03}{extension}" for i in range(num_chunks)]
+
+    def concatenate_movie_files(self, movie_files, file_path):
+        """Concatenate movie files encoded with the same settings into
+        ``file_path`` without re-encoding them, and delete them.
+
+        Parameters
+        ----------
+        movie_files : List[:class:`str`]
+            The files to concatenate, in order.
+        file_path : :class:`str`
+            The movie file to write.
+        """
+        file_list = os.path.splitext(file_path)[0] + "_list.txt"
+        self.write_concat_file_list(file_list, movie_files)
+        commands = [
+            FFMPEG_BIN,
+            "-y",  # overwrite output file if it exists
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            file_list,
+            "-loglevel",
+            config["ffmpeg_loglevel"].lower(),
+            "-metadata",
+            f"comment=Rendered with Manim Community v{__version__}",
+            "-nostdin",
+            "-c",
+            "copy",
+            file_path,
         ]
-        if len(cached_partial_movies) > config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                cached_partial_movies,
-                key=os.path.getatime,
-            )[:number_files_to_delete]
-            # oldest_file_path = min(cached_partial_movies, key=os.path.getatime)
-            for file_to_delete in oldest_files_to_delete:
-                os.remove(file_to_delete)
+        subprocess.run(commands, check=True)
+        for movie_file in [file_list, *movie_files]:
+            os.remove(movie_file)
+
+    def combine_frame_chunks(self, chunk_files, file_path=None):
+        """Concatenate the frame chunks of an animation into its partial movie
+        file, and delete the chunks.
+
+        Parameters
+        ----------
+        chunk_files : List[:class:`str`]
+            The chunk files, as returned by :meth:`get_frame_chunk_file_paths`.
+        file_path : :class:`str`, optional
+            The partial movie file of the animation.  Defaults to the one of
+            the current animation.
+        """
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.concatenate_movie_files(chunk_files, file_path)
+        self.add_partial_movie_file_to_cache(file_path)
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s "
+            f"from {len(chunk_files)} chunks",
+            {"path": f"'{file_path}'"},
+        )
+
+    def clean_cache(self):
+        """Will clean the cache by removing the partial_movie_files used by manim the longest ago,
+        until there are at most ``config["max_files_cached"]`` of them, taking at most
+        ``config["max_cache_size"]`` megabytes."""
+        max_size = config["max_cache_size"] * 1024 ** 2
+        evicted = self.partial_movie_cache.evict(
+            max_files=config["max_files_cached"],
+            max_size=max_size,
+            keep=[
+                os.path.basename(file_path)
+                for file_path in self.partial_movie_files
+                if file_path is not None
+            ],
+        )
+        if evicted:
             logger.info(
-                f"The partial movie directory is full (> {config['max_files_cached']} files). Therefore, manim has removed {number_files_to_delete} file(s) used by it the longest ago."
-                + "You can change this behaviour by changing max_files_cached in config."
+                f"The partial movie directory is full (> {config['max_files_cached']} files or "
+                f"> {config['max_cache_size']} MB). Therefore, manim has removed {len(evicted)} file(s) used by it the longest ago."
+                + "You can change this behaviour by changing max_files_cached and max_cache_size in config."
             )
 
     def flush_cache_directory(self):
         """Delete all the cached partial movie files"""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        for f in cached_partial_movies:
-            os.remove(f)
+        num_deleted = self.partial_movie_cache.flush()
         logger.info(
-            f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in %(par_dir)s.",
+            f"Cache flushed. {num_deleted} file(s) deleted in %(par_dir)s.",
             {"par_dir": self.partial_movie_directory},
         )
 
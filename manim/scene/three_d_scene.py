@@ -240,6 +240,21 @@ class ThreeDScene(Scene):
             return self.mobjects
         return moving_mobjects
 
+    def get_mobject_bounding_boxes(self, mobjects):
+        """
+        This method considers every mobject to cover the whole frame, as
+        mobjects are projected and sorted by depth when they are drawn.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects.
+        """
+        boxes = np.empty((len(mobjects), 4))
+        boxes[:, :2] = -np.inf
+        boxes[:, 2:] = np.inf
+        return boxes
+
     def add_fixed_orientation_mobjects(self, *mobjects, **kwargs):
         """
         This method is used to prevent the rotation and tilting
@@ -3,6 +3,7 @@
 __all__ = [
     "bezier",
     "partial_bezier_points",
+    "partial_bezier_curves",
     "partial_quadratic_bezier_points",
     "interpolate",
     "integer_interpolate",
@@ -79,6 +80,42 @@ def partial_bezier_points(points: np.ndarray, a: float, b: float) -> np.ndarray:
     return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
 
 
+def partial_bezier_curves(
+    curves: np.ndarray, a: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of :func:`partial_bezier_points`, for many curves at once.
+
+    Every control point of the portion of a curve on :math:`[a, b]` is computed
+    with a de Casteljau evaluation where the first steps use :math:`b` and the
+    others :math:`a` (the blossom of the curve), for all the curves at once.
+
+    Parameters
+    ----------
+    curves : np.ndarray
+        The control points of the curves, of shape ``(n, degree + 1, dim)``.
+    a : np.ndarray
+        The lower bound of the portion of each curve, of shape ``(n,)``.
+    b : np.ndarray
+        The upper bound of the portion of each curve, of shape ``(n,)``.
+
+    Returns
+    -------
+    np.ndarray
+        The control points of the portions, of the same shape as ``curves``.
+    """
+    curves = np.asarray(curves, dtype=float)
+    degree = curves.shape[1] - 1
+    a = np.asarray(a, dtype=float).reshape(-1, 1, 1)
+    b = np.asarray(b, dtype=float).reshape(-1, 1, 1)
+    result = np.empty_like(curves)
+    for i in range(degree + 1):
+        points = curves
+        for t in [b] * i + [a] * (degree - i):
+            points = (1 - t) * points[:, :-1] + t * points[:, 1:]
+        result[:, i] = points[:, 0]
+    return result
+
+
 # Shortened version of partial_bezier_points just for quadratics,
 # since this is called a fair amount
 def partial_quadratic_bezier_points(points, a, b):
@@ -1,3 +1,9 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
 from .. import config, logger
 from ..utils.hashing import get_hash_from_play_call
 
@@ -58,3 +64,195 @@ def handle_caching_play(func):
         func(self, scene, *args, **kwargs)
 
     return wrapper
+
+
+class PartialMovieCache:
+    """Index of the partial movie files cached in a directory.
+
+    The files are named after the hash of the ``play`` call that produced
+    them, so that any scene, from any file, playing the same animation with
+    the same camera settings reuses the same file when they share the
+    directory (see ``config.partial_movie_dir``).
+
+    The index is an SQLite database stored in the directory next to the
+    files.  It records the size of every file, when it was last used, and the
+    scene, module and render settings it was first rendered with, so that the
+    cache can be bounded without listing and stating the whole directory.
+    Only files that have been completely written are indexed.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory containing the partial movie files.
+    """
+
+    index_file_name = "partial_movie_index.db"
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.index_path = self.directory / self.index_file_name
+        is_new = not self.index_path.exists()
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS partial_movies ("
+                "file_name TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, "
+                "last_used REAL NOT NULL, "
+                "scene_name TEXT, "
+                "module_name TEXT, "
+                "settings TEXT)"
+            )
+        if is_new:
+            self._index_existing_files()
+
+    @contextmanager
+    def _transaction(self):
+        # A connection per transaction, so that the index can be shared by
+        # forked processes and by several renders at once.
+        connection = sqlite3.connect(str(self.index_path), timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _index_existing_files(self):
+        """Add the files cached before the index existed, last used first."""
+        rows = []
+        for entry in os.scandir(self.directory):
+            if (
+                entry.is_file()
+                and not entry.name.startswith(self.index_file_name)
+                and not entry.name.endswith(".txt")
+            ):
+                stat = entry.stat()
+                rows.append((entry.name, stat.st_size, stat.st_atime))
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO partial_movies (file_name, size, last_used) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def contains(self, file_name):
+        """Whether ``file_name`` is cached.  It is then marked as used.
+
+        Parameters
+        ----------
+        file_name : :class:`str`
+            The name of the partial movie file, in the cache directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file is indexed and still exists.
+        """
+        with self._transaction() as connection:
+            indexed = connection.execute(
+                "SELECT 1 FROM partial_movies WHERE file_name = ?", (file_name,)
+            ).fetchone()
+            if indexed is None:
+                return False
+            if not (self.directory / file_name).exists():
+                connection.execute(
+                    "DELETE FROM partial_movies WHERE file_name = ?", (file_name,)
+                )
+                return False
+            connection.execute(
+                "UPDATE partial_movies SET last_used = ? WHERE file_name = ?",
+                (time.time(), file_name),
+            )
+        return True
+
+    def add(self, file_name, scene_name=None, module_name=None, settings=None):
+        """Index a partial movie file once it has been written.
+
+        Parameters
+        ----------
+        file_name : :class:`str`
+            The name of the partial movie file, in the cache directory.
+        scene_name, module_name : :class:`str`, optional
+            Where the animation was rendered from.
+        settings : :class:`str`, optional
+            A description of the render settings.
+        """
+        size = (self.directory / file_name).stat().st_size
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO partial_movies VALUES (?, ?, ?, ?, ?, ?)",
+                (file_name, size, time.time(), scene_name, module_name, settings),
+            )
+
+    def touch(self, file_names):
+        """Mark files as used now, so that they are evicted last."""
+        now = time.time()
+        with self._transaction() as connection:
+            connection.executemany(
+                "UPDATE partial_movies SET last_used = ? WHERE file_name = ?",
+                [(now, file_name) for file_name in file_names],
+            )
+
+    def get_usage(self):
+        """Return the number of cached files and their total size in bytes."""
+        with self._transaction() as connection:
+            num_files, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM partial_movies"
+            ).fetchone()
+        return num_files, size
+
+    def evict(self, max_files=float("inf"), max_size=float("inf"), keep=()):
+        """Delete the files used the longest ago until the cache holds at most
+        ``max_files`` files and ``max_size`` bytes.
+
+        Parameters
+        ----------
+        max_files : :class:`int`
+            Maximum number of files to keep.
+        max_size : :class:`int`
+            Maximum total size of the files to keep, in bytes.
+        keep : Iterable[:class:`str`]
+            Names of files that must not be deleted, even if the cache stays
+            over its limits.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The names of the deleted files.
+        """
+        keep = set(keep)
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT file_name, size FROM partial_movies "
+                "ORDER BY last_used DESC, rowid DESC"
+            ).fetchall()
+            num_files = len(rows)
+            total_size = sum(size for _, size in rows)
+            evicted = []
+            for file_name, size in reversed(rows):
+                if num_files <= max_files and total_size <= max_size:
+                    break
+                if file_name in keep:
+                    continue
+                evicted.append(file_name)
+                num_files -= 1
+                total_size -= size
+            connection.executemany(
+                "DELETE FROM partial_movies WHERE file_name = ?",
+                [(file_name,) for file_name in evicted],
+            )
+        for file_name in evicted:
+            try:
+                os.remove(self.directory / file_name)
+            except FileNotFoundError:
+                pass
+        return evicted
+
+    def flush(self):
+        """Delete all the cached files.
+
+        Returns
+        -------
+        :class:`int`
+            The number of deleted files.
+        """
+        return len(self.evict(max_files=0, max_size=0))
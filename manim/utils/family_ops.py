@@ -25,7 +25,11 @@ def restructure_list_to_exclude_certain_family_members(mobject_list, to_remove):
         for mob in list_to_examine:
             if mob in set_to_remove:
                 continue
-            intersect = set_to_remove.intersection(mob.get_family())
+            intersect = (
+                set_to_remove.intersection(mob.get_family())
+                if mob.submobjects
+                else None
+            )
             if intersect:
                 add_safe_mobjects_from_list(mob.submobjects, intersect)
             else:
@@ -2,6 +2,7 @@
 
 import collections
 import copy
+import hashlib
 import inspect
 import json
 import typing
@@ -11,13 +12,49 @@ from types import FunctionType, MappingProxyType, MethodType, ModuleType
 from typing import Any
 
 import numpy as np
+from colour import Color
 
 from .. import config, logger
 
 # Sometimes there are elements that are not suitable for hashing (too long or run-dependent)
 # This is used to filter them out.
 KEYS_TO_FILTER_OUT = set(
-    ["original_id", "background", "pixel_array", "pixel_array_to_cairo_context"]
+    [
+        "original_id",
+        "background",
+        "pixel_array",
+        "pixel_array_to_cairo_context",
+        "layers",
+        "layers_size",
+        "layer_keys",
+        "previous_layer_keys",
+        "packed_interpolation",
+    ]
+)
+
+# Attributes of a mobject that are not part of what it displays, or that are
+# hashed separately (submobjects and updaters), and that are therefore left out
+# of its content digest.
+CONTENT_KEYS_TO_FILTER_OUT = set(
+    [
+        "_content_hash",
+        "submobjects",
+        "updaters",
+        "updating_suspended",
+        "parents",
+        "_parents",
+        "family",
+        "_family",
+        "_family_with_points",
+        "_compiled_updaters",
+        "_family_has_updaters",
+        "_mipmaps",
+        "target",
+        "original_id",
+        "point_hash",
+        "data",
+        "needs_new_bounding_box",
+    ]
 )
 
 
@@ -167,7 +204,11 @@ class _CustomEncoder(json.JSONEncoder):
             Python object that JSON encoder will recognize
 
         """
-        if not (isinstance(obj, ModuleType)) and isinstance(
+        if hasattr(type(obj), "get_content_hash"):
+            # Mobjects keep a digest of what they display, which is much cheaper
+            # than serializing all of their attributes.
+            return obj.get_content_hash()
+        elif not (isinstance(obj, ModuleType)) and isinstance(
             obj, (MethodType, FunctionType)
         ):
             cvars = inspect.getclosurevars(obj)
@@ -291,6 +332,82 @@ def get_json(obj):
     return json.dumps(obj, cls=_CustomEncoder)
 
 
+def _update_digest(digest, value):
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            _update_digest(digest, value.tolist())
+            return
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif value is None or isinstance(
+        value, (bool, int, float, complex, str, bytes, np.generic)
+    ):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, Color):
+        digest.update(f"Color:{value.hex_l};".encode())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[{len(value)}]".encode())
+        for element in value:
+            _update_digest(digest, element)
+    elif isinstance(value, dict):
+        digest.update(f"dict[{len(value)}]".encode())
+        for key, element in value.items():
+            _update_digest(digest, key)
+            _update_digest(digest, element)
+    else:
+        # Other mobjects referenced by an attribute are only displayed if they
+        # are submobjects, and functions only matter through the points they
+        # generated, so only the type is taken into account.
+        digest.update(f"<{type(value).__qualname__}>".encode())
+
+
+def get_content_digest(mobject) -> bytes:
+    """Compute a digest of the attributes of ``mobject`` that define what it displays.
+
+    The points, the style arrays and every other attribute holding plain data
+    are hashed as raw bytes, without going through JSON.  Submobjects and
+    updaters are not part of the digest, see :meth:`.Mobject.get_content_hash`.
+
+    Parameters
+    ----------
+    mobject : :class:`~.Mobject`
+        The mobject to hash.
+
+    Returns
+    -------
+    :class:`bytes`
+        The digest.
+    """
+    digest = hashlib.blake2b(type(mobject).__qualname__.encode(), digest_size=16)
+    for key, value in mobject.__dict__.items():
+        if key in CONTENT_KEYS_TO_FILTER_OUT:
+            continue
+        digest.update(key.encode())
+        _update_digest(digest, value)
+    return digest.digest()
+
+
+def get_mobject_hash(mobject) -> str:
+    """Hash a mobject added to the scene, including the updaters of its family.
+
+    Parameters
+    ----------
+    mobject : :class:`~.Mobject`
+        The mobject to hash.
+
+    Returns
+    -------
+    :class:`str`
+        The hash.
+    """
+    if not hasattr(type(mobject), "get_content_hash"):
+        return get_json(mobject)
+    updaters = mobject.get_family_updaters()
+    if not updaters:
+        return mobject.get_content_hash()
+    return f"{mobject.get_content_hash()}{get_json(updaters)}"
+
+
 def get_hash_from_play_call(
     scene_object, camera_object, animations_list, current_mobjects_list
 ) -> str:
@@ -320,7 +437,7 @@ def get_hash_from_play_call(
     _Memoizer.mark_as_processed(scene_object)
     camera_json = get_json(camera_object)
     animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
+    current_mobjects_list_json = [get_mobject_hash(x) for x in current_mobjects_list]
     hash_camera, hash_animations, hash_current_mobjects = [
         zlib.crc32(repr(json_val).encode())
         for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
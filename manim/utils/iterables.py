@@ -1,6 +1,7 @@
 """Operations on iterables."""
 
 __all__ = [
+    "OrderedIdentitySet",
     "remove_list_redundancies",
     "list_update",
     "list_difference_update",
@@ -22,6 +23,69 @@ import itertools as it
 import numpy as np
 
 
+class OrderedIdentitySet:
+    """A set of objects compared by identity, which remembers the order in
+    which they were added.
+
+    Unlike a list, testing for membership and removing an object take
+    constant time, which matters for the bookkeeping of scenes with many
+    mobjects.  Unlike a :class:`set`, the objects do not need to be hashable,
+    and are never compared with ``==``.
+
+    Parameters
+    ----------
+    objects : Iterable
+        The initial objects.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from manim.utils.iterables import OrderedIdentitySet
+        >>> a, b = [1], [1]
+        >>> objects = OrderedIdentitySet([a, b, a])
+        >>> len(objects), a in objects, [1] in objects
+        (2, True, False)
+        >>> objects.discard(a)
+        >>> list(objects)
+        [[1]]
+    """
+
+    def __init__(self, objects=()):
+        self._objects = {}
+        self.update(objects)
+
+    def __contains__(self, obj):
+        return id(obj) in self._objects
+
+    def __iter__(self):
+        return iter(self._objects.values())
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+    def add(self, obj):
+        """Add an object, at the end unless it is already present."""
+        self._objects.setdefault(id(obj), obj)
+
+    def update(self, objects):
+        """Add several objects, see :meth:`add`."""
+        for obj in objects:
+            self._objects.setdefault(id(obj), obj)
+
+    def discard(self, obj):
+        """Remove an object if it is present."""
+        self._objects.pop(id(obj), None)
+
+    def intersection(self, objects):
+        """Return the objects present in both ``self`` and ``objects``, in the
+        order of ``objects``."""
+        return OrderedIdentitySet(obj for obj in objects if id(obj) in self._objects)
+
+
 def resize_array(nparray, length):
     if len(nparray) == length:
         return nparray
@@ -65,16 +129,27 @@ def remove_list_redundancies(lst):
     return reversed_result
 
 
+def _as_container(lst):
+    # Membership tests in sets take constant time, but the elements have to
+    # be hashable.
+    try:
+        return set(lst)
+    except TypeError:
+        return lst
+
+
 def list_update(l1, l2):
     """
     Used instead of list(set(l1).update(l2)) to maintain order,
     making sure duplicates are removed from l1, not l2.
     """
-    return [e for e in l1 if e not in l2] + list(l2)
+    container = _as_container(l2)
+    return [e for e in l1 if e not in container] + list(l2)
 
 
 def list_difference_update(l1, l2):
-    return [e for e in l1 if e not in l2]
+    container = _as_container(l2)
+    return [e for e in l1 if e not in container]
 
 
 def all_elements_are_instances(iterable, Class):
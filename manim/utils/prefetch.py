@@ -0,0 +1,230 @@
+"""Discover and compile the tex expressions and texts of scenes before rendering.
+
+Tex expressions and texts are compiled to SVG files lazily, when the
+corresponding mobjects are created in :meth:`.Scene.construct`, one after
+the other.  With ``--prefetch``, the scenes are first constructed without
+rendering anything, while the expressions and texts they request are only
+recorded, and backed by a placeholder SVG file.  They are then compiled all
+at once, the expressions sharing a template in batches (see
+:func:`~.tex_file_writing.tex_to_svg_files`), in a pool of worker processes.
+The real render finally finds all of them in ``tex_dir`` and ``text_dir``.
+
+Recording is best effort: code relying on the shape of a placeholder may
+fail, in which case the construction of the scene stops there, and whatever
+is requested afterwards is compiled during the real render as usual.
+
+"""
+
+__all__ = ["prefetch_scenes", "recording", "is_recording"]
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
+
+from .. import config, logger, tempconfig
+
+# Requests of the scenes being recorded, None when not recording.
+_requests = None
+
+# Compilation jobs, filled by the parent process right before the workers are
+# forked so that they inherit the requests instead of having to pickle them.
+_jobs = []
+
+PLACEHOLDER_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1">
+<path d="M 0 0 L 1 0 L 1 1 L 0 1 Z"/>
+</svg>
+"""
+
+
+class PrefetchRequests:
+    """The tex expressions and texts requested while recording.
+
+    Attributes
+    ----------
+    tex : Dict[Tuple, Tuple[:class:`~.TexTemplate`, Dict[Tuple[:class:`str`, Optional[:class:`str`]], None]]]
+        For every distinct template, the template and the requested pairs of
+        expression and environment, in order.
+    text : Dict[:class:`str`, Callable[[], :class:`str`]]
+        For every requested SVG file of a text, a function writing it.
+    """
+
+    def __init__(self):
+        self.tex = {}
+        self.text = {}
+        self.placeholder_file = None
+
+    def __len__(self):
+        return sum(len(expressions) for _, expressions in self.tex.values()) + len(
+            self.text
+        )
+
+    def get_placeholder_file(self):
+        if self.placeholder_file is None:
+            fd, self.placeholder_file = tempfile.mkstemp(suffix=".svg")
+            with os.fdopen(fd, "w") as f:
+                f.write(PLACEHOLDER_SVG)
+        return self.placeholder_file
+
+    def add_tex(self, expression, environment, tex_template):
+        key = (tex_template.tex_compiler, tex_template.output_format, tex_template.body)
+        _, expressions = self.tex.setdefault(key, (tex_template, {}))
+        expressions[(expression, environment)] = None
+        return self.get_placeholder_file()
+
+    def add_text(self, file_name, write_svg):
+        self.text.setdefault(file_name, write_svg)
+        return self.get_placeholder_file()
+
+
+def is_recording():
+    """Whether the requested tex expressions and texts are being recorded
+    instead of compiled."""
+    return _requests is not None
+
+
+def record_tex(expression, environment, tex_template):
+    """Record a tex expression, see :func:`~.tex_file_writing.tex_to_svg_file`.
+
+    Returns
+    -------
+    :class:`str`
+        Path to a placeholder SVG file.
+    """
+    return _requests.add_tex(expression, environment, tex_template)
+
+
+def record_text(file_name, write_svg):
+    """Record a text whose SVG file ``write_svg`` writes to ``file_name``.
+
+    Returns
+    -------
+    :class:`str`
+        Path to a placeholder SVG file.
+    """
+    return _requests.add_text(file_name, write_svg)
+
+
+@contextmanager
+def recording():
+    """Context manager recording the tex expressions and texts requested
+    within it, instead of compiling them.
+
+    Yields
+    ------
+    :class:`PrefetchRequests`
+        The recorded requests.
+    """
+    global _requests
+    _requests = requests = PrefetchRequests()
+    try:
+        yield requests
+    finally:
+        _requests = None
+        if requests.placeholder_file is not None:
+            os.remove(requests.placeholder_file)
+
+
+def get_compilation_jobs(requests, num_workers):
+    """Split ``requests`` into compilation jobs for ``num_workers`` workers."""
+    from .tex_file_writing import tex_to_svg_files
+
+    jobs = []
+    for tex_template, expressions in requests.tex.values():
+        expressions = list(expressions)
+        batch_size = -(-len(expressions) // num_workers)
+        for start in range(0, len(expressions), batch_size):
+            jobs.append(
+                partial(
+                    tex_to_svg_files,
+                    expressions[start : start + batch_size],
+                    tex_template,
+                )
+            )
+    jobs.extend(requests.text.values())
+    return jobs
+
+
+def _run_job(index):
+    try:
+        _jobs[index]()
+        return None
+    except Exception:
+        return traceback.format_exc()
+
+
+def compile_requests(requests):
+    """Compile recorded requests, in parallel when possible.
+
+    Failures are only logged, the real render then raises them with the
+    usual error messages.
+
+    Parameters
+    ----------
+    requests : :class:`PrefetchRequests`
+        The requests to compile.
+    """
+    num_workers = max(1, config["jobs"] or os.cpu_count() or 1)
+    _jobs[:] = get_compilation_jobs(requests, num_workers)
+    try:
+        if (
+            num_workers > 1
+            and len(_jobs) > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            with ProcessPoolExecutor(
+                max_workers=min(num_workers, len(_jobs)),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                futures = [executor.submit(_run_job, i) for i in range(len(_jobs))]
+                errors = [future.result() for future in as_completed(futures)]
+        else:
+            errors = [_run_job(i) for i in range(len(_jobs))]
+    finally:
+        _jobs.clear()
+    for error in errors:
+        if error is not None:
+            logger.debug("Prefetching failed:\n%(error)s", {"error": error})
+
+
+def prefetch_scenes(scene_classes):
+    """Construct ``scene_classes`` without rendering them, and compile all the
+    tex expressions and texts they request.
+
+    Parameters
+    ----------
+    scene_classes : List[Type[:class:`.Scene`]]
+        The scenes about to be rendered.
+    """
+    start = time.perf_counter()
+    dry_run = {
+        "write_to_movie": False,
+        "write_all": False,
+        "save_last_frame": False,
+        "save_pngs": False,
+        "save_as_gif": False,
+        # Skip all the animations, only the final state of the mobjects matters.
+        "from_animation_number": sys.maxsize,
+        "progress_bar": "none",
+    }
+    with recording() as requests:
+        for SceneClass in scene_classes:
+            with tempconfig(dry_run):
+                try:
+                    SceneClass().render()
+                except Exception:
+                    logger.debug(
+                        "Prefetching stopped in %(scene)s:\n%(error)s",
+                        {"scene": SceneClass.__name__, "error": traceback.format_exc()},
+                    )
+    if len(requests):
+        compile_requests(requests)
+    logger.info(
+        "Prefetched %(num)s tex expressions and texts in %(time).2fs",
+        {"num": len(requests), "time": time.perf_counter() - start},
+    )
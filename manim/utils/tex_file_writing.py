@@ -13,6 +13,7 @@ import unicodedata
 from pathlib import Path
 
 from .. import config, logger
+from . import prefetch
 
 
 def tex_hash(expression):
@@ -42,6 +43,11 @@ def tex_to_svg_file(expression, environment=None, tex_template=None):
     """
     if tex_template is None:
         tex_template = config["tex_template"]
+    svg_file = get_svg_file_path(expression, environment, tex_template)
+    if os.path.exists(svg_file):
+        return svg_file
+    if prefetch.is_recording():
+        return prefetch.record_tex(expression, environment, tex_template)
     tex_file = generate_tex_file(expression, environment, tex_template)
     dvi_file = compile_tex(
         tex_file, tex_template.tex_compiler, tex_template.output_format
@@ -49,6 +55,160 @@ def tex_to_svg_file(expression, environment=None, tex_template=None):
     return convert_to_svg(dvi_file, tex_template.output_format)
 
 
+def tex_to_svg_files(expressions, tex_template=None):
+    """Compile several tex expressions sharing a template at once.
+
+    The expressions that are not cached yet are typeset on the pages of a
+    single document, which is compiled by a single run of the TeX compiler
+    and converted by a single call to dvisvgm, instead of paying the start-up
+    cost of both programs for every expression.  The pages are written to
+    the SVG files :func:`tex_to_svg_file` looks for, so creating the
+    corresponding :class:`~.MathTex` or :class:`~.Tex` afterwards does not
+    compile anything.
+
+    Batching requires a template based on the ``standalone`` document class.
+    Otherwise, or if the batch fails to compile (e.g. because one of the
+    expressions contains an error), the expressions are compiled one by one.
+
+    Parameters
+    ----------
+    expressions : Iterable[Tuple[:class:`str`, Optional[:class:`str`]]]
+        Pairs of a tex expression and of the environment it is typeset in,
+        as passed to :func:`tex_to_svg_file`.
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    List[:class:`str`]
+        Paths to the generated SVG files, in the order of ``expressions``.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    expressions = list(expressions)
+    svg_files = [
+        get_svg_file_path(expression, environment, tex_template)
+        for expression, environment in expressions
+    ]
+    uncached = {}
+    for (expression, environment), svg_file in zip(expressions, svg_files):
+        if not os.path.exists(svg_file):
+            uncached.setdefault(svg_file, (expression, environment))
+
+    if len(uncached) > 1 and "{standalone}" in tex_template.documentclass:
+        if compile_tex_batch(list(uncached.values()), list(uncached), tex_template):
+            logger.info(f"Compiled {len(uncached)} tex expressions in a single run")
+        else:
+            logger.debug("Compiling the tex batch failed, compiling one by one")
+    for svg_file, (expression, environment) in uncached.items():
+        if not os.path.exists(svg_file):
+            tex_to_svg_file(expression, environment, tex_template)
+    return svg_files
+
+
+def compile_tex_batch(expressions, svg_files, tex_template):
+    """Typeset expressions on the pages of one ``standalone`` document, and
+    convert the pages to ``svg_files``.
+
+    Parameters
+    ----------
+    expressions : List[Tuple[:class:`str`, Optional[:class:`str`]]]
+        Pairs of a tex expression and of its environment.
+    svg_files : List[:class:`str`]
+        The SVG file to write each expression to.
+    tex_template : :class:`~.TexTemplate`
+        The template, based on the ``standalone`` document class.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether all the SVG files were written.
+    """
+    pages = []
+    for expression, environment in expressions:
+        if environment is not None:
+            begin, end = tex_template._texcode_for_environment(environment)
+            expression = f"{begin}\n{expression}\n{end}"
+        pages.append(f"\\begin{{manimpage}}\n{expression}\n\\end{{manimpage}}")
+    output = tex_template.get_texcode_for_expression("\n".join(pages))
+    # Every manimpage environment becomes a page of its own.
+    output = output.replace(
+        r"\begin{document}",
+        "\\newenvironment{manimpage}{}{}\n\\standaloneenv{manimpage}\n\\begin{document}",
+        1,
+    )
+
+    tex_dir = config.get_dir("tex_dir")
+    if not os.path.exists(tex_dir):
+        os.makedirs(tex_dir)
+    tex_file = Path(tex_dir, f"batch_{tex_hash(output)}.tex").as_posix()
+    with open(tex_file, "w", encoding="utf-8") as outfile:
+        outfile.write(output)
+
+    output_format = tex_template.output_format
+    command = tex_compilation_command(
+        tex_template.tex_compiler, output_format, tex_file, Path(tex_dir).as_posix()
+    )
+    if os.system(command) != 0:
+        return False
+    dvi_file = tex_file.replace(".tex", output_format)
+    page_prefix = tex_file.replace(".tex", "-")
+    commands = [
+        "dvisvgm",
+        "--pdf" if output_format == ".pdf" else "",
+        "-p 1-",
+        f'"{dvi_file}"',
+        "-n",
+        "-v 0",
+        "-o " + f'"{page_prefix}%p.svg"',
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(commands))
+    page_files = sorted(
+        Path(tex_dir).glob(f"{Path(page_prefix).name}*.svg"),
+        key=lambda path: int(path.stem.rsplit("-", 1)[1]),
+    )
+    if len(page_files) != len(svg_files):
+        for page_file in page_files:
+            os.remove(page_file)
+        return False
+    for page_file, svg_file in zip(page_files, svg_files):
+        os.replace(page_file, svg_file)
+    return True
+
+
+def get_texcode(expression, environment=None, tex_template=None):
+    """Returns the full tex code typesetting an expression with a template.
+
+    Parameters
+    ----------
+    expression : :class:`str`
+        String containing the TeX expression to be rendered, e.g. ``\\sqrt{2}`` or ``foo``
+    environment : Optional[:class:`str`], optional
+        The string containing the environment in which the expression should be typeset, e.g. ``align*``
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    :class:`str`
+        The tex code.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def get_svg_file_path(expression, environment=None, tex_template=None):
+    """Returns the path of the SVG file an expression is compiled to, see
+    :func:`tex_to_svg_file`."""
+    output = get_texcode(expression, environment, tex_template)
+    return Path(config.get_dir("tex_dir"), tex_hash(output) + ".svg").as_posix()
+
+
 def generate_tex_file(expression, environment=None, tex_template=None):
     """Takes a tex expression (and an optional tex environment),
     and returns a fully formed tex file ready for compilation.
@@ -69,10 +229,7 @@ def generate_tex_file(expression, environment=None, tex_template=None):
     """
     if tex_template is None:
         tex_template = config["tex_template"]
-    if environment is not None:
-        output = tex_template.get_texcode_for_expression_in_env(expression, environment)
-    else:
-        output = tex_template.get_texcode_for_expression(expression)
+    output = get_texcode(expression, environment, tex_template)
 
     tex_dir = config.get_dir("tex_dir")
     if not os.path.exists(tex_dir):
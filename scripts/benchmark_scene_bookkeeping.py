@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Script to measure the bookkeeping overhead of :meth:`.Scene.play` for
+growing scenes.
+
+For every size, this builds a scene made of groups of squares with that many
+mobjects in total, and reports the time spent per call in:
+
+- :meth:`.Scene.compile_animation_data`, which adds the mobjects of the
+  animations to the scene and splits the mobjects into moving and static
+  ones, before anything is rendered,
+- :meth:`.Scene.add`, adding a single mobject to the scene,
+- :meth:`.Scene.get_top_level_mobjects`.
+
+Nothing is rendered.  The time per call should grow linearly with the size of
+the scene.
+
+Usage::
+
+    $ python scripts/benchmark_scene_bookkeeping.py [SIZE]...
+
+Examples
+--------
+
+::
+
+    $ python scripts/benchmark_scene_bookkeeping.py 1000 5000 20000
+
+"""
+import sys
+import timeit
+
+from manim import Animation, Scene, Square, VGroup, tempconfig
+
+GROUP_SIZE = 10
+
+
+def benchmark(size, repeat=5):
+    scene = Scene()
+    groups = [
+        VGroup(*[Square() for _ in range(GROUP_SIZE - 1)])
+        for _ in range(max(1, size // GROUP_SIZE))
+    ]
+    scene.add(*groups)
+
+    def play():
+        scene.compile_animation_data(Animation(groups[-1]))
+
+    def add():
+        scene.add(Square())
+
+    timings = {}
+    for name, func in [
+        ("play", play),
+        ("add", add),
+        ("top level", scene.get_top_level_mobjects),
+    ]:
+        timings[name] = min(timeit.repeat(func, number=1, repeat=repeat))
+    return len(scene.get_mobject_family_members()), timings
+
+
+def main(sizes):
+    with tempconfig({"dry_run": True, "disable_caching": True}):
+        print(
+            f"{'mobjects':>10} {'play (ms)':>12} {'add (ms)':>12} {'top level (ms)':>16}"
+        )
+        for size in sizes:
+            num_mobjects, timings = benchmark(size)
+            print(
+                f"{num_mobjects:>10} {1000 * timings['play']:>12.2f} "
+                f"{1000 * timings['add']:>12.2f} {1000 * timings['top level']:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1000, 5000, 20000])
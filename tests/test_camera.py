@@ -0,0 +1,166 @@
+import numpy as np
+
+from manim import (
+    BLUE,
+    DEGREES,
+    DOWN,
+    GREEN,
+    LEFT,
+    PI,
+    RED,
+    RIGHT,
+    UP,
+    Camera,
+    Circle,
+    ImageMobject,
+    Line,
+    Sphere,
+    Square,
+    ThreeDCamera,
+    VGroup,
+    config,
+    get_3d_vmob_end_corner,
+    get_3d_vmob_end_corner_unit_normal,
+    get_3d_vmob_start_corner,
+    get_3d_vmob_start_corner_unit_normal,
+    get_shaded_rgb,
+    tempconfig,
+)
+
+
+def test_vectorized_batches():
+    camera = Camera()
+    squares = [Square(side_length=1).shift(2 * i * RIGHT) for i in range(-2, 3)]
+    overlapping = Square(side_length=1).shift(4 * RIGHT + 0.5 * UP)
+    blue = Circle(color=BLUE).shift(2 * DOWN)
+    gradient = Circle().set_color([RED, BLUE]).shift(2 * UP)
+    batches = camera.get_vectorized_batches([*squares, overlapping, blue, gradient])
+    assert [[vmob for vmob, _ in batch] for batch in batches] == [
+        squares,
+        [overlapping],
+        [blue],
+        [gradient],
+    ]
+
+
+def test_vectorized_batches_are_drawn_like_vmobjects():
+    with tempconfig({"pixel_height": 90, "pixel_width": 160}):
+        lines = VGroup(
+            *[Line(3 * LEFT, 3 * RIGHT).shift(0.5 * i * UP) for i in range(-4, 5)]
+        )
+        squares = VGroup(*[Square(0.8).shift(i * RIGHT) for i in range(-3, 4)])
+        squares.set_fill(RED, opacity=0.5)
+        vmobjects = [*lines, *squares]
+
+        batched = Camera()
+        batched.capture_mobjects(vmobjects)
+        unbatched = Camera()
+        ctx = unbatched.get_cairo_context(unbatched.pixel_array)
+        for vmobject in vmobjects:
+            unbatched.display_vectorized(vmobject, ctx)
+
+        np.testing.assert_allclose(
+            batched.pixel_array, unbatched.pixel_array, atol=1.01
+        )
+
+
+def test_layers_are_composited_like_vmobjects():
+    with tempconfig({"pixel_height": 90, "pixel_width": 160, "layer_cache_size": 8}):
+        pixel = config["frame_width"] / config["pixel_width"]
+        still = VGroup(*[Square(0.8).shift(i * RIGHT) for i in range(-3, 4)])
+        still.set_fill(RED, opacity=0.5)
+        moving = Circle(color=BLUE).shift(2 * DOWN)
+
+        camera = Camera()
+        for frame in range(4):
+            camera.reset()
+            camera.capture_mobjects([still, moving])
+            with tempconfig({"layer_cache_size": 0}):
+                direct = Camera()
+                direct.capture_mobjects([still, moving])
+            # Layers are blended once more than mobjects drawn directly, and
+            # every blend rounds to 8-bit premultiplied channels: translucent
+            # and antialiased pixels differ by up to 2 in each channel.
+            np.testing.assert_allclose(
+                camera.pixel_array, direct.pixel_array, atol=2.01
+            )
+            # Unchanged or translated mobjects are rasterized from the second
+            # frame, and reused afterwards.
+            assert len(camera.layers) == (2 if frame else 0)
+            moving.shift(2 * pixel * RIGHT)
+
+
+def test_animated_mobjects_are_not_rasterized_to_layers():
+    with tempconfig({"pixel_height": 90, "pixel_width": 160, "layer_cache_size": 8}):
+        pixel = config["frame_width"] / config["pixel_width"]
+        still = VGroup(*[Square(0.8).shift(i * RIGHT) for i in range(-3, 4)])
+        moving = Circle(color=BLUE).shift(2 * DOWN)
+        group = VGroup(Square(0.5), Square(0.5).shift(UP))
+
+        camera = Camera()
+        camera.set_animated_mobjects([moving, group[1]])
+        for _ in range(3):
+            camera.reset()
+            camera.capture_mobjects([still, moving, group])
+            moving.shift(2 * pixel * RIGHT)
+        assert list(camera.layer_keys) == [id(still)]
+        assert len(camera.layers) == 1
+
+        camera.set_animated_mobjects([])
+        for _ in range(2):
+            camera.reset()
+            camera.capture_mobjects([still, moving, group])
+            moving.shift(2 * pixel * RIGHT)
+        assert list(camera.layer_keys) == [id(still), id(moving), id(group)]
+
+
+def test_three_d_camera_sorts_and_shades_all_faces_at_once():
+    camera = ThreeDCamera(phi=70 * DEGREES, theta=30 * DEGREES)
+    camera.reset_rotation_matrix()
+    sphere = Sphere(resolution=(8, 12))
+    faces = camera.get_mobjects_to_display([sphere])
+    depths = [np.dot(face.get_center(), camera.rotation_matrix[2]) for face in faces]
+    assert len(faces) == 96
+    assert np.all(np.diff(depths) > -1e-12)
+
+    light = camera.light_source.points[0]
+    for face, (start, end) in zip(faces, camera.get_shading_factors(faces)):
+        rgb = face.get_fill_rgbas()[0, :3]
+        expected_start = get_shaded_rgb(
+            rgb,
+            get_3d_vmob_start_corner(face),
+            get_3d_vmob_start_corner_unit_normal(face),
+            light,
+        )
+        expected_end = get_shaded_rgb(
+            rgb,
+            get_3d_vmob_end_corner(face),
+            get_3d_vmob_end_corner_unit_normal(face),
+            light,
+        )
+        np.testing.assert_allclose(rgb + start, expected_start)
+        np.testing.assert_allclose(rgb + end, expected_end)
+
+
+def test_rotated_images_are_composited_with_affine_transforms():
+    with tempconfig({"pixel_height": 90, "pixel_width": 160}):
+        image = ImageMobject(np.full((20, 20, 3), 255, dtype=np.uint8))
+        image.height = 2
+        image.rotate(PI / 4)
+        camera = Camera()
+        camera.capture_mobjects([image])
+        lit = camera.pixel_array[:, :, 0] > 0
+        side = 2 * config["pixel_width"] / config["frame_width"]
+        assert abs(lit.sum() - side ** 2) < 2 * side
+        assert lit[45, 80] and not lit[45 + 14, 80 + 14]
+
+
+def test_image_mipmaps_are_cached():
+    image = ImageMobject(np.zeros((64, 32, 3), dtype=np.uint8))
+    assert image.get_mipmap(1).size == (32, 64)
+    assert image.get_mipmap(0.3).size == (16, 32)
+    mipmap = image.get_mipmap(0.2)
+    assert mipmap.size == (8, 16)
+    assert image.get_mipmap(0.15) is mipmap
+    image.set_color(GREEN)
+    assert image.get_mipmap(0.15) is not mipmap
@@ -1,6 +1,19 @@
 from pathlib import Path
 
-from manim import BraceLabel, Mobject, config
+import numpy as np
+import pytest
+
+from manim import (
+    RED,
+    RIGHT,
+    Animation,
+    BraceLabel,
+    Mobject,
+    Scene,
+    Square,
+    config,
+    tempconfig,
+)
 
 
 def test_mobject_copy():
@@ -16,6 +29,50 @@ def test_mobject_copy():
         assert orig.submobjects[i] is not copy.submobjects[i]
 
 
+def test_copy_shares_arrays_until_modified():
+    orig = Square()
+    points = np.array(orig.points)
+    copy = orig.copy()
+    assert copy.points is orig.points
+    assert copy.fill_rgbas is orig.fill_rgbas
+    with pytest.raises(ValueError):
+        copy.points[0] = 0
+
+    copy.shift(RIGHT).set_fill(RED, opacity=1)
+    np.testing.assert_array_equal(orig.points, points)
+    np.testing.assert_array_equal(copy.points, points + RIGHT)
+    assert orig.get_fill_opacity() == 0
+    assert copy.get_fill_opacity() == 1
+
+    orig.get_writable_array("points")[0] = RIGHT
+    np.testing.assert_array_equal(orig.points[0], RIGHT)
+    np.testing.assert_array_equal(copy.points[0], points[0] + RIGHT)
+
+
+def test_arrays_can_be_modified_in_place_by_updaters_and_after_play():
+    calls = []
+
+    def shift_in_place(mob):
+        mob.points[:, 0] += 1
+        calls.append(mob)
+
+    class InPlaceWrites(Scene):
+        def construct(self):
+            self.square = Square()
+            self.updated = self.square.copy().add_updater(shift_in_place)
+            self.add(self.square, self.updated)
+            self.play(Animation(self.square), run_time=0.1)
+
+    with tempconfig({"dry_run": True, "frame_rate": 10}):
+        scene = InPlaceWrites()
+        scene.render()
+    points = Square().points
+    assert calls
+    np.testing.assert_array_equal(scene.updated.points, points + len(calls) * RIGHT)
+    scene.square.points[:, 0] *= 2
+    np.testing.assert_array_equal(scene.square.points[:, 0], 2 * points[:, 0])
+
+
 def test_bracelabel_copy(tmp_path):
     """Test that a copy is a deepcopy."""
     # For this test to work, we need to tweak some folders temporarily
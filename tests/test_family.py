@@ -1,6 +1,9 @@
+import gc
+import weakref
+
 import numpy as np
 
-from manim import RIGHT, Circle, Mobject
+from manim import RIGHT, Circle, Mobject, Square, VGroup
 
 
 def test_family():
@@ -32,8 +35,8 @@ def test_family():
     assert mob in family
     for c in grandchildren:
         assert c in family
-        for gc in grandchildren[c]:
-            assert gc in family
+        for grandchild in grandchildren[c]:
+            assert grandchild in family
 
 
 def test_overlapping_family():
@@ -80,3 +83,41 @@ def test_shift_family():
 
     for m in family:
         assert np.allclose(positions_before[m] + RIGHT, positions_after[m])
+
+
+def test_family_cache_invalidation():
+    """Check that the cached families follow changes made to nested children."""
+    mob, child, gchild = Mobject(), Mobject(), Mobject()
+    mob.add(child)
+    assert mob.get_family() == [mob, child]
+
+    # Adding to a child updates the families of all its ancestors
+    child.add(gchild)
+    assert mob.get_family() == [mob, child, gchild]
+
+    # So do in-place modifications of the list of submobjects
+    other = Circle()
+    child.submobjects.append(other)
+    assert mob.get_family() == [mob, child, gchild, other]
+    assert mob.family_members_with_points() == [other]
+    child.submobjects.remove(gchild)
+    assert mob.get_family() == [mob, child, other]
+
+    # And clearing the points of a member
+    other.points = np.zeros((0, 3))
+    assert mob.family_members_with_points() == []
+
+    mob.remove(child)
+    assert mob.get_family() == [mob]
+    assert child.get_family() == [child, other]
+
+
+def test_groups_are_not_kept_alive_by_their_members():
+    square = Square()
+    groups = [weakref.ref(VGroup(square, Circle()).arrange(RIGHT)) for _ in range(10)]
+    gc.collect()
+    assert all(group() is None for group in groups)
+
+    group = VGroup(square)
+    square.add(Circle())
+    assert len(group.get_family()) == 3
@@ -4,7 +4,18 @@ from zlib import crc32
 import pytest
 
 import manim.utils.hashing as hashing
-from manim import Square
+from manim import (
+    ORIGIN,
+    RED,
+    RIGHT,
+    Camera,
+    ComplexValueTracker,
+    Dot,
+    Square,
+    ValueTracker,
+    VGroup,
+    always_redraw,
+)
 
 ALREADY_PROCESSED_PLACEHOLDER = hashing._Memoizer.ALREADY_PROCESSED_PLACEHOLDER
 
@@ -157,3 +168,53 @@ def test_hash_consistency():
     assert_two_objects_produce_same_hash(Square(), Square())
     s = Square()
     assert_two_objects_produce_same_hash(s, s.copy())
+
+
+def test_content_hash_follows_mutations():
+    s1, s2 = Square(), Square()
+    group = VGroup(s1, s2)
+    h = group.get_content_hash()
+    assert h == group.copy().get_content_hash()
+    assert h == VGroup(Square(), Square()).get_content_hash()
+
+    group.remove(s2)
+    assert group.get_content_hash() != h
+    group.add(s2)
+    assert group.get_content_hash() == h
+
+    for mutate in [
+        lambda: s2.shift(RIGHT),
+        lambda: s2.rotate(1),
+        lambda: s1.set_fill(RED, opacity=0.5),
+        lambda: s1.set_stroke(width=10),
+        lambda: s1.set_opacity(0.2),
+    ]:
+        mutate()
+        new_h = group.get_content_hash()
+        assert new_h != h
+        h = new_h
+
+
+def test_content_hash_structure():
+    a, b = Square(), Square()
+    assert VGroup(VGroup(a), b).get_content_hash() != VGroup(a, b).get_content_hash()
+
+
+def test_content_hash_in_place_mutation():
+    s = Square()
+    h = s.get_content_hash()
+    s.points[0] = ORIGIN
+    s.invalidate_content_hash()
+    assert s.get_content_hash() != h
+
+
+def test_play_call_hash_follows_value_trackers():
+    camera = Camera()
+    for tracker, value in [(ValueTracker(0), 1), (ComplexValueTracker(0), 1j)]:
+        tracker.get_content_hash()
+        copied = tracker.copy()
+        dot = always_redraw(lambda: Dot(RIGHT * abs(copied.get_value())))
+        h = hashing.get_hash_from_play_call(None, camera, [], [copied, dot])
+        copied.set_value(value)
+        assert hashing.get_hash_from_play_call(None, camera, [], [copied, dot]) != h
+        assert copied.get_content_hash() != tracker.get_content_hash()
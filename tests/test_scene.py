@@ -1,6 +1,17 @@
 import pytest
 
-from manim import Mobject, Scene, tempconfig
+from manim import (
+    DOWN,
+    LEFT,
+    RIGHT,
+    UP,
+    Animation,
+    Mobject,
+    Scene,
+    Square,
+    VGroup,
+    tempconfig,
+)
 
 
 def test_scene_add_remove():
@@ -33,3 +44,79 @@ def test_scene_add_remove():
 
         # Check that Scene.remove() returns the instance (for chained calls)
         assert scene.add(Mobject()) is scene
+
+
+def test_moving_and_static_mobjects():
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        below = Square().shift(0.5 * LEFT)
+        updated = Square().shift(3 * UP).add_updater(lambda mob: None)
+        animated = Square()
+        far = Square().shift(3 * DOWN)
+        above = Square().shift(0.5 * RIGHT)
+        scene.add(below, updated, animated, far, above)
+
+        moving, static = scene.get_moving_and_static_mobjects([Animation(animated)])
+        assert moving == [animated, above]
+        assert static == [below, updated, far]
+
+        scene.moving_mobjects, scene.static_mobjects = moving, static
+        scene.watch_static_mobjects()
+        assert list(scene.static_mobject_hashes) == [static.index(updated)]
+        assert not scene.update_moving_and_static_mobjects()
+        updated.shift(RIGHT)
+        animated.shift(2 * DOWN)
+        assert scene.update_moving_and_static_mobjects()
+        assert scene.moving_mobjects == [updated, animated, far, above]
+        assert scene.static_mobjects == [below]
+
+
+def test_static_bounding_boxes_are_computed_once(monkeypatch):
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        squares = [Square(0.1).shift(0.2 * i * RIGHT) for i in range(-10, 10)]
+        updated = Square(0.1).shift(2 * UP).add_updater(lambda mob: None)
+        animated = Square(0.1).shift(2 * DOWN)
+        scene.add(*squares, updated, animated)
+        (
+            scene.moving_mobjects,
+            scene.static_mobjects,
+        ) = scene.get_moving_and_static_mobjects([Animation(animated)])
+        scene.watch_static_mobjects()
+
+        boxed = []
+        get_boxes = scene.get_mobject_bounding_boxes
+
+        def get_mobject_bounding_boxes(mobjects):
+            boxed.extend(mobjects)
+            return get_boxes(mobjects)
+
+        monkeypatch.setattr(
+            scene, "get_mobject_bounding_boxes", get_mobject_bounding_boxes
+        )
+        for _ in range(3):
+            animated.shift(0.1 * UP)
+            assert not scene.update_moving_and_static_mobjects()
+        updated.shift(RIGHT)
+        assert scene.update_moving_and_static_mobjects()
+        assert scene.moving_mobjects == [updated, animated]
+        assert boxed == [animated] * 3 + [animated, updated]
+        assert not scene.static_mobject_hashes
+
+
+def test_scene_bookkeeping():
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        square, kept = Square(), Square()
+        group = VGroup(square, kept)
+        other = Square()
+        scene.add(group, square, other)
+        assert scene.mobjects == [group, square, other]
+        assert scene.get_top_level_mobjects() == [group, other]
+
+        animated = Square()
+        scene.add_mobjects_from_animations([Animation(square), Animation(animated)])
+        assert scene.mobjects == [group, square, other, animated]
+
+        scene.remove(square)
+        assert scene.mobjects == [kept, other, animated]
@@ -48,3 +48,11 @@ class SceneWithNonStaticWait(Scene):
         s.add_updater(lambda mob, dt: None)
         self.add(s)
         self.wait()
+
+
+class SceneWithZoomedDisplay(ZoomedScene):
+    def construct(self):
+        dot = Dot()
+        self.add(dot)
+        self.activate_zooming()
+        self.play(dot.animate.shift(LEFT))
@@ -4,6 +4,8 @@ import sys
 
 import pytest
 
+from manim.utils.caching import PartialMovieCache
+
 from ..utils.commands import capture
 from ..utils.video_tester import *
 
@@ -54,3 +56,42 @@ def test_play_skip(tmp_path, manim_cfg_file, simple_scenes_path):
     ]
     out, err, exit_code = capture(command)
     assert exit_code == 0, err
+
+
+def _write_partial_movie(directory, file_name, size):
+    (directory / file_name).write_bytes(b"0" * size)
+
+
+def test_partial_movie_cache_only_contains_indexed_files(tmp_path):
+    cache = PartialMovieCache(tmp_path)
+    _write_partial_movie(tmp_path, "a.mp4", 10)
+    assert not cache.contains("a.mp4")
+    cache.add("a.mp4", scene_name="Scene", module_name="module")
+    assert cache.contains("a.mp4")
+    assert cache.get_usage() == (1, 10)
+    os.remove(tmp_path / "a.mp4")
+    assert not cache.contains("a.mp4")
+    assert cache.get_usage() == (0, 0)
+
+
+def test_partial_movie_cache_indexes_existing_files(tmp_path):
+    _write_partial_movie(tmp_path, "a.mp4", 10)
+    _write_partial_movie(tmp_path, "partial_movie_file_list.txt", 10)
+    cache = PartialMovieCache(tmp_path)
+    assert cache.contains("a.mp4")
+    assert cache.get_usage() == (1, 10)
+
+
+def test_partial_movie_cache_eviction(tmp_path):
+    cache = PartialMovieCache(tmp_path)
+    for name in "abcd":
+        _write_partial_movie(tmp_path, f"{name}.mp4", 10)
+        cache.add(f"{name}.mp4")
+    cache.touch(["a.mp4"])
+
+    assert cache.evict(max_files=3) == ["b.mp4"]
+    assert cache.evict(max_size=15, keep=["c.mp4"]) == ["d.mp4", "a.mp4"]
+    assert cache.get_usage() == (1, 10)
+    assert sorted(os.listdir(tmp_path)) == ["c.mp4", PartialMovieCache.index_file_name]
+    assert cache.flush() == 1
+    assert not (tmp_path / "c.mp4").exists()
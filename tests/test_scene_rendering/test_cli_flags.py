@@ -52,6 +52,29 @@ def test_basic_scene_l_flag(tmp_path, manim_cfg_file, simple_scenes_path):
     assert exit_code == 0, err
 
 
+@pytest.mark.slow
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires the fork start method")
+@video_comparison(
+    "SquareToCircleWithlFlag.json", "videos/simple_scenes/480p15/SquareToCircle.mp4"
+)
+def test_frame_jobs_flag(tmp_path, manim_cfg_file, simple_scenes_path):
+    scene_name = "SquareToCircle"
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "--frame_jobs",
+        "3",
+        "--media_dir",
+        str(tmp_path),
+        simple_scenes_path,
+        scene_name,
+    ]
+    out, err, exit_code = capture(command)
+    assert exit_code == 0, err
+
+
 @pytest.mark.slow
 @video_comparison(
     "SceneWithMultipleCallsWithNFlag.json",
@@ -177,6 +200,31 @@ def test_a_flag(tmp_path, manim_cfg_file, infallible_scenes_path):
     ), "running manim with -a flag did not render the second scene"
 
 
+@pytest.mark.slow
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires the fork start method")
+def test_jobs_flag(tmp_path, manim_cfg_file, infallible_scenes_path):
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "--media_dir",
+        str(tmp_path),
+        "-a",
+        "-j",
+        "2",
+        infallible_scenes_path,
+    ]
+    out, err, exit_code = capture(command)
+    assert exit_code == 0, err
+
+    for scene_name in ["Wait1", "Wait2"]:
+        assert (
+            tmp_path / "videos" / "infallible_scenes" / "480p15" / f"{scene_name}.mp4"
+        ).is_file(), f"running manim with -j flag did not render {scene_name}"
+    assert "Rendered 2 scenes" in out
+
+
 @pytest.mark.slow
 def test_custom_folders(tmp_path, manim_cfg_file, simple_scenes_path):
     scene_name = "SquareToCircle"
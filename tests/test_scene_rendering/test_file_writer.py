@@ -0,0 +1,40 @@
+import io
+
+import numpy as np
+
+from manim.scene.scene_file_writer import FrameWriterThread, frames_are_equal
+
+
+def test_frame_writer_thread_writes_frames_in_order():
+    stream = io.BytesIO()
+    writer = FrameWriterThread(stream, queue_size=2)
+    writer.start()
+    frames = [np.full((4, 6, 4), i, dtype=np.uint8) for i in range(10)]
+    expected = b"".join(frame.tobytes() for frame in frames)
+    for frame in frames:
+        writer.write(frame)
+        # The frame is copied, so it can be reused right away.
+        frame[:] = 255
+    writer.close()
+    assert stream.getvalue() == expected
+    assert writer.frames_written == 10
+    assert writer.num_buffers <= 2
+
+
+def test_frame_writer_thread_repeats_frames():
+    stream = io.BytesIO()
+    writer = FrameWriterThread(stream)
+    writer.start()
+    frame = np.arange(24, dtype=np.uint8).reshape((2, 3, 4))
+    writer.write(frame, num_frames=3)
+    writer.close()
+    assert stream.getvalue() == 3 * frame.tobytes()
+
+
+def test_frames_are_equal():
+    frame = np.zeros((64, 8, 4), dtype=np.uint8)
+    other = frame.copy()
+    assert frames_are_equal(frame, other)
+    other[-1, -1, -1] = 1
+    assert not frames_are_equal(frame, other)
+    assert not frames_are_equal(frame, frame[:32])
@@ -13,6 +13,7 @@ from .simple_scenes import (
     SceneWithMultipleCalls,
     SceneWithNonStaticWait,
     SceneWithStaticWait,
+    SceneWithZoomedDisplay,
     SquareToCircle,
 )
 
@@ -88,3 +89,24 @@ def test_t_values_save_last_frame(using_temp_config):
     scene.update_to_time = Mock()
     scene.render()
     scene.update_to_time.assert_called_once_with(1)
+
+
+def test_zoomed_display_is_redrawn_during_animations(
+    using_temp_config, disabling_caching
+):
+    """Test that the zoomed display, a foreground mobject whose content hash does
+    not change, is drawn at every frame of an animation"""
+    scene = SceneWithZoomedDisplay()
+    frames = []
+    add_frame = scene.renderer.add_frame
+
+    def record_frame(frame, num_frames=1):
+        # The upper half of the zoomed display, which shows the dot at first.
+        height, width = frame.shape[:2]
+        frames.append(frame[: height // 4, 3 * width // 4 :].copy())
+        add_frame(frame, num_frames)
+
+    scene.renderer.add_frame = record_frame
+    scene.render()
+    assert len(frames) > 1
+    assert not np.array_equal(frames[0], frames[-1])
@@ -50,3 +50,42 @@ def test_stroke_overrides_color():
         get_svg_resource("heart.svg"), color="#334433", stroke_color=expected_color
     )
     assert svg.stroke_color == expected_color
+
+
+def test_parsed_svg_cache():
+    from manim.mobject.svg.svg_mobject import (
+        _parsed_svg_cache_info,
+        clear_parsed_svg_cache,
+    )
+
+    clear_parsed_svg_cache()
+    first = SVGMobject(get_svg_resource("heart.svg"))
+    second = SVGMobject(get_svg_resource("heart.svg"))
+    assert _parsed_svg_cache_info == {"hits": 1, "misses": 1}
+    for mob1, mob2 in zip(
+        first.family_members_with_points(), second.family_members_with_points()
+    ):
+        assert np.allclose(mob1.points, mob2.points)
+        assert mob1.points is not mob2.points
+
+    SVGMobject(get_svg_resource("heart.svg"), fill_opacity=0.5)
+    assert _parsed_svg_cache_info == {"hits": 1, "misses": 2}
+
+
+def test_path_string_to_cubic_bezier_curves():
+    from manim.mobject.svg.svg_path import path_string_to_cubic_bezier_curves
+
+    curves = path_string_to_cubic_bezier_curves(
+        "M 0 0 L 3 0 q 1.5 3 3 0 A 1 1 0 0 1 8 0 V 1.5z"
+    )
+    assert np.allclose(curves[0], [[0, 0], [1, 0], [2, 0], [3, 0]])
+    assert np.allclose(curves[1], [[3, 0], [4, 2], [5, 2], [6, 0]])
+    # The half circle is approximated by two curves.
+    assert np.allclose(curves[2:4, 0], [[6, 0], [7, -1]])
+    assert np.allclose(curves[3, 3], [8, 0])
+    assert np.allclose(curves[4:, 3], [[8, 1.5], [0, 0]])
+
+    svg_path = SVGPathMobject("M 0 0 L 3 0 q 1.5 3 3 0")
+    assert np.allclose(
+        svg_path.points[4:], [[3, 0, 0], [4, -2, 0], [5, -2, 0], [6, 0, 0]]
+    )
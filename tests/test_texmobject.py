@@ -3,6 +3,8 @@ from pathlib import Path
 import pytest
 
 from manim import MathTex, SingleStringMathTex, Tex, config
+from manim.utils import prefetch
+from manim.utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files
 
 
 def test_MathTex():
@@ -10,6 +12,27 @@ def test_MathTex():
     assert Path(config.media_dir, "Tex", "3879f6b03bc495cd.svg").exists()
 
 
+def test_tex_to_svg_files():
+    expressions = [("x^2 + 1", "align*"), ("y^2 + 1", "align*"), ("x^2 + 1", "align*")]
+    svg_files = tex_to_svg_files(expressions)
+    assert all(Path(svg_file).exists() for svg_file in svg_files)
+    assert svg_files[0] == svg_files[2] != svg_files[1]
+    assert svg_files[1] == tex_to_svg_file("y^2 + 1", environment="align*")
+
+
+def test_prefetch_records_tex_expressions():
+    with prefetch.recording() as requests:
+        MathTex(r"a_{\text{prefetch}}", r"+ b_{\text{prefetch}}")
+    ((_, expressions),) = requests.tex.values()
+    assert list(expressions) == [
+        (r"a_{\text{prefetch}} + b_{\text{prefetch}}", "align*"),
+        (r"a_{\text{prefetch}}", "align*"),
+        (r"+ b_{\text{prefetch}}", "align*"),
+    ]
+    assert not Path(requests.placeholder_file).exists()
+    assert not prefetch.is_recording()
+
+
 def test_SingleStringMathTex():
     SingleStringMathTex("test")
     assert Path(config.media_dir, "Tex", "79822967f1fa1935.svg").exists()
@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+
+from manim import (
+    Line3D,
+    ParametricFunction,
+    ParametricSurface,
+    Sphere,
+    ThreeDVMobject,
+    Torus,
+    VGroup,
+)
+
+
+def test_vectorized_surfaces_match_pointwise_sampling():
+    for cls in (Sphere, Torus):
+        vectorized = cls(resolution=(6, 8))
+        pointwise = cls(resolution=(6, 8), use_vectorized=False)
+        assert vectorized.use_vectorized
+        assert len(vectorized) == len(pointwise) == 48
+        for face1, face2 in zip(vectorized, pointwise):
+            np.testing.assert_allclose(face1.points, face2.points)
+            assert face1.get_fill_color() == face2.get_fill_color()
+
+
+def test_overridden_surface_functions_are_not_vectorized():
+    class BumpySphere(Sphere):
+        def func(self, u, v):
+            return (1 + 0.1 * math.sin(4 * u)) * super().func(u, v)
+
+    assert Line3D().use_vectorized
+    assert not BumpySphere(resolution=(6, 8)).use_vectorized
+    assert not ParametricSurface(lambda u, v: np.array([u, v, 0])).use_vectorized
+
+
+def test_surfaces_match_faces_mapped_one_by_one():
+    for surface in (Torus(resolution=(4, 6)), Sphere(resolution=(6, 8))):
+        faces = VGroup()
+        for face in surface:
+            u1, u2, v1, v2 = face.u1, face.u2, face.v1, face.v2
+            faces.add(
+                ThreeDVMobject().set_points_as_corners(
+                    [[u1, v1, 0], [u2, v1, 0], [u2, v2, 0], [u1, v2, 0], [u1, v1, 0]]
+                )
+            )
+        faces.pre_function_handle_to_anchor_scale_factor = (
+            surface.pre_function_handle_to_anchor_scale_factor
+        )
+        faces.apply_function(lambda p: surface.func(p[0], p[1]))
+        for face, expected in zip(surface, faces):
+            np.testing.assert_allclose(face.points, expected.points, atol=1e-8)
+
+
+def test_surface_faces_do_not_share_writable_points():
+    surface = ParametricSurface(
+        lambda u, v: np.array([u, v, u * v]),
+        resolution=(2, 2),
+        checkerboard_colors=False,
+    )
+    points = surface[1].get_points().copy()
+    surface[0].shift(np.array([0, 0, 1]))
+    np.testing.assert_array_equal(surface[1].get_points(), points)
+
+
+def test_vectorized_parametric_function():
+    def func(t):
+        return np.array([t, t ** 2, 0 * t])
+
+    vectorized = ParametricFunction(func, t_range=[-1, 1], use_vectorized=True)
+    pointwise = ParametricFunction(func, t_range=[-1, 1])
+    np.testing.assert_allclose(vectorized.points, pointwise.points)
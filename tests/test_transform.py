@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from manim import PI, RED, UP, Circle, Square, Transform, Triangle, VGroup
+
+
+class UnpackedTransform(Transform):
+    def interpolate_submobject(self, *args):
+        return super().interpolate_submobject(*args)
+
+
+@pytest.mark.parametrize(
+    "lag_ratio, path_arc", [(0, 0), (0.3, 0), (0, PI / 2), (0.3, PI)]
+)
+def test_packed_transform_matches_unpacked(lag_ratio, path_arc):
+    """Check that transforming all the members at once changes nothing."""
+    transforms = []
+    for cls in (Transform, UnpackedTransform):
+        source = VGroup(Square(), Circle(), Triangle()).arrange()
+        target = VGroup(Circle(color=RED), Square(fill_opacity=0.5).set_stroke(width=8))
+        transform = cls(
+            source, target.shift(UP), lag_ratio=lag_ratio, path_arc=path_arc
+        )
+        transform.begin()
+        transforms.append(transform)
+    packed, unpacked = transforms
+    assert packed.get_packed_interpolation() is not None
+    assert unpacked.get_packed_interpolation() is None
+
+    for alpha in (0.25, 0.5, 1):
+        for transform in transforms:
+            transform.interpolate(alpha)
+        members = [t.mobject.family_members_with_points() for t in transforms]
+        assert len(members[0]) == len(members[1])
+        for mob, expected in zip(*members):
+            np.testing.assert_allclose(mob.points, expected.points)
+            np.testing.assert_allclose(mob.fill_rgbas, expected.fill_rgbas)
+            np.testing.assert_allclose(mob.stroke_rgbas, expected.stroke_rgbas)
+            assert mob.stroke_width == pytest.approx(expected.stroke_width)
@@ -0,0 +1,34 @@
+from manim import Mobject
+
+
+def test_updaters_follow_changes_of_the_family():
+    calls = []
+    parent, child, grandchild = Mobject(), Mobject(), Mobject()
+    parent.add(child)
+    parent.update(1)
+    assert not parent.has_time_based_updater()
+
+    grandchild.add_updater(lambda mob, dt: calls.append((mob, dt)))
+    child.add(grandchild)
+    parent.update(0.5)
+    assert calls == [(grandchild, 0.5)]
+
+    child.updaters.append(lambda mob: calls.append(mob))
+    parent.update(0.25)
+    assert calls[1:] == [child, (grandchild, 0.25)]
+    assert not child.has_time_based_updater()
+    assert grandchild.has_time_based_updater()
+
+    child.suspend_updating(recursive=False)
+    parent.update(1)
+    assert len(calls) == 3
+
+    child.remove(grandchild)
+    child.updating_suspended = False
+    child.updaters.clear()
+    parent.update(1)
+    assert len(calls) == 3
+
+    copied = grandchild.copy()
+    copied.update(2)
+    assert calls[-1] == (copied, 2)
@@ -1,7 +1,18 @@
 import numpy as np
 import pytest
 
-from manim import Circle, Line, Mobject, Square, VDict, VGroup, VMobject
+from manim import (
+    RIGHT,
+    Circle,
+    Line,
+    Mobject,
+    Square,
+    Triangle,
+    VDict,
+    VGroup,
+    VMobject,
+)
+from manim.utils.bezier import partial_bezier_points
 
 
 def test_vmobject_point_from_propotion():
@@ -204,3 +215,61 @@ def test_vgroup_item_assignment_only_allows_vmobjects():
     vgroup = VGroup(VMobject())
     with pytest.raises(TypeError, match="All submobjects must be of type VMobject"):
         vgroup[0] = "invalid object"
+
+
+def test_insert_n_curves_splits_curves_evenly():
+    """Test that inserting curves splits the curves without changing the path"""
+    circle = Circle()
+    quads = circle.get_cubic_bezier_tuples()
+    assert len(quads) == 8
+    circle.insert_n_curves(4)
+    assert circle.get_num_curves() == 12
+    # Every other curve is split in two
+    new_quads = iter(circle.get_cubic_bezier_tuples())
+    for i, quad in enumerate(quads):
+        pieces = [(0, 0.5), (0.5, 1)] if i % 2 == 0 else [(0, 1)]
+        for a, b in pieces:
+            expected = partial_bezier_points(quad, a, b)
+            np.testing.assert_allclose(next(new_quads), expected, atol=1e-12)
+
+
+def subdivide_curves(points, n):
+    """Add n curves to a subpath one curve at a time, as VMobject did."""
+    quads = points.reshape((-1, 4, 3))
+    target_num = len(quads) + n
+    repeat_indices = (np.arange(target_num) * len(quads)) // target_num
+    new_points = []
+    for i, quad in enumerate(quads):
+        alphas = np.linspace(0, 1, np.sum(repeat_indices == i) + 1)
+        for a1, a2 in zip(alphas, alphas[1:]):
+            new_points.append(partial_bezier_points(quad, a1, a2))
+    return np.concatenate(new_points)
+
+
+def test_align_points_of_subpaths():
+    """Test that paths are aligned subpath by subpath"""
+    square = Square().rotate(0.3)
+    triangle = Triangle().shift(3 * RIGHT)
+    path = VMobject().set_points(np.concatenate([square.points, triangle.points]))
+    circle = Circle()
+    circle_points = circle.points.copy()
+    assert circle.get_num_points() == 32 and path.get_num_points() == 16 + 12
+    circle.align_points(path)
+    # The square gets as many curves as the circle, which ends with a null
+    # path split as many times as the triangle has curves
+    np.testing.assert_allclose(
+        path.points,
+        np.concatenate([subdivide_curves(square.points, 4), triangle.points]),
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        circle.points,
+        np.concatenate(
+            [circle_points, subdivide_curves(np.array([circle_points[-1]] * 4), 2)]
+        ),
+        atol=1e-12,
+    )
+
+    square = Square()
+    square.align_points(Circle())
+    assert square.get_num_points() == 32